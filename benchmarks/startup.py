@@ -0,0 +1,57 @@
+"""
+Startup-time benchmark for the meraki-usecase CLI.
+
+Times fresh interpreter launches (median of N runs) for:
+  - importing meraki_usecase.cli
+  - `--help` (argument parsing only)
+  - importing the code each backend needs for a command (rest / sdk)
+
+No API calls are made, so it runs anywhere. Example:
+
+    python benchmarks/startup.py --runs 15
+    python benchmarks/startup.py --max-ms 150    # exit 1 if `import cli` gets slower than that
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+CASES: List[Tuple[str, List[str]]] = [
+    ("python (baseline)", ["-c", "pass"]),
+    ("import cli", ["-c", "import meraki_usecase.cli"]),
+    ("cli --help", ["-m", "meraki_usecase.cli", "--help"]),
+    ("rest orgs imports", ["-c", "import meraki_usecase.cli, meraki_usecase.restconf.meraki_rest, meraki_usecase.restconf.orgs"]),
+    ("sdk orgs imports", ["-c", "import meraki_usecase.cli, meraki_usecase.sdk.meraki_sdk, meraki_usecase.sdk.orgs"]),
+]
+
+
+def _time_once(argv: List[str]) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, *argv], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--max-ms", type=float, help="Fail if `import cli` median exceeds this many ms")
+    args = ap.parse_args()
+
+    results = {}
+    print(f"{'case':<22} {'median ms':>10} {'min ms':>10}")
+    for name, argv in CASES:
+        _time_once(argv)  # warm the filesystem / bytecode cache
+        samples = [_time_once(argv) for _ in range(args.runs)]
+        results[name] = statistics.median(samples)
+        print(f"{name:<22} {results[name]:>10.1f} {min(samples):>10.1f}")
+
+    if args.max_ms is not None and results["import cli"] > args.max_ms:
+        raise SystemExit(f"import cli: {results['import cli']:.1f} ms > budget {args.max_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from meraki_usecase.aio.meraki_async import AsyncMerakiClient
+
+# Coroutine versions of the restconf/ functions (same paths, params and page sizes).
+# List endpoints return lists: every page is fetched before the call completes.
+
+
+async def get_organizations(client: AsyncMerakiClient, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await client.get_items("/organizations", per_page=9000, limit=limit)
+
+
+async def get_networks(client: AsyncMerakiClient, org_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await client.get_items(f"/organizations/{org_id}/networks", per_page=100000, limit=limit)
+
+
+async def get_inventory_devices(client: AsyncMerakiClient, org_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await client.get_items(f"/organizations/{org_id}/inventoryDevices", per_page=1000, limit=limit)
+
+
+async def get_device_statuses(
+    client: AsyncMerakiClient,
+    org_id: str,
+    *,
+    network_ids: Optional[List[str]] = None,
+    product_types: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {}
+    if network_ids:
+        params["networkIds[]"] = network_ids
+    if product_types:
+        params["productTypes[]"] = product_types
+    return await client.get_items(f"/organizations/{org_id}/devices/statuses", params, per_page=1000, limit=limit)
+
+
+async def get_switch_health(client: AsyncMerakiClient, org_id: str, network_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await get_device_statuses(client, org_id, network_ids=[network_id], product_types=["switch"], limit=limit)
+
+
+async def get_ap_health(client: AsyncMerakiClient, org_id: str, network_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await get_device_statuses(client, org_id, network_ids=[network_id], product_types=["wireless"], limit=limit)
+
+
+async def get_device(client: AsyncMerakiClient, serial: str) -> Dict[str, Any]:
+    return await client.get(f"/devices/{serial}")
+
+
+async def get_switch_ports_statuses(
+    client: AsyncMerakiClient,
+    serial: str,
+    *,
+    t0: Optional[str] = None,
+    t1: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {}
+    if t0:
+        params["t0"] = t0
+    if t1:
+        params["t1"] = t1
+    return await client.get(f"/devices/{serial}/switch/ports/statuses", params=params)
+
+
+async def get_org_switch_ports_by_switch(
+    client: AsyncMerakiClient,
+    org_id: str,
+    *,
+    network_ids: Optional[List[str]] = None,
+    serials: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {"perPage": 20}
+    if network_ids:
+        params["networkIds[]"] = network_ids
+    if serials:
+        params["serials[]"] = serials
+    out: List[Dict[str, Any]] = []
+    async for page in client.iter_pages(f"/organizations/{org_id}/switch/ports/statuses/bySwitch", params):
+        out.extend((page.get("items") or []) if isinstance(page, dict) else page)
+    return out
+
+
+async def get_wifi_signal_quality_by_client(
+    client: AsyncMerakiClient,
+    org_id: str,
+    *,
+    timespan: int = 86400,
+    network_id: Optional[str] = None,
+    serials: Optional[List[str]] = None,
+    per_page: int = 1000,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {"timespan": timespan}
+    if network_id:
+        params["networkIds[]"] = [network_id]
+    if serials:
+        params["serials[]"] = serials
+    return await client.get_items(
+        f"/organizations/{org_id}/wireless/devices/signalQuality/byClient", params, per_page=per_page, limit=limit,
+    )
+
+
+async def get_network_clients(
+    client: AsyncMerakiClient,
+    network_id: str,
+    *,
+    timespan: int = 86400,
+    per_page: int = 1000,
+    max_pages: Optional[int] = None,
+    connection_types: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {"timespan": timespan}
+    if connection_types:
+        params["recentDeviceConnections[]"] = connection_types
+    return await client.get_items(
+        f"/networks/{network_id}/clients", params, per_page=per_page, max_pages=max_pages, limit=limit,
+    )
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
+
+import httpx
+
+from meraki_usecase.cache import ResponseCache, build_cache
+from meraki_usecase.decode import check_decoder, loads
+from meraki_usecase.fanout import FanOutResult
+from meraki_usecase.metrics import REGISTRY, RequestEvent, endpoint_template
+from meraki_usecase.paging import per_page_for
+from meraki_usecase.rate_limit import DEFAULT_RATE, get_limiter, limiter_key, retry_after_seconds
+
+if TYPE_CHECKING:
+    from meraki_usecase.config import Settings
+
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class LoopThread:
+    """
+    One asyncio event loop on a daemon thread. Blocking code hands it coroutines
+    with run(); fan_out() runs many calls concurrently on it, all from this one thread.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="meraki-aio", daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def sync(self, fn: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+        """Blocking version of a coroutine function."""
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self.run(fn(*args, **kwargs))
+        call.__name__ = getattr(fn, "__name__", "call")
+        return call
+
+    def fan_out(self, fn: Callable[[Any], Any], items: Iterable[Any], *, workers: int = 100) -> Iterator[FanOutResult]:
+        """
+        Same contract as fanout.iter_fan_out(), but fn(item) returns a coroutine (one
+        backend call) and up to `workers` of them run at once on the loop thread.
+        Results come back in input order; stopping early cancels what is still pending.
+        """
+        items = list(items)
+        if not items:
+            return
+
+        async def start() -> List["asyncio.Task[Any]"]:
+            sem = asyncio.Semaphore(max(1, workers))
+
+            async def one(item: Any) -> Any:
+                async with sem:
+                    v = fn(item)
+                    return await v if inspect.isawaitable(v) else v
+
+            return [asyncio.ensure_future(one(item)) for item in items]
+
+        async def result_of(task: "asyncio.Task[Any]") -> Any:
+            return await task
+
+        tasks = self.run(start())
+        try:
+            for item, task in zip(items, tasks):
+                try:
+                    yield FanOutResult(item, self.run(result_of(task)))
+                except Exception as e:
+                    yield FanOutResult(item, error=e)
+        finally:
+            for task in tasks:
+                self.loop.call_soon_threadsafe(task.cancel)
+
+
+@dataclass
+class AsyncMerakiClient:
+    """
+    httpx.AsyncClient with the same behaviour as MerakiRestClient: shared per-org rate
+    limiter (awaited, not slept), 429 Retry-After handling, 5xx/connection retries with
+    backoff, request metrics, and Link-header pagination as async iterators.
+    """
+    base_url: str
+    api_key: str
+    timeout_s: int = 30
+    max_retries: int = 5
+    org_id: Optional[str] = None
+    rate_limit: float = DEFAULT_RATE
+    cache: Optional[ResponseCache] = None
+    decoder: str = "auto"
+    max_connections: int = 100
+    _client: Optional[httpx.AsyncClient] = field(default=None, repr=False)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created lazily so it binds to the loop that first uses it.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "X-Cisco-Meraki-API-Key": self.api_key,
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+                timeout=self.timeout_s,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            )
+        return self._client
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
+
+    async def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        limiter = get_limiter(limiter_key(url, self.org_id), rate=self.rate_limit)
+        endpoint = endpoint_template(url)
+
+        for attempt in range(max(self.max_retries, 0) + 1):
+            wait = limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            t = time.perf_counter()
+            last = attempt == self.max_retries
+            try:
+                resp = await self.client.get(url, params=params, headers=headers)
+            except httpx.TransportError:
+                REGISTRY.record(RequestEvent(endpoint, "GET", 0, time.perf_counter() - t, retry=attempt > 0))
+                if last:
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt)
+                continue
+
+            wait = retry_after_seconds(resp.headers, default=0.5 * 2 ** attempt) if resp.status_code == 429 else 0.0
+            REGISTRY.record(RequestEvent(
+                endpoint, "GET", resp.status_code, time.perf_counter() - t, len(resp.content),
+                retry=attempt > 0, retry_after_s=wait,
+            ))
+            if last:
+                return resp
+            if resp.status_code == 429:
+                limiter.penalize(wait)
+            elif resp.status_code in _RETRY_STATUSES:
+                await asyncio.sleep(0.5 * 2 ** attempt)
+            else:
+                return resp
+        raise RuntimeError("retry loop ended without a response")
+
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        The response, or the CacheEntry standing in for it. Cached endpoints are served
+        from disk while fresh and revalidated in-line after that (no background refresh).
+        """
+        ttl = self.cache.ttl_for(url) if self.cache is not None else 0
+        if ttl <= 0:
+            resp = await self._send(url, params=params)
+            resp.raise_for_status()
+            return resp
+
+        key = self.cache.key("GET", url, params)
+        entry = self.cache.load(key)
+        if entry is not None and entry.age < ttl:
+            return entry
+        resp = await self._send(url, params=params, headers=entry.validators() if entry else None)
+        if resp.status_code == 304 and entry is not None:
+            self.cache.store(key, entry.headers, entry.body)
+            return entry
+        resp.raise_for_status()
+        self.cache.store(key, resp.headers, resp.content)
+        return resp
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        r = await self._fetch(self._url(path), params=params)
+        return loads(r.content if isinstance(r, httpx.Response) else r.body, self.decoder)
+
+    async def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        url: Optional[str] = self._url(path)
+        page_params = params
+        pages = 0
+
+        while url:
+            r = await self._fetch(url, params=page_params)
+            if isinstance(r, httpx.Response):
+                body, url = r.content, r.links.get("next", {}).get("url")
+            else:   # cache entry
+                body, url = r.body, httpx.Response(200, headers=r.headers).links.get("next", {}).get("url")
+            yield loads(body, self.decoder)
+
+            pages += 1
+            if max_pages is not None and pages >= max_pages:
+                return
+            page_params = None
+
+    async def iter_items(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        per_page: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        if limit is not None and limit <= 0:
+            return
+
+        params = dict(params or {})
+        if per_page:
+            params["perPage"] = per_page_for(limit, per_page)
+
+        n = 0
+        async for page in self.iter_pages(path, params, max_pages=max_pages):
+            if not isinstance(page, list):
+                break
+            for item in page:
+                yield item
+                n += 1
+                if limit is not None and n >= limit:
+                    return
+
+    async def get_items(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> List[Any]:
+        return [item async for item in self.iter_items(path, params, **kwargs)]
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def build_async_client(settings: "Settings") -> AsyncMerakiClient:
+    return AsyncMerakiClient(
+        base_url=settings.base_url,
+        api_key=settings.api_key,
+        timeout_s=settings.timeout_s,
+        max_retries=settings.max_retries,
+        org_id=settings.org_id,
+        rate_limit=settings.rate_limit,
+        cache=build_cache(settings),
+        decoder=check_decoder(settings.json_decoder),
+        max_connections=settings.async_concurrency,
+    )
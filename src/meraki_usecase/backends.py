@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional
+
+from meraki_usecase.config import Settings
+from meraki_usecase.fanout import iter_fan_out
+
+
+@dataclass
+class Backend:
+    """
+    The fetch functions one --mode provides, with the REST client / SDK dashboard
+    already bound, so commands are written once for every mode.
+    List-style functions return iterables (generators in rest mode, lists in sdk/async mode).
+    """
+    name: str                                     # "rest" / "sdk" / "async"
+    label: str                                    # shown in table titles
+    handle: Any                                   # MerakiRestClient, meraki.DashboardAPI or AsyncMerakiClient
+    organizations: Callable[..., Any]             # (*, limit)
+    networks: Callable[..., Any]                  # (org_id, *, limit)
+    inventory: Callable[..., Any]                 # (org_id, *, limit)
+    device_statuses: Callable[..., Any]           # (org_id, *, network_ids, product_types, limit)
+    switch_health: Callable[..., Any]             # (org_id, network_id, *, limit)
+    ap_health: Callable[..., Any]                 # (org_id, network_id, *, limit)
+    device: Callable[..., Any]                    # (serial)
+    switch_ports: Callable[..., Any]              # (serial, *, t0, t1)
+    switch_ports_by_switch: Callable[..., Any]    # (org_id, *, network_ids, serials) -> switches with "ports"
+    wifi_signal: Callable[..., Any]               # (org_id, *, timespan, network_id, serials, limit)
+    network_clients: Callable[..., Any]           # (network_id, *, timespan, connection_types, limit)
+    # Many calls at once: fan_out(fn, items, *, workers) -> FanOutResults in input order, where
+    # fn(item) makes one call on `fan_out_api`. Threads in rest/sdk mode, one event loop in async mode.
+    fan_out: Callable[..., Any] = iter_fan_out
+    aio: Optional[Any] = None                     # async mode: the functions above as coroutine functions
+    workers: int = 8                              # default fan-out width (--workers)
+
+    @property
+    def fan_out_api(self) -> Any:
+        """What a fan_out fn should call: these functions, or their coroutine versions in async mode."""
+        return self.aio or self
+
+
+def _rest_backend(settings: Settings) -> Backend:
+    from meraki_usecase.restconf import health, health_ap, inventory, network_clients, networks, orgs, switch_ports, wifi_signal
+    from meraki_usecase.restconf.meraki_rest import build_client
+
+    client = build_client(settings)
+    return Backend(
+        name="rest",
+        label="REST",
+        handle=client,
+        organizations=partial(orgs.iter_organizations, client),
+        networks=partial(networks.iter_networks, client),
+        inventory=partial(inventory.iter_inventory_devices, client),
+        device_statuses=partial(health.iter_device_statuses, client),
+        switch_health=partial(health.iter_switch_health, client),
+        ap_health=partial(health_ap.iter_ap_health, client),
+        device=partial(switch_ports.get_device, client),
+        switch_ports=partial(switch_ports.get_switch_ports_statuses, client),
+        switch_ports_by_switch=partial(switch_ports.iter_org_switch_ports_by_switch, client),
+        wifi_signal=partial(wifi_signal.iter_wifi_signal_quality_by_client, client),
+        network_clients=partial(network_clients.iter_network_clients, client),
+        workers=settings.max_workers,
+    )
+
+
+def _sdk_backend(settings: Settings) -> Backend:
+    from meraki_usecase.sdk import health, health_ap, inventory, network_clients, networks, orgs, switch_ports, wifi_signal
+    from meraki_usecase.sdk.meraki_sdk import build_dashboard
+
+    dashboard = build_dashboard(settings)
+    return Backend(
+        name="sdk",
+        label="SDK",
+        handle=dashboard,
+        organizations=partial(orgs.get_organizations, dashboard),
+        networks=partial(networks.get_networks, dashboard),
+        inventory=partial(inventory.get_inventory_devices, dashboard),
+        device_statuses=partial(health.get_device_statuses, dashboard),
+        switch_health=partial(health.get_switch_health, dashboard),
+        ap_health=partial(health_ap.get_ap_health, dashboard),
+        device=partial(switch_ports.get_device, dashboard),
+        switch_ports=partial(switch_ports.get_switch_ports_statuses, dashboard),
+        switch_ports_by_switch=partial(switch_ports.get_org_switch_ports_by_switch, dashboard),
+        wifi_signal=partial(wifi_signal.get_wifi_signal_quality_by_client, dashboard),
+        network_clients=partial(network_clients.get_network_clients, dashboard),
+        workers=settings.max_workers,
+    )
+
+
+def _async_backend(settings: Settings) -> Backend:
+    import atexit
+    from types import SimpleNamespace
+
+    from meraki_usecase.aio import endpoints
+    from meraki_usecase.aio.meraki_async import LoopThread, build_async_client
+
+    client = build_async_client(settings)
+    loop = LoopThread()
+    # The loop thread is a daemon: close the connection pool on it before the interpreter exits.
+    atexit.register(lambda: loop.run(client.aclose()))
+    aio = SimpleNamespace(
+        organizations=partial(endpoints.get_organizations, client),
+        networks=partial(endpoints.get_networks, client),
+        inventory=partial(endpoints.get_inventory_devices, client),
+        device_statuses=partial(endpoints.get_device_statuses, client),
+        switch_health=partial(endpoints.get_switch_health, client),
+        ap_health=partial(endpoints.get_ap_health, client),
+        device=partial(endpoints.get_device, client),
+        switch_ports=partial(endpoints.get_switch_ports_statuses, client),
+        switch_ports_by_switch=partial(endpoints.get_org_switch_ports_by_switch, client),
+        wifi_signal=partial(endpoints.get_wifi_signal_quality_by_client, client),
+        network_clients=partial(endpoints.get_network_clients, client),
+    )
+    return Backend(
+        name="async",
+        label="ASYNC",
+        handle=client,
+        **{name: loop.sync(fn) for name, fn in vars(aio).items()},
+        fan_out=loop.fan_out,
+        aio=aio,
+        workers=settings.async_concurrency,
+    )
+
+
+_LOADERS = {
+    "rest": _rest_backend,
+    "sdk": _sdk_backend,
+    "async": _async_backend,
+}
+
+MODES = list(_LOADERS)
+
+
+def load_backend(mode: str, settings: Settings) -> Backend:
+    # Imports happen here, so only the chosen backend (requests or the meraki SDK) is loaded.
+    try:
+        loader = _LOADERS[mode]
+    except KeyError:
+        raise ValueError(f"Unknown mode: {mode!r} (expected one of {', '.join(MODES)})") from None
+    return loader(settings)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional
+
+from meraki_usecase.config import Settings
+from meraki_usecase.metrics import endpoint_template
+
+SCENARIOS = ["orgs", "inventory", "health", "switch-ports", "network-clients"]
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Linear-interpolated percentile (q in 0..100); None for no values."""
+    if not values:
+        return None
+    xs = sorted(values)
+    pos = (len(xs) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (pos - lo)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:   # Windows
+        return None
+    import sys
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024   # bytes on macOS, KB elsewhere
+
+
+def _instrument(backend: Any, record: Callable[[str, int, float, int], None]) -> None:
+    """
+    Time every HTTP request at the transport, below the rate limiter, so every mode
+    reports the same thing: server + network time per request (retries included).
+    """
+    if backend.name == "async":
+        client = backend.handle.client
+        asend = client.request
+
+        async def atimed(method: str, url: Any, *args: Any, **kwargs: Any) -> Any:
+            t = time.perf_counter()
+            resp = await asend(method, url, *args, **kwargs)
+            record(str(url), resp.status_code, time.perf_counter() - t, len(resp.content))
+            return resp
+
+        client.request = atimed
+        return
+    if backend.name == "rest":
+        owner = backend.handle.session
+    else:
+        session = backend.handle._session
+        # httpx client in current SDKs, requests session in older ones
+        owner = getattr(session, "_client", None) or session._req_session
+    send = owner.request
+
+    def timed(method: str, url: Any, *args: Any, **kwargs: Any) -> Any:
+        t = time.perf_counter()
+        resp = send(method, url, *args, **kwargs)
+        record(str(url), resp.status_code, time.perf_counter() - t, len(resp.content))
+        return resp
+
+    owner.request = timed
+
+
+def _run_scenario(name: str, backend: Any, settings: Settings, workers: int) -> int:
+    """Run one scenario to completion; returns how many items it produced."""
+    if name == "orgs":
+        return sum(1 for _ in backend.organizations())
+    if name == "inventory":
+        return sum(1 for _ in backend.inventory(settings.org_id))
+    if name == "health":
+        return (
+            sum(1 for _ in backend.switch_health(settings.org_id, settings.network_id))
+            + sum(1 for _ in backend.ap_health(settings.org_id, settings.network_id))
+        )
+    if name == "switch-ports":
+        switches = [s for s in backend.switch_health(settings.org_id, settings.network_id) if s.get("serial")]
+        fetch_ports = backend.fan_out_api.switch_ports
+        n = 0
+        for r in backend.fan_out(lambda sw: fetch_ports(sw["serial"]), switches, workers=workers):
+            if not r.ok:
+                raise r.error
+            n += len(r.value or [])
+        return n
+    if name == "network-clients":
+        return sum(1 for _ in backend.network_clients(settings.network_id, timespan=86400))
+    raise ValueError(f"Unknown scenario: {name!r} (expected one of {', '.join(SCENARIOS)})")
+
+
+def bench_mode(mode: str, settings: Settings, scenarios: List[str], runs: int, workers: int) -> Dict[str, Any]:
+    """
+    Benchmark one backend. Meant to run in a fresh process (see run_bench) so the
+    peak RSS belongs to this backend alone.
+    """
+    from meraki_usecase.backends import load_backend
+
+    t_load = time.perf_counter()
+    backend = load_backend(mode, settings)
+    load_s = time.perf_counter() - t_load
+
+    requests: List[Dict[str, Any]] = []
+
+    def record(url: str, status: int, seconds: float, nbytes: int) -> None:
+        requests.append({"endpoint": endpoint_template(url), "status": status, "s": seconds, "bytes": nbytes})
+
+    _instrument(backend, record)
+
+    out: Dict[str, Any] = {"load_s": load_s, "scenarios": {}, "endpoints": {}}
+    all_requests: List[Dict[str, Any]] = []
+    for name in scenarios:
+        walls: List[float] = []
+        items = 0
+        errors: List[str] = []
+        requests.clear()
+        for _ in range(runs):
+            t = time.perf_counter()
+            try:
+                items += _run_scenario(name, backend, settings, workers)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                continue
+            walls.append(time.perf_counter() - t)
+
+        total_s = sum(walls)
+        pages = sum(1 for r in requests if r["status"] == 200)
+        out["scenarios"][name] = {
+            "runs": len(walls),
+            "errors": errors[:3],
+            "p50_ms": _ms(percentile(walls, 50)),
+            "p95_ms": _ms(percentile(walls, 95)),
+            "p99_ms": _ms(percentile(walls, 99)),
+            "requests": len(requests),
+            "pages_per_s": pages / total_s if total_s else None,
+            "items_per_s": items / total_s if total_s else None,
+            "bytes": sum(r["bytes"] for r in requests),
+            "throttled": sum(1 for r in requests if r["status"] == 429),
+        }
+        all_requests.extend(requests)
+
+    by_endpoint: Dict[str, List[Dict[str, Any]]] = {}
+    for r in all_requests:
+        by_endpoint.setdefault(r["endpoint"], []).append(r)
+    for endpoint, rs in sorted(by_endpoint.items()):
+        lat = [r["s"] for r in rs]
+        out["endpoints"][endpoint] = {
+            "requests": len(rs),
+            "p50_ms": _ms(percentile(lat, 50)),
+            "p95_ms": _ms(percentile(lat, 95)),
+            "p99_ms": _ms(percentile(lat, 99)),
+            "bytes": sum(r["bytes"] for r in rs),
+            "throttled": sum(1 for r in rs if r["status"] == 429),
+            "errors": sum(1 for r in rs if r["status"] >= 500),
+        }
+
+    out["peak_rss_mb"] = _peak_rss_mb()
+    return out
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000.0
+
+
+def run_bench(
+    settings: Settings,
+    *,
+    modes: List[str],
+    scenarios: List[str],
+    runs: int = 5,
+    workers: int = 8,
+) -> Dict[str, Any]:
+    """Run the scenarios once per mode, each mode in its own spawned process. The response cache is off."""
+    settings = replace(settings, cache_dir="")
+    report: Dict[str, Any] = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_url": settings.base_url,
+        "runs": runs,
+        "workers": workers,
+        "scenarios": scenarios,
+        "modes": {},
+    }
+    for mode in modes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            report["modes"][mode] = pool.submit(bench_mode, mode, settings, scenarios, runs, workers).result()
+    return report
+
+
+DECODE_PAGES = {
+    "clients": "/networks/{network_id}/clients",
+    "inventoryDevices": "/organizations/{org_id}/inventoryDevices",
+}
+
+
+def bench_decode_mode(base_url: str, ids: Dict[str, str], decoders: List[str], runs: int) -> Dict[str, Any]:
+    """
+    Fetch one full page of each DECODE_PAGES endpoint per decoder and walk its items
+    (dropping each, like a streaming export). Timed without tracing, then once more
+    under tracemalloc for the peak. Meant to run in its own process, away from the server.
+    """
+    import tracemalloc
+
+    from meraki_usecase.restconf.meraki_rest import MerakiRestClient
+
+    out: Dict[str, Any] = {}
+    for decoder in decoders:
+        client = MerakiRestClient(base_url, "mock", org_id=ids["org_id"], rate_limit=10000, decoder=decoder)
+        for page, template in DECODE_PAGES.items():
+            path = template.format(**ids)
+
+            def walk() -> int:
+                return sum(1 for _ in client.iter_items(path, per_page=1000, max_pages=1))
+
+            walk()   # warm up the connection
+            walls, cpus = [], []
+            for _ in range(runs):
+                t, c = time.perf_counter(), time.process_time()
+                items = walk()
+                walls.append(time.perf_counter() - t)
+                cpus.append(time.process_time() - c)
+            tracemalloc.start()
+            walk()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            out[f"{decoder} {page}"] = {
+                "decoder": decoder, "page": page, "items": items,
+                "p50_ms": _ms(percentile(walls, 50)), "cpu_ms": _ms(percentile(cpus, 50)), "peak_kb": peak / 1024,
+            }
+    return out
+
+
+def run_decode_bench(*, items: int = 1000, runs: int = 20, decoders: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Compare JSON decoders on full `items`-item pages served by a local mock Dashboard."""
+    from meraki_usecase.decode import available
+    from meraki_usecase.mock_server import MockConfig, serve_in_thread
+
+    networks = max(1, -(-items // 20))
+    server = serve_in_thread(MockConfig(orgs=1, networks=networks, switches=10, aps=10, clients=items, rate_limit=0))
+    try:
+        data = server.state.data
+        org_id = data.orgs[0]["id"]
+        ids = {"org_id": org_id, "network_id": data.networks[org_id][0]["id"]}
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results = pool.submit(bench_decode_mode, server.base_url, ids, decoders or available(), runs).result()
+    finally:
+        server.shutdown()
+    return {"items": items, "runs": runs, "results": results}
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[List[Any]]:
+    """Rows of (mode, scenario, baseline p50, now p50, change %) for scenarios present in both."""
+    rows = []
+    for mode, res in report["modes"].items():
+        base = baseline.get("modes", {}).get(mode, {}).get("scenarios", {})
+        for name, s in res["scenarios"].items():
+            b = base.get(name)
+            if not b or not b.get("p50_ms") or s.get("p50_ms") is None:
+                continue
+            change = (s["p50_ms"] - b["p50_ms"]) / b["p50_ms"] * 100.0
+            rows.append([mode, name, f"{b['p50_ms']:.1f}", f"{s['p50_ms']:.1f}", f"{change:+.1f}%"])
+    return rows
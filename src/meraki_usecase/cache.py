@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+# Per-endpoint freshness (seconds), matched against the path below /api/v1.
+# Anything not listed is never cached (statuses, clients, ports change constantly).
+DEFAULT_TTLS: List[Tuple[Pattern[str], int]] = [
+    (re.compile(r"^/organizations$"), 3600),
+    (re.compile(r"^/organizations/[^/]+/networks$"), 3600),
+    (re.compile(r"^/organizations/[^/]+/inventoryDevices$"), 900),
+    (re.compile(r"^/networks/[^/]+$"), 3600),
+    (re.compile(r"^/devices/[^/]+$"), 3600),
+]
+
+# How long past its TTL an entry may still be served while it is refreshed in the background.
+# 0 = never: an expired entry is revalidated before it is returned (MERAKI_CACHE_STALE_S opts in).
+DEFAULT_STALE_S = 0
+
+# Response headers worth keeping: validators for revalidation, Link for pagination.
+_KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+_API_PREFIX = re.compile(r"^.*?/api/v\d+")
+
+
+def api_path(url: str) -> str:
+    return _API_PREFIX.sub("", urlparse(url).path) or "/"
+
+
+def canonical_request(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """'GET https://host/path?a=1&b=2': query from the URL and `params` merged and sorted."""
+    u = urlparse(url)
+    query = parse_qsl(u.query, keep_blank_values=True)
+    for k, v in (params or {}).items():
+        for item in (v if isinstance(v, (list, tuple)) else [v]):
+            query.append((k, str(item)))
+    return f"{method.upper()} {u.scheme}://{u.netloc}{u.path}?{urlencode(sorted(query))}"
+
+
+@dataclass
+class CacheEntry:
+    stored_at: float
+    headers: Dict[str, str]
+    body: bytes
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def validators(self) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        if self.headers.get("ETag"):
+            out["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            out["If-Modified-Since"] = self.headers["Last-Modified"]
+        return out
+
+
+class ResponseCache:
+    """
+    On-disk cache for slow-changing GETs, shared by the rest and sdk backends.
+
+    Entries are keyed by method + URL + params, one JSON file each. Fresh entries
+    are served without a request. Expired entries are revalidated with
+    If-None-Match / If-Modified-Since. With `stale_s` > 0, entries less than
+    `stale_s` past their TTL are served right away and refreshed on a background
+    thread (stale-while-revalidate); off by default, since that hands out data
+    older than its TTL.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        namespace: str = "",
+        ttls: Optional[List[Tuple[Pattern[str], int]]] = None,
+        stale_s: int = DEFAULT_STALE_S,
+    ) -> None:
+        # Namespace (derived from the API key) keeps different accounts apart.
+        self.directory = os.path.join(os.path.expanduser(directory), namespace) if namespace else os.path.expanduser(directory)
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.stale_s = stale_s
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url: str) -> int:
+        path = api_path(url)
+        for pattern, ttl in self.ttls:
+            if pattern.match(path):
+                return ttl
+        return 0
+
+    def key(self, method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        return hashlib.sha256(canonical_request(method, url, params).encode()).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                raw = json.load(f)
+            return CacheEntry(raw["stored_at"], raw["headers"], raw["body"].encode("utf-8"))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, key: str, headers: Mapping[str, str], body: bytes) -> None:
+        kept = {h: headers[h] for h in _KEEP_HEADERS if headers.get(h)}
+        path = self._file(key)
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": time.time(), "headers": kept, "body": body.decode("utf-8")}, f)
+            os.replace(tmp, path)
+        except (OSError, UnicodeDecodeError):
+            pass
+
+    def _touch(self, key: str, entry: CacheEntry) -> None:
+        self.store(key, entry.headers, entry.body)
+
+    def _revalidate(self, key: str, entry: Optional[CacheEntry], send: Callable[[Dict[str, str]], Any]) -> Any:
+        resp = send(entry.validators() if entry else {})
+        if resp.status_code == 304 and entry is not None:
+            self._touch(key, entry)
+        elif resp.status_code == 200:
+            self.store(key, resp.headers, resp.content)
+        return resp
+
+    def _refresh_in_background(self, key: str, entry: CacheEntry, send: Callable[[Dict[str, str]], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._revalidate(key, entry, send)
+            except Exception:
+                pass  # keep serving the stale copy; next run will try again
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        # Not a daemon: a short CLI run waits for the refresh so the next run starts fresh.
+        threading.Thread(target=run, name=f"cache-refresh-{key[:8]}").start()
+
+    def fetch(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        send: Callable[[Dict[str, str]], Any],
+        from_entry: Callable[[CacheEntry], Any],
+    ) -> Any:
+        """
+        send(extra_headers) performs the real request; from_entry(entry) rebuilds a
+        response object of the caller's type from a cache entry.
+        """
+        ttl = self.ttl_for(url) if method.upper() == "GET" else 0
+        if ttl <= 0:
+            return send({})
+
+        key = self.key(method, url, params)
+        entry = self.load(key)
+
+        if entry is not None and entry.age < ttl:
+            return from_entry(entry)
+
+        if entry is not None and entry.age < ttl + self.stale_s:
+            self._refresh_in_background(key, entry, send)
+            return from_entry(entry)
+
+        resp = self._revalidate(key, entry, send)
+        if resp.status_code == 304 and entry is not None:
+            return from_entry(entry)
+        return resp
+
+
+def build_cache(settings: Any) -> Optional[ResponseCache]:
+    if not getattr(settings, "cache_dir", ""):
+        return None
+    namespace = hashlib.sha256(settings.api_key.encode()).hexdigest()[:16]
+    return ResponseCache(settings.cache_dir, namespace=namespace, stale_s=getattr(settings, "cache_stale_s", DEFAULT_STALE_S))
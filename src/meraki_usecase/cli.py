@@ -1,39 +1,15 @@
 from __future__ import annotations
 
 import argparse
-from typing import Any, List
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import sys
+from dataclasses import asdict, replace
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from meraki_usecase.config import Settings, port_db_path
 
-from meraki_usecase.config import Settings
-
-from meraki_usecase.restconf.meraki_rest import MerakiRestClient
-from meraki_usecase.restconf.orgs import org_name_to_id_map as rest_org_map
-from meraki_usecase.restconf.inventory import get_inventory_devices as rest_inventory
-from meraki_usecase.restconf.health import get_switch_health as rest_switch_health
-
-from meraki_usecase.sdk.meraki_sdk import build_dashboard
-from meraki_usecase.sdk.orgs import org_name_to_id_map as sdk_org_map
-from meraki_usecase.sdk.inventory import get_inventory_devices as sdk_inventory
-from meraki_usecase.sdk.health import get_switch_health as sdk_switch_health
-from meraki_usecase.restconf.health_ap import get_ap_health as rest_ap_health
-from meraki_usecase.sdk.health_ap import get_ap_health as sdk_ap_health
-from meraki_usecase.restconf.switch_ports import get_switch_ports_statuses as rest_switch_ports
-from meraki_usecase.sdk.switch_ports import get_switch_ports_statuses as sdk_switch_ports
-
-from meraki_usecase.restconf.switch_ports import get_switch_ports_statuses as rest_switch_ports, get_device as rest_get_device
-from meraki_usecase.sdk.switch_ports import get_switch_ports_statuses as sdk_switch_ports, get_device as sdk_get_device
-
-from meraki_usecase.restconf.health import get_switch_health as rest_switch_health
-from meraki_usecase.sdk.health import get_switch_health as sdk_switch_health
-
-from meraki_usecase.restconf.wifi_signal import get_wifi_signal_quality_by_client as rest_wifi_signal
-from meraki_usecase.sdk.wifi_signal import get_wifi_signal_quality_by_client as sdk_wifi_signal
-
-from meraki_usecase.restconf.network_clients import get_network_clients as rest_network_clients
-from meraki_usecase.sdk.network_clients import get_network_clients as sdk_network_clients
+# The backend (requests / meraki SDK / httpx asyncio) is imported by backends.load_backend() for the
+# chosen --mode only, and rich by the renderers, so short commands only pay for what they use.
 
 
 def _s(v: Any) -> str:
@@ -46,7 +22,7 @@ def _cut(s: str, n: int) -> str:
 def _row(values: List[Any], widths: List[int]) -> str:
     return " | ".join(_cut(_s(v), w).ljust(w) for v, w in zip(values, widths))
 
-def print_table(headers: List[str], rows: List[List[Any]], widths: List[int]) -> None:
+def print_table(headers: List[str], rows: Iterable[List[Any]], widths: List[int]) -> None:
     print(_row(headers, widths))
     print("-+-".join("-" * w for w in widths))
     for r in rows:
@@ -65,42 +41,253 @@ def _join_list(v):
         return ",".join(str(x) for x in v)
     return ""
 
-def _snr_style(snr_val):
-    if snr_val is None:
+# (header, record key, table width)
+Columns = List[Tuple[str, str, int]]
+
+ORG_COLUMNS: Columns = [("Name", "name", 55), ("Org ID", "id", 22)]
+INVENTORY_COLUMNS: Columns = [("Serial", "serial", 16), ("Model", "model", 10), ("Network ID", "networkId", 22), ("Claimed At", "claimedAt", 25)]
+DEVICE_HEALTH_COLUMNS: Columns = [
+    ("Name", "name", 28), ("Serial", "serial", 16), ("Model", "model", 10), ("Status", "status", 10), ("Last Reported", "lastReportedAt", 25),
+]
+PORT_COLUMNS: Columns = [
+    ("Switch", "switch", 22), ("Serial", "serial", 16), ("Port", "portId", 5), ("Status", "status", 12),
+    ("Uplink", "isUplink", 6), ("Speed", "speed", 10), ("Duplex", "duplex", 6), ("PoE", "poe", 5),
+    ("Clients", "clientCount", 7), ("STP", "stp", 12), ("Errors", "errors", 6), ("Warnings", "warnings", 8),
+]
+WIFI_SIGNAL_FIELDS = ["client_id", "client_mac", "network_name", "network_id", "snr", "rssi"]
+WATCH_COLUMNS: Columns = [
+    ("Time", "at", 20), ("Serial", "serial", 16), ("Name", "name", 24), ("Network", "network_id", 22),
+    ("Type", "product_type", 9), ("Change", "change", 8), ("From", "old", 24), ("To", "new", 24),
+]
+PORT_HISTORY_COLUMNS: Columns = [
+    ("From", "t0", 20), ("To", "t1", 20), ("Switch", "name", 18), ("Serial", "serial", 16), ("Port", "portId", 5),
+    ("Status", "status", 12), ("Uplink", "isUplink", 6), ("PoE", "poe", 5), ("Clients", "clientCount", 7),
+    ("Errors", "errors", 24), ("Warnings", "warnings", 24),
+]
+PORT_SUMMARY_COLUMNS: Columns = [
+    ("Switch", "name", 18), ("Serial", "serial", 16), ("Port", "portId", 5), ("Windows", "windows", 7),
+    ("w/ errors", "errorWindows", 9), ("w/ warnings", "warningWindows", 11), ("w/ PoE", "poeWindows", 6),
+    ("First error", "firstError", 20), ("Last error", "lastError", 20),
+]
+WIFI_STATS_COLUMNS: Columns = [
+    ("Network", "network_name", 22), ("AP", "ap_serial", 16), ("Clients", "clients", 7),
+    ("SNR p10", "snr_p10", 7), ("p50", "snr_p50", 4), ("p90", "snr_p90", 4),
+    ("RSSI p10", "rssi_p10", 8), ("p50", "rssi_p50", 4), ("p90", "rssi_p90", 4),
+    ("SNR exc%", "snr_excellent_pct", 8), ("good%", "snr_good_pct", 6), ("fair%", "snr_fair_pct", 6), ("poor%", "snr_poor_pct", 6),
+    ("RSSI poor%", "rssi_poor_pct", 10),
+]
+SWEEP_FIELDS = [
+    "org_id", "org_name", "network_id", "network_name",
+    "switches_online", "switches_total", "aps_online", "aps_total", "offline", "error",
+]
+
+def _export(args, fields: List[str], records: Iterable[Dict[str, Any]], *, flush: bool = False) -> None:
+    from meraki_usecase.export import open_output, write_records
+
+    # flush = a long-running stream (watch): write the file directly so it can be tailed
+    with open_output(args.output, atomic=not flush) as out:
+        write_records(records, args.format, out, fields, flush=flush)
+
+def _table_render(columns: Columns):
+    """LiveRows render function printing records as print_table() rows."""
+    headers = [header for header, _, _ in columns]
+    widths = [width for _, _, width in columns]
+
+    def render(records: List[Dict[str, Any]], first: bool) -> str:
+        lines = [_row(headers, widths), "-+-".join("-" * w for w in widths)] if first else []
+        lines.extend(_row([r.get(key) for _, key, _ in columns], widths) for r in records)
+        return "\n".join(lines)
+
+    return render
+
+def _live(args, render=None, *, total: Optional[int] = None, unit: str = "rows"):
+    """LiveRows for table output on a terminal (see live.live_enabled); otherwise a context yielding None."""
+    from contextlib import nullcontext
+    from meraki_usecase.live import LiveRows, live_enabled
+
+    return LiveRows(render, total=total, unit=unit) if live_enabled(args) else nullcontext()
+
+def _emit(args, columns: Columns, records: Iterable[Dict[str, Any]], *, live=None, progressive: bool = True) -> None:
+    """
+    Plain table on the terminal, or stream the records as NDJSON/CSV (--format/--output).
+    On a terminal, rows are printed as they arrive above a progress footer; pass `live`
+    to use a LiveRows the caller already started (to advance it per switch, say).
+    """
+    if args.format != "table":
+        _export(args, [key for _, key, _ in columns], records)
+        return
+    if live is None and progressive:
+        from meraki_usecase.live import LiveRows, live_enabled
+
+        if live_enabled(args):
+            with LiveRows(_table_render(columns)) as live:
+                _emit(args, columns, records, live=live)
+            return
+    if live is not None:
+        for r in records:
+            live.add(r)
+        return
+    print_table(
+        [header for header, _, _ in columns],
+        ([r.get(key) for _, key, _ in columns] for r in records),
+        [width for _, _, width in columns],
+    )
+
+def _port_record(sw_name: str, serial: str, p: dict) -> Dict[str, Any]:
+    return {
+        "switch": sw_name,
+        "serial": serial,
+        "portId": p.get("portId"),
+        "status": p.get("status"),
+        "isUplink": p.get("isUplink"),
+        "speed": p.get("speed"),
+        "duplex": p.get("duplex"),
+        "poe": _get_first(p, ["poe", "isAllocated"], ""),
+        "clientCount": p.get("clientCount", ""),
+        "stp": _join_list(_get_first(p, ["spanningTree", "statuses"], [])),
+        "errors": len(p.get("errors", []) or []),
+        "warnings": len(p.get("warnings", []) or []),
+    }
+
+def _iter_switch_port_records(
+    backend, switches, *, limit: int, workers: int, failures: list,
+    org_id: Optional[str] = None, network_ids: Optional[List[str]] = None, notes: Optional[list] = None,
+    on_switch=None,
+):
+    """
+    Fetch port statuses for every switch and yield the port records as they arrive.
+    With `org_id` the org-level bySwitch endpoint serves as many switches as it can
+    (20 per request); the rest, or all of them without `org_id`, are fetched per
+    switch on a bounded worker pool (backend.fan_out). Switches that fail are
+    appended to `failures` so whatever we did get can still be printed.
+    `on_switch()` is called after each switch's rows (progress).
+    """
+    from meraki_usecase.switch_port_bulk import iter_ports_by_switch
+
+    if limit <= 0:   # --limit 0: no rows, and no requests for them
+        return
+    n = 0
+    for sw, ports in iter_ports_by_switch(
+        backend.switch_ports_by_switch if org_id else None,
+        backend.fan_out_api.switch_ports,
+        org_id or "",
+        switches,
+        network_ids=network_ids,
+        workers=workers,
+        fan_out=backend.fan_out,
+        failures=failures,
+        notes=notes,
+    ):
+        for p in ports:
+            yield _port_record(sw.get("name", ""), sw.get("serial"), p)
+            n += 1
+            if n >= limit:
+                return
+        if on_switch is not None:
+            on_switch()
+
+def _print_failures(failures) -> None:
+    if not failures:
+        return
+    print(f"\nWARNING: {len(failures)} switch(es) failed, results above are partial:")
+    for serial, err in failures:
+        print(f"  {serial}: {err}")
+
+def _print_sweep(result, limit: int) -> None:
+    rows = []
+    for n in result.networks[:limit]:
+        rows.append([
+            n.org_name or n.org_id,
+            n.network_name or n.network_id,
+            f"{n.switches_online}/{n.switches_total}",
+            f"{n.aps_online}/{n.aps_total}",
+            ",".join(n.offline),
+            n.error or "",
+        ])
+    print_table(["Org", "Network", "Switches up", "APs up", "Offline", "Error"], rows, [24, 28, 11, 9, 30, 20])
+
+    t = result.totals
+    print(
+        f"\n{t['orgs']} org(s), {t['networks']} network(s): "
+        f"switches {t['switches_online']}/{t['switches_total']} online, "
+        f"APs {t['aps_online']}/{t['aps_total']} online, {t['failed_networks']} network(s) failed"
+    )
+    for org_id, err in result.org_errors.items():
+        print(f"  org {org_id} skipped: {err}")
+
+def _wifi_record(r: Dict[str, Any]) -> Dict[str, Any]:
+    # Response fields can evolve; we keep common ones safely
+    client = r.get("client") or {}
+    network = r.get("network") or {}
+    return {
+        "client_id": client.get("id", ""),
+        "client_mac": client.get("mac", ""),
+        "network_name": network.get("name", ""),
+        "network_id": network.get("id", ""),
+        "snr": r.get("snr", None),
+        "rssi": r.get("rssi", None),
+    }
+
+_BAND_STYLES = {"excellent": "bold green", "good": "green", "fair": "yellow", "poor": "red"}
+
+def _band_style(val, bands):
+    if val is None:
         return ("", "dim")
     try:
-        snr = int(snr_val)
+        v = int(val)
     except Exception:
-        return (str(snr_val), "dim")
+        return (str(val), "dim")
+    from meraki_usecase.signal_stats import band_of
+    return (str(v), _BAND_STYLES[band_of(bands, v)])
 
-    if snr >= 40:
-        return (str(snr), "bold green")
-    if snr >= 25:
-        return (str(snr), "green")
-    if snr >= 20:
-        return (str(snr), "yellow")
-    return (str(snr), "red")
 
+def _snr_style(snr_val):
+    from meraki_usecase.signal_stats import SNR_BANDS
+    return _band_style(snr_val, SNR_BANDS)
 
-def _rssi_style(rssi_val):
-    if rssi_val is None:
-        return ("", "dim")
-    try:
-        rssi = int(rssi_val)
-    except Exception:
-        return (str(rssi_val), "dim")
 
+def _rssi_style(rssi_val):
     # RSSI is negative dBm; closer to 0 is better
-    if rssi >= -65:
-        return (str(rssi), "bold green")
-    if -71 <= rssi <= -66:
-        return (str(rssi), "green")
-    if -77 <= rssi <= -72:
-        return (str(rssi), "yellow")
-    return (str(rssi), "red")
+    from meraki_usecase.signal_stats import RSSI_BANDS
+    return _band_style(rssi_val, RSSI_BANDS)
+
+
+def _wifi_table(title, *, chunk: bool = False, show_header: bool = True):
+    from rich import box
+    from rich.table import Table
+
+    if not chunk:
+        table = Table(title=title, show_lines=False)
+        widths = [None] * 6
+    else:
+        # Fixed widths and no outer edges, so consecutive chunks line up as one table
+        table = Table(title=title, show_header=show_header, box=box.SIMPLE_HEAD, show_edge=False)
+        widths = [12, 17, 24, 20, 4, 5]
+    table.add_column("Client ID", style="cyan", no_wrap=True, width=widths[0])
+    table.add_column("Client MAC", no_wrap=True, width=widths[1])
+    table.add_column("Network", overflow="fold", width=widths[2])
+    table.add_column("Network ID", overflow="fold", width=widths[3])
+    table.add_column("SNR", justify="right", width=widths[4])
+    table.add_column("RSSI", justify="right", width=widths[5])
+    return table
+
+def _wifi_add_row(table, r) -> None:
+    snr_text, snr_style = _snr_style(r.get("snr"))
+    rssi_text, rssi_style = _rssi_style(r.get("rssi"))
+
+    table.add_row(
+        str(r.get("client_id", "")),
+        str(r.get("client_mac", "")),
+        str(r.get("network_name", "")),
+        str(r.get("network_id", "")),
+        f"[{snr_style}]{snr_text}[/{snr_style}]",
+        f"[{rssi_style}]{rssi_text}[/{rssi_style}]",
+    )
 
+def print_wifi_signal_rich(rows, *, title="Wi-Fi Signal Quality by Client", progressive: bool = False):
+    from rich.console import Console
+    from rich.panel import Panel
 
-def print_wifi_signal_rich(rows, *, title="Wi-Fi Signal Quality by Client"):
     console = Console()
 
     legend = (
@@ -117,45 +304,32 @@ def print_wifi_signal_rich(rows, *, title="Wi-Fi Signal Quality by Client"):
     )
     console.print(Panel(legend, title="Legend", expand=False))
 
-    table = Table(title=title, show_lines=False)
-    table.add_column("Client ID", style="cyan", no_wrap=True)
-    table.add_column("Client MAC", no_wrap=True)
-    table.add_column("Network", overflow="fold")
-    table.add_column("Network ID", overflow="fold")
-    table.add_column("SNR", justify="right")
-    table.add_column("RSSI", justify="right")
+    if progressive:
+        # Rows in chunks as pages arrive, above a progress footer (see live.LiveRows)
+        from meraki_usecase.live import LiveRows
 
-    for r in rows:
-        client_id = r.get("client_id", "")
-        client_mac = r.get("client_mac", "")
-        net_name = r.get("network_name", "")
-        net_id = r.get("network_id", "")
+        def render(chunk, first):
+            table = _wifi_table(title if first else None, chunk=True, show_header=first)
+            for r in chunk:
+                _wifi_add_row(table, r)
+            return table
 
-        snr_text, snr_style = _snr_style(r.get("snr"))
-        rssi_text, rssi_style = _rssi_style(r.get("rssi"))
+        with LiveRows(render, console=console) as live:
+            for r in rows:
+                live.add(r)
+        return
 
-        table.add_row(
-            str(client_id),
-            str(client_mac),
-            str(net_name),
-            str(net_id),
-            f"[{snr_style}]{snr_text}[/{snr_style}]",
-            f"[{rssi_style}]{rssi_text}[/{rssi_style}]",
-        )
+    table = _wifi_table(title)
+    for r in rows:
+        _wifi_add_row(table, r)
 
     console.print(table)
 
-def _kb_to_mb(v) -> float:
-    try:
-        return float(v) / 1024.0
-    except Exception:
-        return 0.0
-
-def _kb_to_mb_str(v) -> str:
-    mb = _kb_to_mb(v)
-    return "" if mb == 0 else f"{mb:.1f}"
-
 def print_network_clients_rich(rows, *, title: str, timespan_s: int) -> None:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
     console = Console()
 
     legend = (
@@ -180,20 +354,15 @@ def print_network_clients_rich(rows, *, title: str, timespan_s: int) -> None:
     table.add_column("Last Seen", justify="right")
 
     for r in rows:
-        usage = r.get("usage") or {}
-        sent_mb = _kb_to_mb(usage.get("sent"))
-        recv_mb = _kb_to_mb(usage.get("recv"))
-        total_mb = sent_mb + recv_mb
-
         table.add_row(
-            str(r.get("id", "")),
-            str(r.get("mac", "")),
-            str(r.get("name", "")),
-            str(r.get("status", "")),
-            f"{sent_mb:.1f}",
-            f"{recv_mb:.1f}",
-            f"{total_mb:.1f}",
-            str(r.get("lastSeen", "")),
+            r.id,
+            r.mac,
+            r.name,
+            r.status,
+            f"{r.sent / 1024.0:.1f}",
+            f"{r.recv / 1024.0:.1f}",
+            f"{r.total / 1024.0:.1f}",
+            r.last_seen,
         )
 
     console.print(table)
@@ -202,9 +371,105 @@ def print_network_clients_rich(rows, *, title: str, timespan_s: int) -> None:
 
 
 
+def _fmt(v, spec: str = ".1f") -> str:
+    return "" if v is None else format(v, spec)
+
+def _print_bench(report) -> None:
+    rows = []
+    for mode, res in report["modes"].items():
+        for name, sc in res["scenarios"].items():
+            rows.append([
+                mode, name, sc["runs"], _fmt(sc["p50_ms"]), _fmt(sc["p95_ms"]), _fmt(sc["p99_ms"]),
+                sc["requests"], _fmt(sc["pages_per_s"]), _fmt(sc["items_per_s"], ".0f"),
+                _fmt(sc["bytes"] / 1024, ".0f"), sc["throttled"], _fmt(res["peak_rss_mb"]),
+            ])
+    print(f"Scenario wall time over {report['runs']} run(s) against {report['base_url']}\n")
+    print_table(
+        ["Mode", "Scenario", "Runs", "p50 ms", "p95 ms", "p99 ms", "Reqs", "Pages/s", "Items/s", "KB", "429s", "RSS MB"],
+        rows,
+        [5, 15, 4, 9, 9, 9, 6, 8, 9, 8, 5, 7],
+    )
+
+    rows = []
+    for mode, res in report["modes"].items():
+        for endpoint, e in res["endpoints"].items():
+            rows.append([mode, endpoint, e["requests"], _fmt(e["p50_ms"]), _fmt(e["p95_ms"]), _fmt(e["p99_ms"]),
+                         _fmt(e["bytes"] / 1024, ".0f"), e["throttled"], e["errors"]])
+    print("\nPer request, by endpoint\n")
+    print_table(["Mode", "Endpoint", "Reqs", "p50 ms", "p95 ms", "p99 ms", "KB", "429s", "5xx"], rows,
+                [5, 58, 6, 9, 9, 9, 8, 5, 4])
+
+    for mode, res in report["modes"].items():
+        for name, sc in res["scenarios"].items():
+            for err in sc["errors"]:
+                print(f"  {mode} {name} failed: {err}")
+
+def _bench_decode(args) -> None:
+    from meraki_usecase.bench import run_decode_bench
+
+    report = run_decode_bench(items=args.decode_items, runs=args.runs)
+    rows = [
+        [r["decoder"], r["page"], r["items"], _fmt(r["p50_ms"]), _fmt(r["cpu_ms"]), _fmt(r["peak_kb"], ".0f")]
+        for r in report["results"].values()
+    ]
+    print(f"One full page per request, median of {report['runs']} run(s); peak = Python heap (tracemalloc)\n")
+    print_table(["Decoder", "Page", "Items", "Wall ms", "CPU ms", "Peak KB"], rows, [8, 17, 6, 8, 8, 9])
+
+def _bench(args) -> None:
+    if args.decode:
+        _bench_decode(args)
+        return
+
+    from meraki_usecase.bench import SCENARIOS, compare, load_report, run_bench, save_report
+
+    scenarios = [x.strip() for x in args.scenario.split(",") if x.strip()] if args.scenario else SCENARIOS
+    unknown = [x for x in scenarios if x not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)} (expected: {', '.join(SCENARIOS)})")
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+
+    server = None
+    if args.mock:
+        from meraki_usecase.mock_server import MockConfig, serve_in_thread
+
+        server = serve_in_thread(MockConfig(latency_ms=args.mock_latency_ms, jitter_ms=args.mock_latency_ms / 2))
+        data = server.state.data
+        org_id = data.orgs[0]["id"]
+        settings = Settings(api_key="mock", org_id=org_id, network_id=data.networks[org_id][0]["id"], base_url=server.base_url)
+    else:
+        settings = Settings()
+        if args.base_url:
+            settings = replace(settings, base_url=args.base_url)
+
+    try:
+        report = run_bench(settings, modes=modes, scenarios=scenarios, runs=args.runs,
+                           workers=args.workers or settings.max_workers)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    _print_bench(report)
+    if args.compare:
+        print(f"\nChange in p50 vs {args.compare}\n")
+        print_table(["Mode", "Scenario", "Base p50", "Now p50", "Change"], compare(report, load_report(args.compare)),
+                    [5, 15, 9, 9, 8])
+    if args.save:
+        save_report(report, args.save)
+        print(f"\nSaved baseline to {args.save}")
+
 def main() -> None:
     parser = argparse.ArgumentParser(prog="meraki-usecase")
-    parser.add_argument("--mode", choices=["rest", "sdk"], default="rest")
+    parser.add_argument("--mode", choices=["rest", "sdk", "async"], default="rest")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk response cache (MERAKI_CACHE_DIR)")
+    parser.add_argument("--format", choices=["table", "ndjson", "csv"], default="table",
+                        help="table (default) or stream records as NDJSON/CSV")
+    parser.add_argument("--output", "-o", default="-", help="File for --format ndjson/csv (default: stdout)")
+    parser.add_argument("--no-live", action="store_true",
+                        help="No progress footer on a terminal; by default table rows print as they arrive, above a progress bar with ETA")
+    parser.add_argument("--metrics-out", metavar="PATH",
+                        help="Write request metrics at exit: *.json = JSON, else Prometheus text, '-' = stderr")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Serve request metrics on http://127.0.0.1:PORT/metrics (and /metrics.json) while running")
 
     sub = parser.add_subparsers(dest="cmd", required=True)
 
@@ -213,6 +478,16 @@ def main() -> None:
 
     p_inv = sub.add_parser("inventory", help="List inventory for MERAKI_ORG_ID")
     p_inv.add_argument("--limit", type=int, default=200)
+    p_inv.add_argument("--resumable", action="store_true",
+                       help="Fetch every page into a checkpoint file first; an interrupted run resumes where it stopped")
+    p_inv.add_argument("--partition-by", choices=["network", "product"],
+                       help="Split the fetch by networkIds[] / productTypes[] and page the parts in parallel (implies --resumable). "
+                            "product only covers known product types; use network for a guaranteed complete inventory")
+    p_inv.add_argument("--checkpoint", help="Checkpoint file (default: ~/.cache/meraki-usecase/inventory-<org>.sqlite3)")
+    p_inv.add_argument("--fresh", action="store_true", help="Discard an existing checkpoint and start over")
+    p_inv.add_argument("--keep-checkpoint", action="store_true", help="Keep the checkpoint after a complete fetch")
+    p_inv.add_argument("--workers", type=int, help="Partitions fetched in parallel (default: MERAKI_MAX_WORKERS)")
+    p_inv.add_argument("--max-pages", type=int, help=argparse.SUPPRESS)   # stop early, to try out resuming
 
     p_health = sub.add_parser("switch-health", help="Switch health (online/offline) for a network")
     p_health.add_argument("--network-id", help="Override MERAKI_NETWORK_ID from .env")
@@ -222,374 +497,525 @@ def main() -> None:
     p_ap.add_argument("--network-id", help="Override MERAKI_NETWORK_ID from .env")
     p_ap.add_argument("--limit", type=int, default=200)
 
-    p_sp = sub.add_parser("switch-ports", help="Show port statuses for one switch or all switches in a network")
+    p_sp = sub.add_parser("switch-ports", help="Show port statuses for one switch, all switches in a network, or all in the org")
     p_sp.add_argument("--serial", help="Switch serial (e.g. Q2XX-....)")
     p_sp.add_argument("--all", action="store_true", help="Get ports for all switches in MERAKI_NETWORK_ID")
+    p_sp.add_argument("--org", action="store_true", help="Get ports for all switches in MERAKI_ORG_ID")
     p_sp.add_argument("--network-id", help="Override MERAKI_NETWORK_ID from .env (used with --all)")
+    p_sp.add_argument("--no-bulk", action="store_true", help="One request per switch instead of the org-level bySwitch endpoint (20 switches per request)")
     p_sp.add_argument("--limit", type=int, default=200)
+    p_sp.add_argument("--workers", type=int, help="Parallel switch requests (default: MERAKI_MAX_WORKERS, async: MERAKI_ASYNC_CONCURRENCY)")
 
     p_ws = sub.add_parser("wifi-signal", help="Wireless signal quality by client (org-wide, optional network/AP filters)")
     p_ws.add_argument("--timespan", type=int, default=86400, help="Seconds (default: 86400 = 24h)")
     p_ws.add_argument("--network-id", help="Override MERAKI_NETWORK_ID from .env")
+    p_ws.add_argument("--org", action="store_true", help="Whole MERAKI_ORG_ID instead of one network")
     p_ws.add_argument("--serials", help="Comma-separated AP serials to filter (e.g. Q2XX-...,Q2YY-...)")
     p_ws.add_argument("--limit", type=int, default=200)
+    p_ws.add_argument("--shard-by", choices=["ap", "network"],
+                      help="Split the query by AP serials or by network and fetch the shards in parallel (within the network; --org: org-wide)")
+    p_ws.add_argument("--shard-size", type=int, default=20, help="AP serials per shard (--shard-by ap; default: 20)")
+    p_ws.add_argument("--workers", type=int, help="Parallel shards (default: MERAKI_MAX_WORKERS, async: MERAKI_ASYNC_CONCURRENCY)")
+
+    p_wst = sub.add_parser("wifi-stats", help="SNR/RSSI distribution per network or AP: p10/p50/p90 and quality-band shares")
+    p_wst.add_argument("--timespan", type=int, default=86400, help="Seconds (default: 86400 = 24h)")
+    p_wst.add_argument("--network-id", help="Only this network (default: whole org)")
+    p_wst.add_argument("--by", choices=["network", "ap"], default="network",
+                       help="Group by network, or per AP (one request per AP serial)")
+    p_wst.add_argument("--serials", help="Comma-separated AP serials (--by ap; default: all APs in the network)")
+    p_wst.add_argument("--shard-by", choices=["ap", "network"], help="--by network: fetch in parallel shards (see wifi-signal)")
+    p_wst.add_argument("--shard-size", type=int, default=20, help="AP serials per shard (default: 20)")
+    p_wst.add_argument("--workers", type=int, help="Parallel AP requests / shards (default: MERAKI_MAX_WORKERS, async: MERAKI_ASYNC_CONCURRENCY)")
+    p_wst.add_argument("--histogram", action="store_true", help="Also print SNR/RSSI histograms over all groups")
+    p_wst.add_argument("--save", metavar="PATH", help="Write the distributions (mergeable JSON) to PATH")
+    p_wst.add_argument("--merge", metavar="PATH", action="append", default=[],
+                       help="Add distributions saved by an earlier --save (e.g. another org); repeatable")
+    p_wst.add_argument("--offline", action="store_true", help="Only report the --merge files; no API calls")
 
     p_nc = sub.add_parser("network-clients", help="List clients in a network with usage for the timespan (default 24h)")
     p_nc.add_argument("--timespan", type=int, default=86400, help="Seconds (default: 86400 = 24h)")
     p_nc.add_argument("--network-id", help="Override MERAKI_NETWORK_ID from .env")
     p_nc.add_argument("--conn", choices=["wired", "wireless", "all"], default="all", help="Filter by recent connection type")
-    p_nc.add_argument("--limit", type=int, default=200)
+    p_nc.add_argument("--limit", type=int, default=200,
+                      help="Rows to fetch and show (default: 200). With --sort/--top every client is ranked, then the best N are shown")
 
-    p_nc.add_argument("--sort", choices=["total", "sent", "recv", "name", "mac", "lastSeen"], default="total",
-                  help="Sort field (default: total)")
+    p_nc.add_argument("--sort", metavar="FIELD[,FIELD...]",
+                  help="Sort keys, e.g. total or -total,name; fields: total, sent, recv, name, mac, status, lastSeen; "
+                       "'-'/'+' prefix = descending/ascending (default: total; exports stream unsorted unless given)")
     p_nc.add_argument("--top", type=int, default=0,
                     help="Show only top N after sorting (0 = no top filter)")
     p_nc.add_argument("--desc", action="store_true",
-                    help="Sort descending (default for total/sent/recv is descending anyway)")
-
+                    help="Sort unprefixed keys descending (default for total/sent/recv is descending anyway)")
+
+    p_sw = sub.add_parser("sweep", help="Switch + AP health for every network in every org the API key can see")
+    p_sw.add_argument("--org", action="append", help="Only sweep this org id (repeatable)")
+    p_sw.add_argument("--workers", type=int, help="Parallel requests overall (default: MERAKI_MAX_WORKERS, async: MERAKI_ASYNC_CONCURRENCY)")
+    p_sw.add_argument("--per-org", type=int, default=2, help="Max parallel requests per org (default: 2)")
+    p_sw.add_argument("--limit", type=int, default=1000)
+
+    p_wt = sub.add_parser("watch", help="Poll org device statuses and print only the changes (adaptive interval)")
+    p_wt.add_argument("--network-id", help="Only watch this network (default: the whole org)")
+    p_wt.add_argument("--product-type", action="append", help="Only these product types, e.g. switch, wireless (repeatable)")
+    p_wt.add_argument("--interval", type=float, default=60, help="Starting poll interval in seconds (default: 60)")
+    p_wt.add_argument("--min-interval", type=float, default=15, help="Fastest poll interval while devices flap (default: 15)")
+    p_wt.add_argument("--max-interval", type=float, default=300, help="Slowest poll interval when stable (default: 300)")
+    p_wt.add_argument("--report-gap", type=float, default=900,
+                      help="Report a device whose lastReportedAt jumps by more than this many seconds (default: 900)")
+    p_wt.add_argument("--polls", type=int, default=0, help="Stop after N polls (default: 0 = run until Ctrl-C)")
+
+    p_bf = sub.add_parser("backfill-ports", help="Store switch port statuses per time window in a local SQLite db (fetches only missing windows)")
+    p_bf.add_argument("--serial", action="append", help="Switch serial (repeatable; default: all switches in the network)")
+    p_bf.add_argument("--network-id", help="Override MERAKI_NETWORK_ID from .env")
+    p_bf.add_argument("--days", type=float, default=1, help="Look back this many days (default: 1, max: 31)")
+    p_bf.add_argument("--since", help="Start (ISO 8601 or epoch); overrides --days")
+    p_bf.add_argument("--until", help="End (ISO 8601 or epoch; default: now)")
+    p_bf.add_argument("--window", type=int, default=3600, help="Window length in seconds (default: 3600)")
+    p_bf.add_argument("--workers", type=int, help="Parallel requests (default: MERAKI_MAX_WORKERS, async: MERAKI_ASYNC_CONCURRENCY)")
+    p_bf.add_argument("--db", help="Override MERAKI_PORT_DB")
+
+    p_ph = sub.add_parser("port-history", help="Query stored port statuses (no API calls)")
+    p_ph.add_argument("--serial", action="append", help="Switch serial (repeatable; default: all)")
+    p_ph.add_argument("--days", type=float, help="Only the last N days")
+    p_ph.add_argument("--since", help="Start (ISO 8601 or epoch)")
+    p_ph.add_argument("--until", help="End (ISO 8601 or epoch)")
+    p_ph.add_argument("--errors", action="store_true", help="Only samples with port errors or warnings")
+    p_ph.add_argument("--poe", action="store_true", help="Only samples with PoE allocated")
+    p_ph.add_argument("--summary", action="store_true", help="One row per port: error/warning/PoE window counts, traffic")
+    p_ph.add_argument("--limit", type=int, default=1000)
+    p_ph.add_argument("--db", help="Override MERAKI_PORT_DB")
+
+    p_b = sub.add_parser("bench", help="Benchmark rest vs sdk: latency percentiles, pages/items per second, bytes, peak RSS")
+    p_b.add_argument("--scenario", help="Comma-separated: orgs, inventory, health, switch-ports, network-clients (default: all)")
+    p_b.add_argument("--modes", default="rest,sdk", help="Backends to compare: rest, sdk, async (default: rest,sdk)")
+    p_b.add_argument("--runs", type=int, default=5, help="Runs per scenario (default: 5)")
+    p_b.add_argument("--workers", type=int, help="Parallel requests for switch-ports (default: MERAKI_MAX_WORKERS, same for every mode)")
+    p_b.add_argument("--base-url", help="Override MERAKI_DASHBOARD_BASE_URL")
+    p_b.add_argument("--mock", action="store_true", help="Run against a local mock Dashboard (no API key needed)")
+    p_b.add_argument("--mock-latency-ms", type=float, default=50.0, help="Mock response latency (default: 50)")
+    p_b.add_argument("--save", metavar="PATH", help="Write the results as a JSON baseline")
+    p_b.add_argument("--compare", metavar="PATH", help="Compare p50 against a saved baseline")
+    p_b.add_argument("--decode", action="store_true",
+                     help="Instead: compare JSON decoders (json/orjson/stream) on large mock clients/inventory pages")
+    p_b.add_argument("--decode-items", type=int, default=1000, help="Items per page for --decode (default: 1000)")
 
+    args = parser.parse_args()
+    if args.cmd == "bench":
+        _bench(args)
+        return
+
+    metrics_server = None
+    if args.metrics_port:
+        from meraki_usecase.metrics import serve_metrics
+        metrics_server = serve_metrics(port=args.metrics_port)
+    try:
+        _run(args, parser)
+    finally:
+        if args.metrics_out:
+            from meraki_usecase.metrics import REGISTRY
+            REGISTRY.dump(args.metrics_out)
+        if metrics_server is not None:
+            metrics_server.shutdown()
+
+def _port_history(args) -> None:
+    import time
+    from meraki_usecase.port_store import PortStore, parse_time
+
+    since = parse_time(args.since) if args.since else (int(time.time() - args.days * 86400) if args.days else None)
+    until = parse_time(args.until) if args.until else None
+    with PortStore(args.db or port_db_path()) as store:
+        if args.summary:
+            rows = store.summary(serials=args.serial, since=since, until=until)
+            _emit(args, PORT_SUMMARY_COLUMNS, islice(rows, args.limit))
+        else:
+            rows = store.history(serials=args.serial, since=since, until=until, errors_only=args.errors, poe_only=args.poe)
+            if args.format == "table":
+                rows = ({**r, "errors": _join_list(r["errors"]), "warnings": _join_list(r["warnings"])} for r in rows)
+            _emit(args, PORT_HISTORY_COLUMNS, islice(rows, args.limit))
+
+def _inventory_resumable(args, settings, backend) -> None:
+    """inventory --resumable / --partition-by: checkpointed, partitioned fetch, then print from the checkpoint."""
+    from meraki_usecase.inventory_fetch import (
+        InventoryCheckpoint, default_checkpoint, fetch_inventory, make_partitions, uncovered_product_types,
+    )
 
+    # The cursor is the Link next URL, so pages always go through the rest client.
+    if backend.name == "rest":
+        client = backend.handle
+    else:
+        from meraki_usecase.restconf.meraki_rest import build_client
+        client = build_client(settings)
+
+    kind = args.partition_by or "none"
+    networks = backend.networks(settings.org_id) if kind in ("network", "product") else []
+    network_ids = [n["id"] for n in networks] if kind == "network" else None
+    uncovered = uncovered_product_types(networks) if kind == "product" else []
+    checkpoint = InventoryCheckpoint(args.checkpoint or default_checkpoint(settings.org_id))
+    if args.fresh:
+        checkpoint.discard()
+        checkpoint = InventoryCheckpoint(checkpoint.path)
+
+    def progress(partition: str, pages: int) -> None:
+        print(f"\r{partition}: page {pages}  ({checkpoint.count()} devices stored)\033[K", end="", file=sys.stderr, flush=True)
 
+    try:
+        result = fetch_inventory(
+            checkpoint,
+            client.get_page,
+            settings.org_id,
+            make_partitions(kind, network_ids),
+            kind=kind,
+            workers=args.workers or settings.max_workers,
+            max_pages=args.max_pages,
+            on_page=progress if sys.stderr.isatty() else None,
+        )
+    except KeyboardInterrupt:
+        checkpoint.close()
+        print(f"\nInterrupted. Run the same command again to resume from {checkpoint.path}", file=sys.stderr)
+        raise SystemExit(130)
+    except ValueError as e:
+        checkpoint.close()
+        raise SystemExit(str(e))
+
+    if sys.stderr.isatty():
+        print(file=sys.stderr)
+    print(f"{result.pages} page(s) fetched, {result.resumed} partition(s) resumed, "
+          f"{result.skipped} already complete, {checkpoint.count()} device(s)", file=sys.stderr)
+    if not result.complete:
+        for partition, err in result.failed[:10]:
+            print(f"  {partition}: {err}", file=sys.stderr)
+        if len(result.failed) > 10:
+            print(f"  ... and {len(result.failed) - 10} more", file=sys.stderr)
+        checkpoint.close()
+        raise SystemExit(f"Inventory incomplete. Run the same command again to resume from {checkpoint.path}")
+
+    if uncovered:
+        print(f"WARNING: no product partition for {', '.join(uncovered)}; those devices are missing. "
+              f"Use --partition-by network for a complete inventory.", file=sys.stderr)
+
+    _emit(args, INVENTORY_COLUMNS, islice(checkpoint.devices(), args.limit))
+    if args.keep_checkpoint:
+        checkpoint.close()
+    else:
+        checkpoint.discard()
+
+
+def _iter_wifi_shards(args, settings, backend, *, network_id: Optional[str], limit, failures: list):
+    """
+    signalQuality/byClient rows for --shard-by: AP serials (or networks) split into parallel
+    shards, within `network_id` (None: the whole org).
+    """
+    from meraki_usecase.wifi_shards import iter_sharded_wifi_signal, make_shards
+
+    if limit is not None and limit <= 0:
+        return iter(())
+    network_ids = [network_id] if network_id else None
+    if args.shard_by == "network":
+        keys = network_ids or [
+            n["id"] for n in backend.networks(settings.org_id) if "wireless" in (n.get("productTypes") or ["wireless"])
+        ]
+    elif args.serials:
+        keys = [s.strip() for s in args.serials.split(",") if s.strip()]
+    else:
+        keys = [
+            d["serial"] for d in backend.device_statuses(settings.org_id, network_ids=network_ids, product_types=["wireless"])
+            if d.get("serial")
+        ]
+    return iter_sharded_wifi_signal(
+        backend.fan_out_api.wifi_signal,
+        settings.org_id,
+        args.shard_by,
+        make_shards(args.shard_by, keys, args.shard_size),
+        timespan=args.timespan,
+        network_id=network_id,
+        workers=args.workers or backend.workers,
+        limit=limit,
+        failures=failures,
+        fan_out=backend.fan_out,
+    )
 
 
-    args = parser.parse_args()
-    settings = Settings()
+def _print_shard_failures(failures) -> None:
+    if not failures:
+        return
+    print(f"\nWARNING: {len(failures)} shard(s) failed, results above are partial:", file=sys.stderr)
+    for shard, err in failures:
+        print(f"  {shard}: {err}", file=sys.stderr)
 
-    if args.mode == "rest":
-        client = MerakiRestClient(
-            base_url=settings.base_url,
-            api_key=settings.api_key,
-            timeout_s=settings.timeout_s,
-            max_retries=settings.max_retries,
-        )
 
-        if args.cmd == "orgs":
-            org_map = rest_org_map(client)
-            items = list(org_map.items())[: args.limit]
-            rows = [[name, oid] for name, oid in items]
-            print_table(["Name", "Org ID"], rows, [55, 22])
+def _wifi_stats(args, settings, backend) -> None:
+    from meraki_usecase.signal_stats import STATS_FIELDS, SignalDistribution, text_histogram
 
-        elif args.cmd == "inventory":
-            devs = rest_inventory(client, settings.org_id)[: args.limit]
-            rows = [[d.get("serial"), d.get("model"), d.get("networkId"), d.get("claimedAt")] for d in devs]
-            print_table(["Serial", "Model", "Network ID", "Claimed At"], rows, [16, 10, 22, 25])
+    dist = SignalDistribution()
+    for path in args.merge:
+        dist.merge(SignalDistribution.load(path))
 
-        elif args.cmd == "switch-health":
-            network_id = args.network_id or settings.network_id
-            devs = rest_switch_health(client, settings.org_id, network_id)[: args.limit]
-            rows = [[d.get("name"), d.get("serial"), d.get("model"), d.get("status"), d.get("lastReportedAt")] for d in devs]
-            print_table(["Name", "Serial", "Model", "Status", "Last Reported"], rows, [28, 16, 10, 10, 25])
-        
-        elif args.cmd == "ap-health":
-            network_id = args.network_id or settings.network_id
-            devs = rest_ap_health(client, settings.org_id, network_id)[: args.limit]
-            rows = [[d.get("name"), d.get("serial"), d.get("model"), d.get("status"), d.get("lastReportedAt")] for d in devs]
-            print_table(["Name", "Serial", "Model", "Status", "Last Reported"], rows, [28, 16, 10, 10, 25])
-        
-        elif args.cmd == "switch-ports":
-            if not args.all and not args.serial:
-                raise SystemExit("Provide either --serial <SERIAL> or --all")
-
-            switches = []
-            if args.all:
-                network_id = args.network_id or settings.network_id
-                # returns list of switch device statuses with name+serial
-                switches = rest_switch_health(client, settings.org_id, network_id)
-                # keep only items that actually have a serial
-                switches = [s for s in switches if s.get("serial")]
-            else:
-                serial = args.serial
-                dev = rest_get_device(client, serial)
-                switches = [{"serial": serial, "name": dev.get("name") or dev.get("mac") or ""}]
-
-            rows = []
-            for sw in switches:
-                serial = sw.get("serial")
-                sw_name = sw.get("name", "")
-                ports = rest_switch_ports(client, serial)
-
-                for p in ports:
-                    rows.append([
-                        sw_name,
-                        serial,
-                        p.get("portId"),
-                        p.get("status"),
-                        p.get("isUplink"),
-                        p.get("speed"),
-                        p.get("duplex"),
-                        _get_first(p, ["poe", "isAllocated"], ""),
-                        p.get("clientCount", ""),
-                        _join_list(_get_first(p, ["spanningTree", "statuses"], [])),
-                        len(p.get("errors", []) or []),
-                        len(p.get("warnings", []) or []),
-                    ])
-
-            rows = rows[: args.limit]
-            print_table(
-                ["Switch", "Serial", "Port", "Status", "Uplink", "Speed", "Duplex", "PoE", "Clients", "STP", "Errors", "Warnings"],
-                rows,
-                [22, 16, 5, 12, 6, 10, 6, 5, 7, 12, 6, 8],
-            )
+    if backend is not None and args.by == "network" and args.shard_by:
+        shard_failures: list = []
+        dist.add_rows(_iter_wifi_shards(args, settings, backend, network_id=args.network_id, limit=None, failures=shard_failures))
+        _print_shard_failures(shard_failures)
+    elif backend is not None and args.by == "network":
+        dist.add_rows(backend.wifi_signal(
+            settings.org_id, timespan=args.timespan, network_id=args.network_id, limit=None,
+        ))
+    elif backend is not None:
+        from meraki_usecase.fanout import materialize
 
-        elif args.cmd == "wifi-signal":
+        if args.serials:
+            serials = [s.strip() for s in args.serials.split(",") if s.strip()]
+        else:
             network_id = args.network_id or settings.network_id
-            serials = [s.strip() for s in args.serials.split(",")] if args.serials else None
+            serials = [d["serial"] for d in backend.ap_health(settings.org_id, network_id) if d.get("serial")]
 
-            data = rest_wifi_signal(
-                client,
-                settings.org_id,
-                timespan=args.timespan,
-                network_id=network_id,
-                serials=serials,
-            )[: args.limit]
-
-            # Response fields can evolve; we print common ones safely
-            rows = []
-            for r in data:
-                client = r.get("client") or {}
-                network = r.get("network") or {}
-
-                rows.append({
-                    "client_id": client.get("id", ""),
-                    "client_mac": client.get("mac", ""),
-                    "network_name": network.get("name", ""),
-                    "network_id": network.get("id", ""),
-                    "snr": r.get("snr", None),
-                    "rssi": r.get("rssi", None),
-                })
-
-            print_wifi_signal_rich(rows)
-
-        elif args.cmd == "network-clients":
-            network_id = args.network_id or settings.network_id
+        def fetch(serial: str):
+            # The byClient rows carry no AP serial, so per-AP stats need one (serial-filtered) query per AP.
+            return materialize(backend.fan_out_api.wifi_signal(settings.org_id, timespan=args.timespan, serials=[serial], limit=None))
 
-            conn_types = None
-            if args.conn == "wired":
-                conn_types = ["Wired"]
-            elif args.conn == "wireless":
-                conn_types = ["Wireless"]
+        failures = []
+        for r in backend.fan_out(fetch, serials, workers=args.workers or backend.workers):
+            if r.ok:
+                dist.add_rows(r.value, ap_serial=r.item)
+            else:
+                failures.append((r.item, r.error))
+        for serial, err in failures:
+            print(f"  AP {serial} skipped: {err}", file=sys.stderr)
+
+    if args.save:
+        dist.save(args.save)
+
+    records = dist.records(with_total=args.format == "table")
+    if args.format != "table":
+        _export(args, STATS_FIELDS, records)
+        return
+    _emit(args, WIFI_STATS_COLUMNS, records)
+    if args.histogram:
+        total = dist.total()
+        for label, h in (("SNR (dB)", total.snr), ("RSSI (dBm)", total.rssi)):
+            print(f"\n{label}, {h.count} sample(s)")
+            for line in text_histogram(h):
+                print(line)
+
+
+def _run(args, parser) -> None:
+    if args.cmd == "port-history":
+        _port_history(args)
+        return
+    if args.cmd == "wifi-stats" and args.offline:
+        if not args.merge:
+            parser.error("--offline needs at least one --merge PATH")
+        _wifi_stats(args, None, None)
+        return
 
-            data = rest_network_clients(
-                client,
-                network_id,
-                timespan=args.timespan,
-                connection_types=conn_types,
-            )[: args.limit]
-
-            rows = []
-            for c in data:
-                name = (
-                    c.get("description")
-                    or c.get("user")
-                    or c.get("dhcpHostname")
-                    or c.get("mdnsName")
-                    or ""
-                )
-                rows.append({
-                    "id": c.get("id", ""),
-                    "mac": c.get("mac", ""),
-                    "name": name,
-                    "status": c.get("status", ""),
-                    "usage": c.get("usage", {}) or {},
-                    "lastSeen": c.get("lastSeen", ""),
-                })
-            def _sort_key(row, field: str):
-                usage = row.get("usage") or {}
-                if field == "sent":
-                    return _kb_to_mb(usage.get("sent"))
-                if field == "recv":
-                    return _kb_to_mb(usage.get("recv"))
-                if field == "total":
-                    return _kb_to_mb(usage.get("sent")) + _kb_to_mb(usage.get("recv"))
-                if field == "name":
-                    return (row.get("name") or "").lower()
-                if field == "mac":
-                    return (row.get("mac") or "").lower()
-                if field == "lastSeen":
-                    # ISO-ish timestamps sort lexicographically fine when present
-                    return row.get("lastSeen") or ""
-                return 0
-
-            # default direction: numeric sorts descending
-            numeric = args.sort in ("total", "sent", "recv")
-            reverse = args.desc or numeric
-
-            rows.sort(key=lambda r: _sort_key(r, args.sort), reverse=reverse)
-
-            if args.top and args.top > 0:
-                rows = rows[: args.top]
+    settings = Settings()
+    if args.no_cache:
+        settings = replace(settings, cache_dir="")
 
+    from meraki_usecase.backends import load_backend
 
-            print_network_clients_rich(
-                rows,
-                title=f"Network Clients (REST) — {network_id}",
-                timespan_s=args.timespan,
-            )
+    backend = load_backend(args.mode, settings)
 
+    if args.cmd == "orgs":
+        _emit(args, ORG_COLUMNS, backend.organizations(limit=args.limit))
 
-    else:  # sdk
-        dashboard = build_dashboard(settings)
+    elif args.cmd == "inventory" and (args.resumable or args.partition_by):
+        _inventory_resumable(args, settings, backend)
 
-        if args.cmd == "orgs":
-            org_map = sdk_org_map(dashboard)
-            items = list(org_map.items())[: args.limit]
-            rows = [[name, oid] for name, oid in items]
-            print_table(["Name", "Org ID"], rows, [55, 22])
+    elif args.cmd == "inventory":
+        _emit(args, INVENTORY_COLUMNS, backend.inventory(settings.org_id, limit=args.limit))
 
-        elif args.cmd == "inventory":
-            devs = sdk_inventory(dashboard, settings.org_id)[: args.limit]
-            rows = [[d.get("serial"), d.get("model"), d.get("networkId"), d.get("claimedAt")] for d in devs]
-            print_table(["Serial", "Model", "Network ID", "Claimed At"], rows, [16, 10, 22, 25])
+    elif args.cmd == "switch-health":
+        network_id = args.network_id or settings.network_id
+        _emit(args, DEVICE_HEALTH_COLUMNS, backend.switch_health(settings.org_id, network_id, limit=args.limit))
 
-        elif args.cmd == "switch-health":
-            network_id = args.network_id or settings.network_id
-            devs = sdk_switch_health(dashboard, settings.org_id, network_id)[: args.limit]
-            rows = [[d.get("name"), d.get("serial"), d.get("model"), d.get("status"), d.get("lastReportedAt")] for d in devs]
-            print_table(["Name", "Serial", "Model", "Status", "Last Reported"], rows, [28, 16, 10, 10, 25])
-        
-        elif args.cmd == "ap-health":
-            network_id = args.network_id or settings.network_id
-            devs = sdk_ap_health(dashboard, settings.org_id, network_id)[: args.limit]
-            rows = [[d.get("name"), d.get("serial"), d.get("model"), d.get("status"), d.get("lastReportedAt")] for d in devs]
-            print_table(["Name", "Serial", "Model", "Status", "Last Reported"], rows, [28, 16, 10, 10, 25])
-        
-        elif args.cmd == "switch-ports":
-            if not args.all and not args.serial:
-                raise SystemExit("Provide either --serial <SERIAL> or --all")
-
-            switches = []
-            if args.all:
-                network_id = args.network_id or settings.network_id
-                switches = sdk_switch_health(dashboard, settings.org_id, network_id)
-                switches = [s for s in switches if s.get("serial")]
-            else:
-                serial = args.serial
-                dev = sdk_get_device(dashboard, serial)
-                switches = [{"serial": serial, "name": dev.get("name") or dev.get("mac") or ""}]
-
-            rows = []
-            for sw in switches:
-                serial = sw.get("serial")
-                sw_name = sw.get("name", "")
-                ports = sdk_switch_ports(dashboard, serial)
-
-                for p in ports:
-                    rows.append([
-                        sw_name,
-                        serial,
-                        p.get("portId"),
-                        p.get("status"),
-                        p.get("isUplink"),
-                        p.get("speed"),
-                        p.get("duplex"),
-                        _get_first(p, ["poe", "isAllocated"], ""),
-                        p.get("clientCount", ""),
-                        _join_list(_get_first(p, ["spanningTree", "statuses"], [])),
-                        len(p.get("errors", []) or []),
-                        len(p.get("warnings", []) or []),
-                    ])
-
-            rows = rows[: args.limit]
-            print_table(
-                ["Switch", "Serial", "Port", "Status", "Uplink", "Speed", "Duplex", "PoE", "Clients", "STP", "Errors", "Warnings"],
-                rows,
-                [22, 16, 5, 12, 6, 10, 6, 5, 7, 12, 6, 8],
-            )
+    elif args.cmd == "ap-health":
+        network_id = args.network_id or settings.network_id
+        _emit(args, DEVICE_HEALTH_COLUMNS, backend.ap_health(settings.org_id, network_id, limit=args.limit))
 
+    elif args.cmd == "switch-ports":
+        if not args.all and not args.org and not args.serial:
+            raise SystemExit("Provide either --serial <SERIAL>, --all or --org")
 
-        elif args.cmd == "wifi-signal":
+        switches = []
+        network_ids = None
+        if args.org:
+            switches = [s for s in backend.device_statuses(settings.org_id, product_types=["switch"]) if s.get("serial")]
+        elif args.all:
             network_id = args.network_id or settings.network_id
+            network_ids = [network_id]
+            # switch device statuses with name+serial; keep only items that actually have a serial
+            switches = [s for s in backend.switch_health(settings.org_id, network_id) if s.get("serial")]
+        else:
+            serial = args.serial
+            dev = backend.device(serial)
+            switches = [{"serial": serial, "name": dev.get("name") or dev.get("mac") or ""}]
+
+        failures: list = []
+        notes: list = []
+        with _live(args, _table_render(PORT_COLUMNS), total=len(switches), unit="switches") as live:
+            records = _iter_switch_port_records(
+                backend,
+                switches,
+                limit=args.limit,
+                workers=args.workers or backend.workers,
+                failures=failures,
+                # one switch is one request either way
+                org_id=settings.org_id if (args.all or args.org) and not args.no_bulk else None,
+                network_ids=network_ids,
+                notes=notes,
+                on_switch=live.advance if live else None,
+            )
+            _emit(args, PORT_COLUMNS, records, live=live)
+        for note in notes:
+            print(f"NOTE: {note}", file=sys.stderr)
+        _print_failures(failures)
+
+    elif args.cmd == "wifi-signal":
+        shard_failures: list = []
+        network_id = None if args.org else args.network_id or settings.network_id
+        if args.shard_by:
+            data = _iter_wifi_shards(args, settings, backend, network_id=network_id, limit=args.limit, failures=shard_failures)
+        else:
             serials = [s.strip() for s in args.serials.split(",")] if args.serials else None
 
-            data = sdk_wifi_signal(
-                dashboard,
+            data = backend.wifi_signal(
                 settings.org_id,
                 timespan=args.timespan,
                 network_id=network_id,
                 serials=serials,
-            )[: args.limit]
-
-            rows = []
-            for r in data:
-                client = r.get("client") or {}
-                network = r.get("network") or {}
-
-                rows.append({
-                    "client_id": client.get("id", ""),
-                    "client_mac": client.get("mac", ""),
-                    "network_name": network.get("name", ""),
-                    "network_id": network.get("id", ""),
-                    "snr": r.get("snr", None),
-                    "rssi": r.get("rssi", None),
-                })
+                limit=args.limit,
+            )
+        records = map(_wifi_record, data)
+
+        if args.format != "table":
+            _export(args, WIFI_SIGNAL_FIELDS, records)
+        else:
+            from meraki_usecase.live import live_enabled
+
+            print_wifi_signal_rich(records, progressive=live_enabled(args))
+        _print_shard_failures(shard_failures)
+
+    elif args.cmd == "wifi-stats":
+        _wifi_stats(args, settings, backend)
+
+    elif args.cmd == "network-clients":
+        from meraki_usecase.clients import CLIENT_FIELDS, iter_client_records, parse_sort_spec, rank_clients
+
+        network_id = args.network_id or settings.network_id
+
+        # Exports stream unsorted unless a sort/top is asked for; a full sort needs every row in memory.
+        sort = args.sort or ("total" if args.format == "table" or args.top else None)
+        spec = None
+        if sort:
+            try:
+                spec = parse_sort_spec(sort, descending=args.desc)
+            except ValueError as e:
+                parser.error(str(e))
+
+        conn_types = None
+        if args.conn == "wired":
+            conn_types = ["Wired"]
+        elif args.conn == "wireless":
+            conn_types = ["Wireless"]
+
+        # An explicit --sort/--top ranks every client, and --limit caps the rows shown. Otherwise
+        # --limit stops paging and the default table order applies to the rows fetched.
+        rank_all = bool(args.sort or args.top)
+        data = backend.network_clients(
+            network_id,
+            timespan=args.timespan,
+            connection_types=conn_types,
+            limit=None if rank_all else args.limit,
+        )
+        with _live(args) as live:
+            # Ranking needs every client first: the footer shows the fetch, the table follows.
+            records = iter_client_records(live.track(data) if live else data)
+            if spec:
+                top = (min(args.top, args.limit) if args.top > 0 else args.limit) if rank_all else 0
+                records = iter(rank_clients(records, spec, top=top) if args.limit > 0 else [])
+
+        if args.format != "table":
+            _export(args, CLIENT_FIELDS, (r.as_dict() for r in records))
+        else:
+            print_network_clients_rich(
+                records,
+                title=f"Network Clients ({backend.label}) — {network_id}",
+                timespan_s=args.timespan,
+            )
 
-            print_wifi_signal_rich(rows)
+    elif args.cmd == "watch":
+        from meraki_usecase.watch import CHANGE_FIELDS, AdaptiveInterval, watch_statuses
 
-        elif args.cmd == "network-clients":
+        network_ids = [args.network_id] if args.network_id else None
+        changes = watch_statuses(
+            lambda: backend.device_statuses(settings.org_id, network_ids=network_ids, product_types=args.product_type),
+            AdaptiveInterval(args.interval, min_s=args.min_interval, max_s=args.max_interval),
+            polls=args.polls,
+            report_gap_s=args.report_gap,
+        )
+        records = (c.as_dict() for c in changes)
+        try:
+            if args.format != "table":
+                _export(args, CHANGE_FIELDS, records, flush=True)
+            else:
+                sys.stdout.reconfigure(line_buffering=True)
+                _emit(args, WATCH_COLUMNS, records, progressive=False)
+        except KeyboardInterrupt:
+            pass
+
+    elif args.cmd == "backfill-ports":
+        import time
+        from meraki_usecase.port_store import MAX_LOOKBACK_S, PortStore, backfill, grid_windows, iso, parse_time
+
+        now = time.time()
+        until = parse_time(args.until) if args.until else now
+        since = parse_time(args.since) if args.since else until - args.days * 86400
+        if since < now - MAX_LOOKBACK_S:
+            since = now - MAX_LOOKBACK_S + args.window   # stay inside the API's 31-day lookback
+        windows = grid_windows(since, min(until, now), args.window)
+
+        if args.serial:
+            switches = [{"serial": s, "name": ""} for s in args.serial]
+        else:
             network_id = args.network_id or settings.network_id
-
-            conn_types = None
-            if args.conn == "wired":
-                conn_types = ["Wired"]
-            elif args.conn == "wireless":
-                conn_types = ["Wireless"]
-
-            data = sdk_network_clients(
-                dashboard,
-                network_id,
-                timespan=args.timespan,
-                connection_types=conn_types,
-            )[: args.limit]
-
-            rows = []
-            for c in data:
-                name = (
-                    c.get("description")
-                    or c.get("user")
-                    or c.get("dhcpHostname")
-                    or c.get("mdnsName")
-                    or ""
-                )
-                rows.append({
-                    "id": c.get("id", ""),
-                    "mac": c.get("mac", ""),
-                    "name": name,
-                    "status": c.get("status", ""),
-                    "usage": c.get("usage", {}) or {},
-                    "lastSeen": c.get("lastSeen", ""),
-                })
-
-            def _sort_key(row, field: str):
-                usage = row.get("usage") or {}
-                if field == "sent":
-                    return _kb_to_mb(usage.get("sent"))
-                if field == "recv":
-                    return _kb_to_mb(usage.get("recv"))
-                if field == "total":
-                    return _kb_to_mb(usage.get("sent")) + _kb_to_mb(usage.get("recv"))
-                if field == "name":
-                    return (row.get("name") or "").lower()
-                if field == "mac":
-                    return (row.get("mac") or "").lower()
-                if field == "lastSeen":
-                    # ISO-ish timestamps sort lexicographically fine when present
-                    return row.get("lastSeen") or ""
-                return 0
-
-            # default direction: numeric sorts descending
-            numeric = args.sort in ("total", "sent", "recv")
-            reverse = args.desc or numeric
-
-            rows.sort(key=lambda r: _sort_key(r, args.sort), reverse=reverse)
-
-            if args.top and args.top > 0:
-                rows = rows[: args.top]
-
-            print_network_clients_rich(
-                rows,
-                title=f"Network Clients (SDK) — {network_id}",
-                timespan_s=args.timespan,
+            switches = [s for s in backend.switch_health(settings.org_id, network_id) if s.get("serial")]
+
+        with PortStore(args.db or settings.port_db) as store:
+            api = backend.fan_out_api
+            result = backfill(
+                store,
+                lambda serial, t0, t1: api.switch_ports(serial, t0=t0, t1=t1),
+                switches,
+                windows,
+                workers=args.workers or backend.workers,
+                fan_out=backend.fan_out,
+            )
+        span = f"{iso(windows[0][0])} .. {iso(windows[-1][1])}" if windows else "no complete window"
+        print(f"{len(switches)} switch(es) x {len(windows)} window(s) ({span}): "
+              f"{result.fetched} fetched, {result.skipped} already stored, {len(result.failed)} failed")
+        for serial, (t0, _), err in result.failed[:20]:
+            print(f"  {serial} @ {iso(t0)}: {err}")
+
+    elif args.cmd == "sweep":
+        from meraki_usecase.sweep import SWEEP_PRODUCT_TYPES, run_sweep
+
+        api = backend.fan_out_api
+        # The table needs the totals, so it comes at the end; meanwhile the footer counts pages.
+        with _live(args, unit="networks") as live:
+            result = run_sweep(
+                lambda: backend.organizations(),
+                lambda org_id: api.networks(org_id),
+                lambda org_id, net_id: api.device_statuses(
+                    org_id, network_ids=[net_id], product_types=SWEEP_PRODUCT_TYPES,
+                ),
+                workers=args.workers or backend.workers,
+                per_org=args.per_org,
+                org_ids=args.org,
+                fan_out=backend.fan_out,
+                on_network=live.update if live else None,
             )
+        if args.format != "table":
+            _export(args, SWEEP_FIELDS, (asdict(n) for n in result.networks[: args.limit]))
+        else:
+            _print_sweep(result, args.limit)
 
 if __name__ == "__main__":
     main()
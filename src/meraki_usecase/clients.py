@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import heapq
+import sys
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+# Export columns, in order (sent/recv are KB, as the API reports them)
+CLIENT_FIELDS = ["id", "mac", "name", "status", "sent", "recv", "lastSeen"]
+
+
+def _kb(v: Any) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _client_name(c: Dict[str, Any]) -> str:
+    return (
+        c.get("description")
+        or c.get("user")
+        or c.get("dhcpHostname")
+        or c.get("mdnsName")
+        or ""
+    )
+
+
+@dataclass(slots=True)
+class ClientRecord:
+    """
+    One network client, reduced to the fields the CLI shows.
+
+    Slots and pre-parsed numbers keep a record at a few hundred bytes instead of
+    the multi-KB response dict, so 100k clients fit comfortably in memory.
+    """
+    id: str
+    mac: str
+    name: str
+    status: str
+    sent: float       # KB
+    recv: float       # KB
+    last_seen: str
+
+    @property
+    def total(self) -> float:
+        return self.sent + self.recv
+
+    @classmethod
+    def from_api(cls, c: Dict[str, Any]) -> "ClientRecord":
+        usage = c.get("usage") or {}
+        return cls(
+            c.get("id") or "",
+            c.get("mac") or "",
+            _client_name(c),
+            sys.intern(c.get("status") or ""),   # a handful of distinct values, shared across records
+            _kb(usage.get("sent")),
+            _kb(usage.get("recv")),
+            str(c.get("lastSeen") or ""),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "mac": self.mac,
+            "name": self.name,
+            "status": self.status,
+            "sent": self.sent,
+            "recv": self.recv,
+            "lastSeen": self.last_seen,
+        }
+
+
+def iter_client_records(clients: Iterable[Dict[str, Any]]) -> Iterator[ClientRecord]:
+    """Convert API dicts as they stream in; the response dict is dropped right after."""
+    for c in clients:
+        yield ClientRecord.from_api(c)
+
+
+# Sort fields for --sort. Numeric ones rank largest first unless told otherwise.
+_SORT_KEYS: Dict[str, Callable[[ClientRecord], Any]] = {
+    "total": lambda r: r.sent + r.recv,
+    "sent": attrgetter("sent"),
+    "recv": attrgetter("recv"),
+    "name": lambda r: r.name.lower(),
+    "mac": lambda r: r.mac.lower(),
+    "status": attrgetter("status"),
+    "lastSeen": attrgetter("last_seen"),   # ISO-ish timestamps sort lexicographically
+}
+SORT_FIELDS = list(_SORT_KEYS)
+NUMERIC_FIELDS = {"total", "sent", "recv"}
+
+SortSpec = List[Tuple[str, bool]]   # (field, descending)
+
+
+def parse_sort_spec(spec: str, *, descending: bool = False) -> SortSpec:
+    """
+    "total" / "-total,name" / "status,+mac" -> [(field, descending), ...].
+    "-" forces descending and "+" ascending. Unprefixed numeric fields default to
+    descending, text fields to ascending (or descending when `descending` is set).
+    """
+    out: SortSpec = []
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        sign, field = (part[0], part[1:]) if part[0] in "+-" else ("", part)
+        if field not in _SORT_KEYS:
+            raise ValueError(f"Unknown sort field: {field!r} (expected one of {', '.join(SORT_FIELDS)})")
+        desc = sign == "-" or (not sign and (descending or field in NUMERIC_FIELDS))
+        out.append((field, desc))
+    if not out:
+        raise ValueError("Empty sort spec")
+    return out
+
+
+class _Reversed:
+    """Inverts ordering for text keys sorted descending inside an ascending key tuple."""
+    __slots__ = ("v",)
+
+    def __init__(self, v: Any) -> None:
+        self.v = v
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.v < self.v
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.v == other.v
+
+
+def _key_func(spec: SortSpec) -> Callable[[ClientRecord], Any]:
+    parts = []
+    for field, desc in spec:
+        get = _SORT_KEYS[field]
+        if not desc:
+            parts.append(get)
+        elif field in NUMERIC_FIELDS:
+            parts.append(lambda r, get=get: -get(r))
+        else:
+            parts.append(lambda r, get=get: _Reversed(get(r)))
+    if len(parts) == 1:
+        return parts[0]
+    return lambda r: tuple(p(r) for p in parts)
+
+
+def rank_clients(records: Iterable[ClientRecord], spec: SortSpec, *, top: int = 0) -> List[ClientRecord]:
+    """
+    Sort clients by `spec`. Keys are computed once per record. With `top`, only
+    the best `top` records are kept while the input streams past (heap selection,
+    O(n log top)), so the full client list is never materialized.
+    Ties keep API order.
+    """
+    key = _key_func(spec)
+    if top and top > 0:
+        return heapq.nsmallest(top, records, key=key)
+    return sorted(records, key=key)
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+_env_loaded = False
+
+def _load_env() -> None:
+    # .env is read on first Settings() rather than at import time.
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+def _env(name: str, default: str) -> str:
+    _load_env()
+    return os.getenv(name, default)
 
 def _require(name: str) -> str:
+    _load_env()
     v = os.getenv(name)
     if not v:
         raise RuntimeError(f"Missing required env var: {name}")
     return v
 
+def port_db_path() -> str:
+    # Readable without the API settings: port-history queries work offline.
+    return _env("MERAKI_PORT_DB", "~/.cache/meraki-usecase/ports.sqlite3")
+
 @dataclass(frozen=True)
 class Settings:
-    api_key: str = _require("MERAKI_DASHBOARD_API_KEY")
-    org_id: str = _require("MERAKI_ORG_ID")
-    network_id: str = _require("MERAKI_NETWORK_ID")
-    base_url: str = os.getenv("MERAKI_DASHBOARD_BASE_URL", "https://api.meraki.com/api/v1")
-    timeout_s: int = int(os.getenv("MERAKI_REQUEST_TIMEOUT", "30"))
-    max_retries: int = int(os.getenv("MERAKI_MAX_RETRIES", "5"))
+    # default_factory: env vars are resolved when Settings() is built, not when this module is imported
+    api_key: str = field(default_factory=lambda: _require("MERAKI_DASHBOARD_API_KEY"))
+    org_id: str = field(default_factory=lambda: _require("MERAKI_ORG_ID"))
+    network_id: str = field(default_factory=lambda: _require("MERAKI_NETWORK_ID"))
+    base_url: str = field(default_factory=lambda: _env("MERAKI_DASHBOARD_BASE_URL", "https://api.meraki.com/api/v1"))
+    timeout_s: int = field(default_factory=lambda: int(_env("MERAKI_REQUEST_TIMEOUT", "30")))
+    max_retries: int = field(default_factory=lambda: int(_env("MERAKI_MAX_RETRIES", "5")))
+    max_workers: int = field(default_factory=lambda: int(_env("MERAKI_MAX_WORKERS", "8")))
+    async_concurrency: int = field(default_factory=lambda: int(_env("MERAKI_ASYNC_CONCURRENCY", "100")))  # --mode async: requests in flight
+    rate_limit: float = field(default_factory=lambda: float(_env("MERAKI_RATE_LIMIT", "10")))
+    cache_dir: str = field(default_factory=lambda: _env("MERAKI_CACHE_DIR", "~/.cache/meraki-usecase"))  # empty = no cache
+    cache_stale_s: int = field(default_factory=lambda: int(_env("MERAKI_CACHE_STALE_S", "0")))  # serve expired entries this long while refreshing
+    json_decoder: str = field(default_factory=lambda: _env("MERAKI_JSON_DECODER", "auto"))  # auto | json | orjson | stream (rest mode)
+    port_db: str = field(default_factory=port_db_path)   # SQLite store for backfill-ports / port-history
+    coalesce: bool = field(default_factory=lambda: _env("MERAKI_COALESCE", "1") not in ("0", "false", "no"))  # share identical in-flight GETs
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, List, Union
+
+try:   # optional: pip install "meraki-usecase[fast]"
+    import orjson
+except ImportError:
+    orjson = None
+
+# auto   = orjson when installed, else the stdlib json
+# stream = list pages are parsed item by item while the body downloads (never held whole)
+DECODERS = ["auto", "json", "orjson", "stream"]
+
+STREAM_CHUNK = 64 * 1024
+
+_WS = re.compile(r"[ \t\n\r]*")
+_SCALAR_END = re.compile(r"[ \t\n\r,\]]")
+_scan = json.JSONDecoder().scan_once   # (text, index) -> (value, end); C scanner, no whole-string checks
+
+
+def available() -> List[str]:
+    return [d for d in DECODERS if d != "orjson" or orjson is not None]
+
+
+def check_decoder(name: str) -> str:
+    if name not in DECODERS:
+        raise ValueError(f"Unknown JSON decoder: {name!r} (expected one of {', '.join(DECODERS)})")
+    if name == "orjson" and orjson is None:
+        raise ValueError("MERAKI_JSON_DECODER=orjson but orjson is not installed (pip install orjson)")
+    return name
+
+
+def loads(data: Union[bytes, str], decoder: str = "auto") -> Any:
+    """Decode a whole body. "stream" falls back to "auto" here (a single object has nothing to stream)."""
+    if orjson is not None and decoder != "json":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array as they are parsed from `chunks`
+    (e.g. Response.iter_content()). Only the current chunk and the element being
+    parsed are in memory. A body that is not an array yields nothing.
+    """
+    text = codecs.getincrementaldecoder("utf-8")()
+    it = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+    state = "start"   # start -> first (value or "]") -> sep ("," or "]") -> value -> sep ...
+
+    while True:
+        pos = _WS.match(buf, pos).end()
+        if pos >= len(buf):
+            if eof:
+                if state == "start":
+                    return
+                raise ValueError("truncated JSON array")
+            buf, pos, eof = _more(it, text, buf, pos)
+            continue
+
+        c = buf[pos]
+        if state == "start":
+            if c != "[":
+                return
+            pos += 1
+            state = "first"
+        elif state == "sep":
+            if c == "]":
+                return
+            if c != ",":
+                raise ValueError(f"expected ',' or ']' between array elements, got {c!r}")
+            pos += 1
+            state = "value"
+        else:
+            if c == "]" and state == "first":
+                return
+            if c not in '{["' and not eof and not _SCALAR_END.search(buf, pos):
+                # A number or literal ("-1." / "tr") could run on into the next chunk.
+                buf, pos, eof = _more(it, text, buf, pos)
+                continue
+            try:
+                obj, end = _scan(buf, pos)
+            except (json.JSONDecodeError, StopIteration):
+                if eof:
+                    raise ValueError(f"invalid JSON array element at {buf[pos:pos + 40]!r}") from None
+                # Objects, arrays and strings only fail here when cut off mid-element.
+                buf, pos, eof = _more(it, text, buf, pos)
+                continue
+            yield obj
+            # Compact bodies ("},{"): go straight on to the next element.
+            if buf.startswith(",", end):
+                pos = end + 1
+                state = "value"
+            else:
+                pos = end
+                state = "sep"
+
+
+def _more(it: Iterator[bytes], text: Any, buf: str, pos: int) -> Any:
+    """Drop what has been parsed and append the next chunk: (buf, pos, eof)."""
+    buf = buf[pos:]
+    for chunk in it:
+        if chunk:
+            return buf + text.decode(chunk), 0, False
+    return buf + text.decode(b"", final=True), 0, True
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+FORMATS = ["table", "ndjson", "csv"]
+
+
+@contextmanager
+def open_output(path: Optional[str], *, atomic: bool = True) -> Iterator[TextIO]:
+    """
+    `None` or "-" means stdout (not closed afterwards).
+
+    A file is written to a temporary file next to it and moved into place only when
+    the block completes, so a failed or interrupted fetch leaves an existing file
+    untouched. atomic=False writes the file directly, for streams meant to be tailed.
+    """
+    if not path or path == "-":
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    if not atomic:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            yield f
+        return
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; give the result the mode a plain open() would have
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp, mode)
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], out: TextIO, *, flush: bool = False) -> int:
+    """One JSON object per line, written as each record arrives. Returns the record count."""
+    n = 0
+    for r in records:
+        out.write(json.dumps(r, ensure_ascii=False, default=str))
+        out.write("\n")
+        if flush:
+            out.flush()
+        n += 1
+    return n
+
+
+def write_csv(records: Iterable[Dict[str, Any]], out: TextIO, fields: List[str], *, flush: bool = False) -> int:
+    """CSV with a fixed header; nested values are JSON-encoded into their cell."""
+    writer = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    n = 0
+    for r in records:
+        writer.writerow({
+            k: json.dumps(v, ensure_ascii=False, default=str) if isinstance(v, (dict, list)) else v
+            for k, v in r.items()
+        })
+        if flush:
+            out.flush()
+        n += 1
+    return n
+
+
+def write_records(records: Iterable[Dict[str, Any]], fmt: str, out: TextIO, fields: List[str], *, flush: bool = False) -> int:
+    """
+    Stream records to `out` without buffering them: memory stays constant no
+    matter how many records the pagination layer yields.
+    `flush` pushes every record out immediately (long-running streams such as watch).
+    """
+    if fmt == "ndjson":
+        return write_ndjson(records, out, flush=flush)
+    if fmt == "csv":
+        return write_csv(records, out, fields, flush=flush)
+    raise ValueError(f"Unknown export format: {fmt!r}")
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import GeneratorType
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+
+@dataclass
+class FanOutResult:
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def iter_fan_out(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    workers: int = 8,
+) -> Iterator[FanOutResult]:
+    """
+    Run fn(item) for every item on a bounded thread pool.
+
+    Results are yielded in input order (not completion order) so output stays
+    deterministic. A failing item yields a result with .error set instead of
+    aborting the whole run. Stopping iteration early cancels pending work.
+    """
+    items = list(items)
+
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            try:
+                yield FanOutResult(item, fn(item))
+            except Exception as e:
+                yield FanOutResult(item, error=e)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=min(workers, len(items)))
+    try:
+        futures = [pool.submit(fn, item) for item in items]
+        for item, fut in zip(items, futures):
+            try:
+                yield FanOutResult(item, fut.result())
+            except Exception as e:
+                yield FanOutResult(item, error=e)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def materialize(value: Any) -> Any:
+    """
+    List out a generator so its requests run here, on the worker, rather than lazily
+    wherever it is later consumed. Anything else (lists, coroutines) is returned as is.
+    """
+    return list(value) if isinstance(value, GeneratorType) else value
+
+
+def fan_out(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    workers: int = 8,
+) -> List[FanOutResult]:
+    return list(iter_fan_out(fn, items, workers=workers))
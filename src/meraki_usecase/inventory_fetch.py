@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from meraki_usecase.fanout import iter_fan_out
+
+PARTITION_KINDS = ["none", "network", "product"]
+
+# Product types /inventoryDevices can be filtered by. A device of a type missing here matches
+# no partition and is not fetched with --partition-by product (see uncovered_product_types);
+# "network" has no such gap.
+INVENTORY_PRODUCT_TYPES = [
+    "appliance", "camera", "campusGateway", "cellularGateway", "secureConnect", "sensor",
+    "switch", "systemsManager", "wireless", "wirelessController",
+]
+
+PER_PAGE = 1000
+
+# (path or next-page URL, params) -> (decoded page, next page URL or None)
+FetchPage = Callable[[str, Optional[Dict[str, Any]]], Tuple[Any, Optional[str]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS partitions (
+    name      TEXT PRIMARY KEY,
+    params    TEXT    NOT NULL,   -- JSON filters for the first page
+    next_url  TEXT,               -- where to carry on; NULL before the first page
+    pages     INTEGER NOT NULL DEFAULT 0,
+    done      INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS devices (
+    serial    TEXT PRIMARY KEY,   -- a device seen by two partitions is kept once
+    seq       INTEGER NOT NULL,
+    body      TEXT    NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def default_checkpoint(org_id: str) -> str:
+    return f"~/.cache/meraki-usecase/inventory-{org_id}.sqlite3"
+
+
+def make_partitions(kind: str, network_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Partition name -> inventoryDevices filters for its first page."""
+    if kind == "none":
+        return {"all": {}}
+    if kind == "product":
+        return {f"product:{p}": {"productTypes[]": [p]} for p in INVENTORY_PRODUCT_TYPES}
+    if kind == "network":
+        parts: Dict[str, Dict[str, Any]] = {f"network:{n}": {"networkIds[]": [n]} for n in network_ids or []}
+        # Claimed devices not added to any network match no networkIds[] filter.
+        parts["network:(none)"] = {"usedState": "unused"}
+        return parts
+    raise ValueError(f"Unknown partition kind: {kind!r} (expected one of {', '.join(PARTITION_KINDS)})")
+
+
+def uncovered_product_types(networks: List[Dict[str, Any]]) -> List[str]:
+    """
+    Product types the org's networks use that have no "product" partition. Devices of
+    those types are missing from a --partition-by product fetch. Unassigned devices of
+    an unknown type cannot be detected this way.
+    """
+    used = {p for n in networks for p in n.get("productTypes") or []}
+    return sorted(used - set(INVENTORY_PRODUCT_TYPES))
+
+
+@dataclass
+class InventoryResult:
+    pages: int = 0            # pages fetched by this run
+    resumed: int = 0          # partitions picked up from an earlier run's cursor
+    skipped: int = 0          # partitions an earlier run already finished
+    failed: List[Tuple[str, str]] = field(default_factory=list)   # (partition, error)
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed
+
+
+class InventoryCheckpoint:
+    """
+    SQLite file holding one org's inventory fetch in progress: every partition's
+    next-page cursor and every device received so far. Each page is stored together
+    with its cursor in one transaction, so a rerun carries on from the last stored
+    page and never fetches a page twice.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "InventoryCheckpoint":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def discard(self) -> None:
+        """Close and delete the file (after a complete fetch, or to start over)."""
+        self.close()
+        if self.path != ":memory:":
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(self.path + suffix):
+                    os.remove(self.path + suffix)
+
+    def bind(self, org_id: str, kind: str, partitions: Dict[str, Dict[str, Any]]) -> None:
+        """Record what this checkpoint is for, or check that it matches an existing one."""
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if meta and (meta.get("org_id"), meta.get("partition_by")) != (org_id, kind):
+            raise ValueError(
+                f"{self.path} holds an inventory fetch for org {meta.get('org_id')} partitioned by "
+                f"{meta.get('partition_by')}; use --fresh to discard it or --checkpoint for another file"
+            )
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO meta VALUES (?, ?)", [("org_id", org_id), ("partition_by", kind)])
+            # New networks since the first run become new partitions; finished ones stay finished.
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO partitions (name, params) VALUES (?, ?)",
+                [(name, json.dumps(params)) for name, params in partitions.items()],
+            )
+
+    def pending(self) -> List[Tuple[str, Dict[str, Any], Optional[str], int]]:
+        """(name, first-page params, next URL, pages so far) for every unfinished partition."""
+        rows = self.conn.execute("SELECT name, params, next_url, pages FROM partitions WHERE done = 0 ORDER BY name")
+        return [(name, json.loads(params), next_url, pages) for name, params, next_url, pages in rows]
+
+    def finished(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM partitions WHERE done = 1").fetchone()[0]
+
+    def store_page(self, partition: str, devices: List[Dict[str, Any]], next_url: Optional[str]) -> None:
+        with self.conn:
+            seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM devices").fetchone()[0]
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO devices (serial, seq, body) VALUES (?, ?, ?)",
+                [(d.get("serial") or f"{partition}#{seq + i}", seq + i + 1, json.dumps(d)) for i, d in enumerate(devices)],
+            )
+            self.conn.execute(
+                "UPDATE partitions SET next_url = ?, pages = pages + 1, done = ? WHERE name = ?",
+                (next_url, int(next_url is None), partition),
+            )
+
+    def devices(self) -> Iterator[Dict[str, Any]]:
+        """Every stored device, in the order first received."""
+        for (body,) in self.conn.execute("SELECT body FROM devices ORDER BY seq"):
+            yield json.loads(body)
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM devices").fetchone()[0]
+
+
+def fetch_inventory(
+    checkpoint: InventoryCheckpoint,
+    fetch_page: FetchPage,
+    org_id: str,
+    partitions: Dict[str, Dict[str, Any]],
+    *,
+    kind: str = "none",
+    workers: int = 8,
+    max_pages: Optional[int] = None,
+    on_page: Optional[Callable[[str, int], None]] = None,
+) -> InventoryResult:
+    """
+    Page through /organizations/{org_id}/inventoryDevices once per partition, all
+    partitions in parallel (one page each per round, on a bounded worker pool), and
+    store every page with its cursor in `checkpoint`. Partitions an earlier run
+    started continue from their stored cursor.
+
+    A partition whose page fails stops there and goes to `failed`; the others carry
+    on, and a rerun resumes the failed one. `max_pages` caps pages fetched by this
+    run (mainly to test resuming). `on_page(partition, pages)` reports progress.
+    """
+    checkpoint.bind(org_id, kind, partitions)
+    result = InventoryResult(skipped=checkpoint.finished())
+    path = f"/organizations/{org_id}/inventoryDevices"
+
+    # partition -> (URL, params) of its next page
+    todo: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+    pages_of: Dict[str, int] = {}
+    for name, params, next_url, pages in checkpoint.pending():
+        pages_of[name] = pages
+        if next_url:
+            todo[name] = (next_url, None)   # the next link carries the filters and cursor
+            result.resumed += 1
+        else:
+            todo[name] = (path, {**params, "perPage": PER_PAGE})
+
+    def fetch(name: str) -> Tuple[Any, Optional[str]]:
+        url, params = todo[name]
+        return fetch_page(url, params)
+
+    while todo:
+        batch = list(todo)
+        if max_pages is not None:
+            batch = batch[: max(0, max_pages - result.pages)]
+            if not batch:
+                break
+        for r in iter_fan_out(fetch, batch, workers=workers):
+            name = r.item
+            if not r.ok:
+                result.failed.append((name, str(r.error)))
+                del todo[name]
+                continue
+            page, next_url = r.value
+            checkpoint.store_page(name, page if isinstance(page, list) else [], next_url)
+            result.pages += 1
+            pages_of[name] += 1
+            if on_page is not None:
+                on_page(name, pages_of[name])
+            if next_url:
+                todo[name] = (next_url, None)
+            else:
+                del todo[name]
+
+    # Only a max_pages stop leaves partitions in todo.
+    result.failed.extend((name, f"stopped after {max_pages} page(s)") for name in todo)
+    return result
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
+
+from meraki_usecase.metrics import REGISTRY, RequestEvent
+
+T = TypeVar("T")
+
+# Rows held before they are printed. Bounds memory however long the output gets.
+WINDOW = 100
+# A row waits at most this long after the previous print (unless no other row arrives).
+FLUSH_S = 0.25
+
+# (rows, first chunk?) -> something rich can print: a str (printed as is) or a renderable
+Render = Callable[[List[Any], bool], Any]
+
+
+class LiveRows:
+    """
+    Print table rows while the fetch is still running, above a progress footer
+    (pages fetched, rows, elapsed time, and an ETA once `total` is known).
+
+    Rows are printed in chunks of at most `window`, so only one chunk is ever in
+    memory, and the first row shows up as soon as its page arrives. `render(rows,
+    first)` turns a chunk into text; `first` is True for the chunk that carries the
+    header. With unit="rows" the bar counts rows; otherwise the caller advance()s it
+    (e.g. once per switch, against total=len(switches)).
+
+    Use as a context manager. The footer is removed on exit; rows stay printed, also
+    when the fetch fails part way.
+    """
+
+    def __init__(
+        self,
+        render: Optional[Render] = None,
+        *,
+        total: Optional[int] = None,
+        unit: str = "rows",
+        window: int = WINDOW,
+        flush_s: float = FLUSH_S,
+        console: Any = None,
+    ) -> None:
+        self.render = render
+        self.total = total
+        self.unit = unit
+        self.window = max(1, window)
+        self.flush_s = flush_s
+        self.console = console
+        self.rows = 0
+        self.pages = 0
+        self._buffer: List[Any] = []
+        self._first = True
+        self._last_flush = 0.0
+        self._progress: Any = None
+        self._task: Any = None
+
+    def __enter__(self) -> "LiveRows":
+        from rich.progress import (
+            BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn,
+        )
+
+        self._progress = Progress(
+            SpinnerColumn(),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.description}"),
+            TextColumn("· {task.fields[pages]} page(s){task.fields[rows]}"),
+            TimeElapsedColumn(),
+            TextColumn("ETA"),
+            TimeRemainingColumn(),
+            console=self.console,
+            transient=True,
+        )
+        self.console = self._progress.console
+        self._task = self._progress.add_task(self.unit, total=self.total, pages=0, rows="")
+        REGISTRY.add_hook(self._on_request)
+        self._progress.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        REGISTRY.remove_hook(self._on_request)
+        try:
+            if self.render is not None and (self._buffer or self._first):
+                self.flush()
+        finally:
+            self._progress.stop()
+
+    def _on_request(self, event: RequestEvent) -> None:
+        # Any thread. One successful response = one page on list endpoints.
+        if 200 <= event.status < 300 or event.status == 304:
+            self.pages += 1
+            self._progress.update(self._task, pages=self.pages)
+
+    def advance(self, n: int = 1) -> None:
+        self._progress.advance(self._task, n)
+
+    def update(self, completed: int, total: Optional[int]) -> None:
+        """For callers that learn the total along the way (callback(done, total))."""
+        self._progress.update(self._task, completed=completed, total=total)
+
+    def add(self, row: Any) -> None:
+        self.rows += 1
+        if self.unit == "rows":
+            self._progress.update(self._task, completed=self.rows)
+        else:
+            self._progress.update(self._task, rows=f" · {self.rows} row(s)")
+        if self.render is None:
+            return
+        self._buffer.append(row)
+        if len(self._buffer) >= self.window or time.monotonic() - self._last_flush >= self.flush_s:
+            self.flush()
+
+    def flush(self) -> None:
+        out = self.render(self._buffer, self._first)
+        self._buffer = []
+        self._first = False
+        self._last_flush = time.monotonic()
+        if isinstance(out, str):
+            self.console.print(out, markup=False, highlight=False, emoji=False, soft_wrap=True)
+        else:
+            self.console.print(out)
+
+    def track(self, items: Iterable[T]) -> Iterator[T]:
+        """Count `items` as rows while passing them on (for output that needs every row first)."""
+        for item in items:
+            self.add(item)
+            yield item
+
+
+def live_enabled(args: Any) -> bool:
+    """Progressive rendering: table output on a terminal, unless --no-live."""
+    return args.format == "table" and not getattr(args, "no_live", False) and sys.stdout.isatty()
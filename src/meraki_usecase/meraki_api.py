@@ -3,12 +3,16 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from meraki_usecase.config import Settings
+from meraki_usecase.fanout import iter_fan_out
+from meraki_usecase.session_cache import SessionCache
+from meraki_usecase.snapshot import DeviceStatusSnapshot
 
 # REST mode pieces
-from meraki_usecase.restconf.meraki_rest import MerakiRestClient
+from meraki_usecase.restconf.meraki_rest import MerakiRestClient, build_client
 from meraki_usecase.restconf.orgs import org_id_to_name_map as rest_org_id_to_name_map
 from meraki_usecase.restconf.inventory import get_inventory_devices as rest_inventory
 from meraki_usecase.restconf.health import get_switch_health as rest_switch_health
+from meraki_usecase.restconf.health import get_device_status_snapshot as rest_snapshot
 from meraki_usecase.restconf.health_ap import get_ap_health as rest_ap_health
 from meraki_usecase.restconf.switch_ports import get_switch_ports_statuses as rest_switch_ports
 
@@ -17,6 +21,7 @@ from meraki_usecase.sdk.meraki_sdk import build_dashboard
 from meraki_usecase.sdk.orgs import org_id_to_name_map as sdk_org_id_to_name_map
 from meraki_usecase.sdk.inventory import get_inventory_devices as sdk_inventory
 from meraki_usecase.sdk.health import get_switch_health as sdk_switch_health
+from meraki_usecase.sdk.health import get_device_status_snapshot as sdk_snapshot
 from meraki_usecase.sdk.health_ap import get_ap_health as sdk_ap_health
 from meraki_usecase.sdk.switch_ports import get_switch_ports_statuses as sdk_switch_ports
 
@@ -82,70 +87,118 @@ def resolve_network_name_sdk(dashboard, network_id: str) -> str:
 
 
 # ---------------------------
-# Menu actions
+# Session data
 # ---------------------------
 
-def action_inventory(mode: str, client, dashboard, settings: Settings) -> None:
-    limit = int(input("Limit (default 50): ") or "50")
+# How long the menu reuses each dataset before fetching it again (seconds); "r" refreshes all.
+MENU_TTLS = {"names": 3600, "inventory": 600, "statuses": 60, "ports": 30}
+
+
+def build_session_data(mode: str, client, dashboard, settings: Settings) -> SessionCache:
+    data = SessionCache(workers=4)
+    if mode == "rest":
+        org_name = lambda: resolve_org_name_rest(client, settings.org_id)
+        net_name = lambda: resolve_network_name_rest(client, settings.network_id)
+        inventory = lambda: rest_inventory(client, settings.org_id)
+        statuses = lambda: rest_snapshot(client, settings.org_id)
+    else:
+        org_name = lambda: resolve_org_name_sdk(dashboard, settings.org_id)
+        net_name = lambda: resolve_network_name_sdk(dashboard, settings.network_id)
+        inventory = lambda: sdk_inventory(dashboard, settings.org_id)
+        statuses = lambda: sdk_snapshot(dashboard, settings.org_id)
+
+    data.register("org_name", org_name, MENU_TTLS["names"])
+    data.register("network_name", net_name, MENU_TTLS["names"])
+    data.register("inventory", inventory, MENU_TTLS["inventory"])
+    # Device statuses for the whole org, shared by actions 2-4.
+    data.register("statuses", statuses, MENU_TTLS["statuses"])
+    return data
+
+
+def register_ports(data: SessionCache, mode: str, client, dashboard, serial: str) -> str:
+    name = f"ports:{serial}"
     if mode == "rest":
-        devs = rest_inventory(client, settings.org_id)[:limit]
+        data.register(name, lambda: rest_switch_ports(client, serial), MENU_TTLS["ports"])
     else:
-        devs = sdk_inventory(dashboard, settings.org_id)[:limit]
+        data.register(name, lambda: sdk_switch_ports(dashboard, serial), MENU_TTLS["ports"])
+    return name
+
+
+def _print_age(data: SessionCache, name: str) -> None:
+    age = data.age(name)
+    if age is not None and age >= 1:
+        print(f"(data from {age:.0f}s ago, r = refresh)")
+
+
+# ---------------------------
+# Menu actions
+# ---------------------------
+
+def action_inventory(data: SessionCache) -> None:
+    limit = int(input("Limit (default 50): ") or "50")
+    devs = data.get("inventory")[:limit]
 
     rows = [[d.get("serial"), d.get("model"), d.get("networkId"), d.get("claimedAt")] for d in devs]
     print_table(["Serial", "Model", "Network ID", "Claimed At"], rows, [16, 10, 22, 25])
+    _print_age(data, "inventory")
 
-def action_switch_health(mode: str, client, dashboard, settings: Settings, network_id: str) -> None:
+def action_switch_health(mode: str, client, dashboard, settings: Settings, network_id: str, data: SessionCache) -> None:
     limit = int(input("Limit (default 50): ") or "50")
+    snapshot = data.get("statuses")
     if mode == "rest":
-        devs = rest_switch_health(client, settings.org_id, network_id)[:limit]
+        devs = rest_switch_health(client, settings.org_id, network_id, limit=limit, snapshot=snapshot)
     else:
-        devs = sdk_switch_health(dashboard, settings.org_id, network_id)[:limit]
+        devs = sdk_switch_health(dashboard, settings.org_id, network_id, limit=limit, snapshot=snapshot)
 
     rows = [[d.get("name"), d.get("serial"), d.get("model"), d.get("status"), d.get("lastReportedAt")] for d in devs]
     print_table(["Name", "Serial", "Model", "Status", "Last Reported"], rows, [28, 16, 10, 10, 25])
+    _print_age(data, "statuses")
 
-def action_ap_health(mode: str, client, dashboard, settings: Settings, network_id: str) -> None:
+def action_ap_health(mode: str, client, dashboard, settings: Settings, network_id: str, data: SessionCache) -> None:
     limit = int(input("Limit (default 50): ") or "50")
+    snapshot = data.get("statuses")
     if mode == "rest":
-        devs = rest_ap_health(client, settings.org_id, network_id)[:limit]
+        devs = rest_ap_health(client, settings.org_id, network_id, limit=limit, snapshot=snapshot)
     else:
-        devs = sdk_ap_health(dashboard, settings.org_id, network_id)[:limit]
+        devs = sdk_ap_health(dashboard, settings.org_id, network_id, limit=limit, snapshot=snapshot)
 
     rows = [[d.get("name"), d.get("serial"), d.get("model"), d.get("status"), d.get("lastReportedAt")] for d in devs]
     print_table(["Name", "Serial", "Model", "Status", "Last Reported"], rows, [28, 16, 10, 10, 25])
+    _print_age(data, "statuses")
 
-def action_switch_ports(mode: str, client, dashboard, settings: Settings, network_id: str) -> None:
+def action_switch_ports(mode: str, client, dashboard, settings: Settings, network_id: str, data: SessionCache) -> None:
     choice = input("1) Single switch by serial  2) All switches in network  (default 2): ") or "2"
     limit = int(input("Max rows (default 200): ") or "200")
 
+    snapshot: DeviceStatusSnapshot = data.get("statuses")
     switches: List[Dict[str, Any]] = []
     if choice.strip() == "1":
         serial = input("Enter switch serial (e.g. Q2XX-...): ").strip()
         if not serial:
             print("No serial provided.")
             return
-        # We can keep name blank (or you can add getDevice lookup later)
-        switches = [{"serial": serial, "name": ""}]
+        # Name comes from the org snapshot when the serial is known there
+        known = snapshot.get(serial) or {}
+        switches = [{"serial": serial, "name": known.get("name", "")}]
     else:
-        # Use switch health list as our switch list (name + serial)
-        if mode == "rest":
-            switches = rest_switch_health(client, settings.org_id, network_id)
-        else:
-            switches = sdk_switch_health(dashboard, settings.org_id, network_id)
+        # Use the snapshot's switch list (name + serial) instead of another statuses call
+        switches = snapshot.select(network_id=network_id, product_type="switch")
         switches = [s for s in switches if s.get("serial")]
 
-    rows: List[List[Any]] = []
-    for sw in switches:
-        serial = sw.get("serial")
-        sw_name = sw.get("name", "")
-
-        if mode == "rest":
-            ports = rest_switch_ports(client, serial)
-        else:
-            ports = sdk_switch_ports(dashboard, serial)
+    # Per switch, so reopening this view within MENU_TTLS["ports"] only fetches what expired.
+    def fetch_ports(sw: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return data.get(register_ports(data, mode, client, dashboard, sw.get("serial")))
 
-        for p in ports:
+    rows: List[List[Any]] = []
+    failures = []
+    for r in iter_fan_out(fetch_ports, switches, workers=settings.max_workers):
+        serial = r.item.get("serial")
+        sw_name = r.item.get("name", "")
+        if not r.ok:
+            failures.append((serial, r.error))
+            continue
+
+        for p in r.value or []:
             rows.append([
                 sw_name,
                 serial,
@@ -172,6 +225,11 @@ def action_switch_ports(mode: str, client, dashboard, settings: Settings, networ
         [22, 16, 5, 12, 6, 10, 6, 5, 7, 12, 6, 8],
     )
 
+    if failures:
+        print(f"\nWARNING: {len(failures)} switch(es) failed, results above are partial:")
+        for serial, err in failures:
+            print(f"  {serial}: {err}")
+
 
 # ---------------------------
 # Main interactive menu
@@ -187,18 +245,19 @@ def main() -> None:
     dashboard = None
 
     if mode == "rest":
-        client = MerakiRestClient(
-            base_url=settings.base_url,
-            api_key=settings.api_key,
-            timeout_s=settings.timeout_s,
-            max_retries=settings.max_retries,
-        )
-        org_name = resolve_org_name_rest(client, settings.org_id)
-        net_name = resolve_network_name_rest(client, settings.network_id)
+        client = build_client(settings)
     else:
         dashboard = build_dashboard(settings)
-        org_name = resolve_org_name_sdk(dashboard, settings.org_id)
-        net_name = resolve_network_name_sdk(dashboard, settings.network_id)
+
+    # Names resolve in parallel; inventory and statuses load while the menu is read.
+    data = build_session_data(mode, client, dashboard, settings)
+    data.prefetch("org_name", "network_name", "inventory", "statuses")
+    org_name = net_name = ""
+    try:
+        org_name = data.get("org_name")
+        net_name = data.get("network_name")
+    except Exception:
+        pass
 
     print("\n--- Current selection (from .env) ---")
     print(f"Mode      : {mode}")
@@ -208,32 +267,42 @@ def main() -> None:
     print(f"Net Name  : {net_name or '(not resolved)'}")
     print("------------------------------------\n")
 
-    while True:
-        print("Menu")
-        print(" 1) Inventory (org)")
-        print(" 2) Switch health (network)")
-        print(" 3) AP health (network)")
-        print(" 4) Switch ports (serial or all)")
-        print(" 0) Exit")
-        choice = input("Select (0-4): ").strip()
-
-        if choice == "0":
-            print("Bye.")
-            return
-
-        try:
-            if choice == "1":
-                action_inventory(mode, client, dashboard, settings)
-            elif choice == "2":
-                action_switch_health(mode, client, dashboard, settings, settings.network_id)
-            elif choice == "3":
-                action_ap_health(mode, client, dashboard, settings, settings.network_id)
-            elif choice == "4":
-                action_switch_ports(mode, client, dashboard, settings, settings.network_id)
-            else:
-                print("Unknown option.\n")
-        except Exception as e:
-            print(f"\nERROR: {e}\n")
+    try:
+        while True:
+            # Reload whatever expired (or failed) in the background while the menu is read.
+            data.prefetch("inventory", "statuses")
+
+            print("Menu")
+            print(" 1) Inventory (org)")
+            print(" 2) Switch health (network)")
+            print(" 3) AP health (network)")
+            print(" 4) Switch ports (serial or all)")
+            print(" r) Refresh data")
+            print(" 0) Exit")
+            choice = input("Select (0-4, r): ").strip().lower()
+
+            if choice == "0":
+                print("Bye.")
+                return
+
+            try:
+                if choice == "1":
+                    action_inventory(data)
+                elif choice == "2":
+                    action_switch_health(mode, client, dashboard, settings, settings.network_id, data)
+                elif choice == "3":
+                    action_ap_health(mode, client, dashboard, settings, settings.network_id, data)
+                elif choice == "4":
+                    action_switch_ports(mode, client, dashboard, settings, settings.network_id, data)
+                elif choice == "r":
+                    data.refresh()
+                    print("Cached data dropped; reloading in the background.\n")
+                else:
+                    print("Unknown option.\n")
+            except Exception as e:
+                print(f"\nERROR: {e}\n")
+    finally:
+        data.close()
 
 
 if __name__ == "__main__":
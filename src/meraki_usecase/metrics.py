@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from meraki_usecase.cache import api_path
+
+# Latency buckets (seconds), Prometheus style; +Inf is implied.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID_SEGMENT = re.compile(r"^/(organizations|networks|devices)/[^/]+")
+
+
+def endpoint_template(url: str) -> str:
+    """/organizations/123/devices/statuses -> /organizations/{id}/devices/statuses"""
+    return _ID_SEGMENT.sub(lambda m: f"/{m.group(1)}/{{id}}", api_path(url), count=1)
+
+
+@dataclass
+class RequestEvent:
+    """One HTTP attempt as seen by a backend (retries are separate events)."""
+    endpoint: str                 # endpoint_template() of the URL
+    method: str
+    status: int                   # 0 = no response (connection error / timeout)
+    seconds: Optional[float]      # None = not timed (e.g. retries urllib3 did inside one call)
+    nbytes: int = 0
+    retry: bool = False           # a repeat of an attempt that got 429 / 5xx / no response
+    retry_after_s: float = 0.0    # wait the server asked for on a 429
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, v: float) -> None:
+        self.counts[bisect_left(self.buckets, v)] += 1
+        self.sum += v
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate from the buckets (linear within a bucket), like PromQL histogram_quantile()."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= rank:
+                lo = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lo   # in +Inf: best we can say is "above the last bound"
+                return lo + (self.buckets[i] - lo) * (rank - seen) / c
+            seen += c
+        return self.buckets[-1]
+
+
+class _EndpointStats:
+    def __init__(self) -> None:
+        self.by_status: Dict[int, int] = {}
+        self.latency = Histogram()
+        self.retries = 0
+        self.throttled = 0
+        self.retry_after_s = 0.0
+        self.nbytes = 0
+        self.pages = 0
+
+
+class Metrics:
+    """
+    Process-wide request counters and latency histograms, per endpoint template.
+    Both backends record into REGISTRY; export with to_prometheus() / to_json(),
+    or serve them with serve_metrics().
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._hooks: List[Callable[[RequestEvent], None]] = []
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """Also pass every RequestEvent to `hook` (called on the requesting thread)."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        # New list rather than in-place removal: record() may be iterating the old one.
+        self._hooks = [h for h in self._hooks if h is not hook]
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            st = self._endpoints.get(event.endpoint)
+            if st is None:
+                st = self._endpoints[event.endpoint] = _EndpointStats()
+            st.by_status[event.status] = st.by_status.get(event.status, 0) + 1
+            if event.seconds is not None:
+                st.latency.observe(event.seconds)
+            st.nbytes += event.nbytes
+            st.retries += event.retry
+            if event.status == 429:
+                st.throttled += 1
+                st.retry_after_s += event.retry_after_s
+            if 200 <= event.status < 300 or event.status == 304:
+                st.pages += 1   # one per successful response, so one per page on list endpoints
+        for hook in self._hooks:
+            hook(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_json(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        with self._lock:
+            for endpoint, st in sorted(self._endpoints.items()):
+                h = st.latency
+                out[endpoint] = {
+                    "requests": sum(st.by_status.values()),
+                    "by_status": {str(k): v for k, v in sorted(st.by_status.items())},
+                    "pages": st.pages,
+                    "retries": st.retries,
+                    "throttled": st.throttled,
+                    "retry_after_s": round(st.retry_after_s, 3),
+                    "bytes": st.nbytes,
+                    "latency_s": {
+                        "sum": round(h.sum, 6),
+                        "p50": h.quantile(0.50),
+                        "p95": h.quantile(0.95),
+                        "p99": h.quantile(0.99),
+                        "buckets": {**{str(b): c for b, c in zip(h.buckets, _cumulative(h.counts))}, "+Inf": h.count},
+                    },
+                }
+        return out
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            items = sorted(self._endpoints.items())
+
+            family("meraki_requests_total", "counter", "HTTP attempts by endpoint and status (0 = no response)")
+            for ep, st in items:
+                for status, n in sorted(st.by_status.items()):
+                    lines.append(f'meraki_requests_total{{endpoint="{_esc(ep)}",status="{status}"}} {n}')
+
+            family("meraki_request_duration_seconds", "histogram", "Latency of one HTTP attempt")
+            for ep, st in items:
+                h = st.latency
+                for b, c in zip(h.buckets, _cumulative(h.counts)):
+                    lines.append(f'meraki_request_duration_seconds_bucket{{endpoint="{_esc(ep)}",le="{b}"}} {c}')
+                lines.append(f'meraki_request_duration_seconds_bucket{{endpoint="{_esc(ep)}",le="+Inf"}} {h.count}')
+                lines.append(f'meraki_request_duration_seconds_sum{{endpoint="{_esc(ep)}"}} {h.sum:.6f}')
+                lines.append(f'meraki_request_duration_seconds_count{{endpoint="{_esc(ep)}"}} {h.count}')
+
+            for name, attr, help_text in (
+                ("meraki_pages_total", "pages", "Successful responses (one per page on list endpoints)"),
+                ("meraki_retries_total", "retries", "Attempts that repeated a failed (429/5xx/no response) attempt"),
+                ("meraki_throttled_total", "throttled", "429 responses"),
+                ("meraki_retry_after_seconds_total", "retry_after_s", "Sum of Retry-After the API asked for"),
+                ("meraki_response_bytes_total", "nbytes", "Response body bytes"),
+            ):
+                family(name, "counter", help_text)
+                for ep, st in items:
+                    lines.append(f'{name}{{endpoint="{_esc(ep)}"}} {getattr(st, attr)}')
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Write to `path`: JSON for *.json, Prometheus text otherwise; "-" = stderr (Prometheus)."""
+        if path == "-":
+            import sys
+            sys.stderr.write(self.to_prometheus())
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump(self.to_json(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+
+def _cumulative(counts: List[int]) -> List[int]:
+    out, total = [], 0
+    for c in counts[:-1]:
+        total += c
+        out.append(total)
+    return out
+
+
+def _esc(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"')
+
+
+REGISTRY = Metrics()
+
+
+class RetryTracker:
+    """
+    For backends that retry internally (the SDK): an attempt is a retry when the
+    previous attempt on the same thread, for the same method + URL, failed.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def seen(self, method: str, url: str, status: int) -> bool:
+        key = (method.upper(), url)
+        retry = getattr(self._local, "failed", None) == key
+        self._local.failed = key if status == 0 or status == 429 or status >= 500 else None
+        return retry
+
+
+def serve_metrics(metrics: Metrics = REGISTRY, *, host: str = "127.0.0.1", port: int = 9464) -> Any:
+    """
+    Serve GET /metrics (Prometheus text) and /metrics.json on a background thread.
+    Returns the server; call .shutdown() to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] == "/metrics":
+                body, ctype = metrics.to_prometheus().encode(), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path.split("?")[0] == "/metrics.json":
+                body, ctype = json.dumps(metrics.to_json()).encode(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,629 @@
+"""
+Local stand-in for the Meraki Dashboard API, for offline runs and load tests.
+
+Serves synthetic orgs, networks, inventory, device statuses, switch ports,
+network clients and Wi-Fi signal quality under /api/v1, with Link-header
+pagination like the real API. Latency, per-org rate limiting (429 + Retry-After)
+and random 5xx errors are configurable.
+
+    python -m meraki_usecase.mock_server --port 8080 --networks 50 --switches 20 --aps 40
+    MERAKI_DASHBOARD_BASE_URL=http://127.0.0.1:8080/api/v1 meraki-usecase sweep
+
+Any API key is accepted. GET /_mock/stats returns request counters.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+API_PREFIX = "/api/v1"
+
+Query = Dict[str, List[str]]
+
+
+@dataclass
+class MockConfig:
+    orgs: int = 2
+    networks: int = 10            # per org
+    switches: int = 10            # per network
+    aps: int = 20                 # per network
+    clients: int = 100            # per network
+    ports: int = 24               # per switch
+    offline_ratio: float = 0.05   # share of devices not online
+    status_period_s: float = 0.0  # > 0: offline devices are re-drawn every period (for watch/diff testing)
+    latency_ms: float = 0.0       # added to every response
+    jitter_ms: float = 0.0        # +/- uniform on top of latency_ms
+    rate_limit: float = 10.0      # requests/second per org, 0 = unlimited
+    burst: int = 10               # bucket size for rate_limit
+    error_rate: float = 0.0       # share of requests answered with a random 5xx
+    bulk_ports: bool = True       # False: the org-level ports/statuses/bySwitch endpoint 404s
+    seed: int = 1
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _mac(rng: random.Random) -> str:
+    return ":".join(f"{rng.randrange(256):02x}" for _ in range(6))
+
+
+class MockDashboard:
+    """The synthetic dataset. Devices are built up front, clients per network on first use."""
+
+    def __init__(self, config: MockConfig) -> None:
+        self.config = config
+        self.started_at = time.time()
+        rng = random.Random(config.seed)
+
+        self.orgs: List[Dict[str, Any]] = []
+        self.networks: Dict[str, List[Dict[str, Any]]] = {}    # org id -> networks
+        self.devices: Dict[str, List[Dict[str, Any]]] = {}     # org id -> devices, sorted by serial
+        self.network_by_id: Dict[str, Dict[str, Any]] = {}
+        self.device_by_serial: Dict[str, Dict[str, Any]] = {}
+
+        net_index = 0
+        for o in range(config.orgs):
+            org_id = str(500000 + o)
+            self.orgs.append({
+                "id": org_id,
+                "name": f"Mock Org {o + 1}",
+                "url": f"https://n1.meraki.com/o/{org_id}/manage/organization/overview",
+                "api": {"enabled": True},
+            })
+            nets, devs = [], []
+            for n in range(config.networks):
+                net_id = f"L_{org_id}{n:05d}"
+                net = {
+                    "id": net_id,
+                    "organizationId": org_id,
+                    "name": f"Site {o + 1}-{n + 1:03d}",
+                    "productTypes": ["switch", "wireless"],
+                    "timeZone": "Europe/Zurich",
+                    "tags": [],
+                    "_index": net_index,
+                }
+                net_index += 1
+                nets.append(net)
+                self.network_by_id[net_id] = net
+                for kind, count, model, product in (
+                    ("MS", config.switches, "MS225-48LP", "switch"),
+                    ("MR", config.aps, "MR46", "wireless"),
+                ):
+                    for d in range(count):
+                        serial = f"Q{kind[1]}{o:02d}-{n:04d}-{d:04d}"
+                        devs.append({
+                            "serial": serial,
+                            "name": f"{kind}-{o + 1}-{n + 1:03d}-{d + 1:02d}",
+                            "mac": _mac(rng),
+                            "model": model,
+                            "productType": product,
+                            "networkId": net_id,
+                            "claimedAt": _iso(self.started_at - rng.randrange(30, 900) * 86400),
+                            "lanIp": f"10.{o}.{n % 256}.{d + 10}",
+                            "publicIp": f"198.51.100.{(n + d) % 254 + 1}",
+                            "_org": org_id,
+                        })
+            devs.sort(key=lambda d: d["serial"])
+            self.networks[org_id] = nets
+            self.devices[org_id] = devs
+            for d in devs:
+                self.device_by_serial[d["serial"]] = d
+
+        self._clients: Dict[str, List[Dict[str, Any]]] = {}
+        self._clients_lock = threading.Lock()
+
+    # ---- helpers
+
+    @staticmethod
+    def public(d: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in d.items() if not k.startswith("_")}
+
+    def org_of(self, path: str) -> Optional[str]:
+        """Which org a request counts against (for the per-org rate limit)."""
+        m = re.match(r"^/(organizations|networks|devices)/([^/]+)", path)
+        if not m:
+            return None
+        kind, ident = m.groups()
+        if kind == "organizations":
+            return ident
+        if kind == "networks":
+            net = self.network_by_id.get(ident)
+            return net["organizationId"] if net else None
+        dev = self.device_by_serial.get(ident)
+        return dev["_org"] if dev else None
+
+    def status_of(self, d: Dict[str, Any]) -> str:
+        period = self.config.status_period_s
+        epoch = int(time.time() // period) if period > 0 else 0
+        h = int(hashlib.md5(f"{self.config.seed}:{d['serial']}:{epoch}".encode()).hexdigest()[:8], 16)
+        if h / 0xFFFFFFFF >= self.config.offline_ratio:
+            return "online"
+        return ("offline", "alerting", "dormant")[h % 3]
+
+    def device_status(self, d: Dict[str, Any]) -> Dict[str, Any]:
+        status = self.status_of(d)
+        age = 60 if status == "online" else 3600 * 6
+        return {
+            "name": d["name"],
+            "serial": d["serial"],
+            "mac": d["mac"],
+            "publicIp": d["publicIp"],
+            "networkId": d["networkId"],
+            "status": status,
+            "lastReportedAt": _iso(time.time() - age),
+            "lanIp": d["lanIp"],
+            "productType": d["productType"],
+            "model": d["model"],
+            "tags": [],
+        }
+
+    def clients_of(self, net_id: str) -> List[Dict[str, Any]]:
+        with self._clients_lock:
+            cached = self._clients.get(net_id)
+            if cached is not None:
+                return cached
+            net = self.network_by_id[net_id]
+            rng = random.Random(f"{self.config.seed}:{net_id}")
+            org_devs = self.devices[net["organizationId"]]
+            switches = [d["serial"] for d in org_devs if d["networkId"] == net_id and d["productType"] == "switch"]
+            aps = [d["serial"] for d in org_devs if d["networkId"] == net_id and d["productType"] == "wireless"]
+            out = []
+            for i in range(self.config.clients):
+                wired = not aps or (switches and rng.random() < 0.4)
+                online = rng.random() > 0.2
+                sent = round(rng.lognormvariate(8, 2), 1)
+                recv = round(rng.lognormvariate(9, 2), 1)
+                out.append({
+                    "id": f"k{net['_index']:05d}{i:05d}",
+                    "mac": _mac(rng),
+                    "description": rng.choice([None, None, None, f"Desk {i}", f"Printer {i}"]),
+                    "ip": f"10.{net['_index'] % 256}.{i // 250}.{i % 250 + 2}",
+                    "user": None,
+                    "firstSeen": _iso(self.started_at - rng.randrange(1, 90) * 86400),
+                    "lastSeen": _iso(self.started_at - (rng.randrange(0, 600) if online else rng.randrange(3600, 86400))),
+                    "manufacturer": rng.choice(["Apple", "Dell", "HP", "Lenovo", "Samsung"]),
+                    "os": rng.choice(["macOS", "Windows 11", "iOS", "Android", None]),
+                    "recentDeviceSerial": rng.choice(switches if wired else aps) if (switches or aps) else None,
+                    "recentDeviceConnection": "Wired" if wired else "Wireless",
+                    "ssid": None if wired else "Corp",
+                    "vlan": "10",
+                    "switchport": str(rng.randrange(1, self.config.ports + 1)) if wired else None,
+                    "usage": {"sent": sent, "recv": recv, "total": round(sent + recv, 1)},
+                    "status": "Online" if online else "Offline",
+                    "dhcpHostname": f"host-{net['_index']}-{i}",
+                    "mdnsName": None,
+                    "_snr": rng.randrange(5, 55),
+                })
+            out.sort(key=lambda c: c["id"])
+            self._clients[net_id] = out
+            return out
+
+    def switch_ports(self, serial: str, timespan_s: float) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.config.seed}:{serial}")
+        scale = max(timespan_s, 1) / 86400
+        ports = []
+        for p in range(1, self.config.ports + 1):
+            uplink = p == self.config.ports
+            connected = uplink or rng.random() < 0.6
+            errors = ["CRC align errors"] if connected and rng.random() < 0.03 else []
+            sent_kb = round(rng.lognormvariate(10, 2) * scale, 1) if connected else 0
+            recv_kb = round(rng.lognormvariate(10, 2) * scale, 1) if connected else 0
+            ports.append({
+                "portId": str(p),
+                "enabled": True,
+                "status": "Connected" if connected else "Disconnected",
+                "isUplink": uplink,
+                "errors": errors,
+                "warnings": ["Port is running at half duplex"] if connected and rng.random() < 0.02 else [],
+                "speed": ("10 Gbps" if uplink else "1 Gbps") if connected else "",
+                "duplex": "full" if connected else "",
+                "usageInKb": {"total": round(sent_kb + recv_kb, 1), "sent": sent_kb, "recv": recv_kb},
+                "clientCount": (rng.randrange(1, 4) if connected and not uplink else 0),
+                "poe": {"isAllocated": connected and not uplink and rng.random() < 0.5},
+                "spanningTree": {"statuses": ["Forwarding"] if connected else []},
+            })
+        return ports
+
+
+def _multi(query: Query, name: str) -> List[str]:
+    # Array params arrive as name[]=a&name[]=b (requests / the SDK); accept plain name=a too.
+    return query.get(f"{name}[]", []) + query.get(name, [])
+
+
+def _one(query: Query, name: str, default: Optional[str] = None) -> Optional[str]:
+    vals = query.get(name)
+    return vals[0] if vals else default
+
+
+class _Bucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.last = time.monotonic()
+
+    def take(self) -> float:
+        """0 if a request may go through, else seconds until one could."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class MockState:
+    """Dataset plus the mutable bits shared by handler threads (rate buckets, counters)."""
+
+    def __init__(self, config: MockConfig) -> None:
+        self.config = config
+        self.data = MockDashboard(config)
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, _Bucket] = {}
+        self.stats: Dict[str, Any] = {"requests": 0, "by_status": {}, "by_route": {}, "bytes": 0}
+
+    def throttle(self, org_id: Optional[str]) -> float:
+        if self.config.rate_limit <= 0:
+            return 0.0
+        key = org_id or "global"
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = _Bucket(self.config.rate_limit, self.config.burst)
+            return bucket.take()
+
+    def count(self, route: str, status: int, nbytes: int) -> None:
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += nbytes
+            by_status = self.stats["by_status"]
+            by_status[str(status)] = by_status.get(str(status), 0) + 1
+            by_route = self.stats["by_route"]
+            by_route[route] = by_route.get(route, 0) + 1
+
+
+_EMBEDDED_URL = re.compile(r"^/[^?]*?(?=https?://)https?://[^/]+")
+
+
+class _NotFound(Exception):
+    pass
+
+
+# (path regex below /api/v1, route name, perPage default, perPage max); perPage None = not paginated
+_ROUTES: List[Tuple[re.Pattern, str, Optional[int], Optional[int]]] = [
+    (re.compile(r"^/organizations$"), "organizations", 9000, 9000),
+    (re.compile(r"^/organizations/(?P<org>[^/]+)$"), "organization", None, None),
+    (re.compile(r"^/organizations/(?P<org>[^/]+)/networks$"), "networks", 1000, 100000),
+    (re.compile(r"^/organizations/(?P<org>[^/]+)/(inventoryDevices|inventory/devices)$"), "inventoryDevices", 1000, 1000),
+    (re.compile(r"^/organizations/(?P<org>[^/]+)/devices/statuses$"), "devices/statuses", 1000, 1000),
+    (re.compile(r"^/organizations/(?P<org>[^/]+)/wireless/devices/signalQuality/byClient$"), "signalQuality/byClient", 1000, 1000),
+    (re.compile(r"^/organizations/(?P<org>[^/]+)/switch/ports/statuses/bySwitch$"), "switch/ports/statuses/bySwitch", 10, 20),
+    (re.compile(r"^/networks/(?P<net>[^/]+)$"), "network", None, None),
+    (re.compile(r"^/networks/(?P<net>[^/]+)/clients$"), "clients", 10, 5000),
+    (re.compile(r"^/devices/(?P<serial>[^/]+)$"), "device", None, None),
+    (re.compile(r"^/devices/(?P<serial>[^/]+)/switch/ports/statuses$"), "switch/ports/statuses", None, None),
+]
+
+
+# Paginated routes whose body is {"items": [...], "meta": {...}} rather than a bare list
+_WRAPPED_ROUTES = {"switch/ports/statuses/bySwitch"}
+
+
+def _items_for(data: MockDashboard, route: str, groups: Dict[str, str], query: Query) -> Tuple[Any, Optional[Callable[[Any], str]]]:
+    """Body for a route, plus the pagination key function when the body is a paginated list."""
+    if route == "organizations":
+        return data.orgs, lambda o: o["id"]
+
+    if route == "organization":
+        for o in data.orgs:
+            if o["id"] == groups["org"]:
+                return o, None
+        raise _NotFound()
+
+    if route in ("networks", "inventoryDevices", "devices/statuses", "signalQuality/byClient", "switch/ports/statuses/bySwitch"):
+        org_id = groups["org"]
+        if org_id not in data.networks:
+            raise _NotFound()
+
+        if route == "networks":
+            return [data.public(n) for n in data.networks[org_id]], lambda n: n["id"]
+
+        network_ids = set(_multi(query, "networkIds"))
+        serials = set(_multi(query, "serials"))
+
+        if route == "signalQuality/byClient":
+            out = []
+            for net in data.networks[org_id]:
+                if network_ids and net["id"] not in network_ids:
+                    continue
+                for c in data.clients_of(net["id"]):
+                    if c["recentDeviceConnection"] != "Wireless":
+                        continue
+                    if serials and c["recentDeviceSerial"] not in serials:
+                        continue
+                    out.append({
+                        "client": {"id": c["id"], "mac": c["mac"]},
+                        "network": {"id": net["id"], "name": net["name"]},
+                        "snr": c["_snr"],
+                        "rssi": c["_snr"] - 95,
+                    })
+            return out, lambda r: r["client"]["id"]
+
+        product_types = set(_multi(query, "productTypes"))
+        devs = [
+            d for d in data.devices[org_id]
+            if (not network_ids or d["networkId"] in network_ids)
+            and (not product_types or d["productType"] in product_types)
+            and (not serials or d["serial"] in serials)
+        ]
+        if route == "switch/ports/statuses/bySwitch":
+            if not data.config.bulk_ports:
+                raise _NotFound()
+            nets = {n["id"]: n for n in data.networks[org_id]}
+            return [
+                {
+                    "name": d["name"], "serial": d["serial"], "mac": d["mac"], "model": d["model"],
+                    "network": {"id": d["networkId"], "name": nets[d["networkId"]]["name"]},
+                    # Same ports as the per-device endpoint with its default timespan
+                    "ports": data.switch_ports(d["serial"], 86400),
+                }
+                for d in devs if d["productType"] == "switch"
+            ], lambda d: d["serial"]
+
+        if route == "inventoryDevices":
+            used = _one(query, "usedState")
+            if used:
+                devs = [d for d in devs if bool(d["networkId"]) == (used == "used")]
+            return [
+                {k: d[k] for k in ("serial", "name", "mac", "model", "productType", "networkId", "claimedAt")}
+                for d in devs
+            ], lambda d: d["serial"]
+
+        statuses = set(_multi(query, "statuses"))
+        out = [data.device_status(d) for d in devs]
+        if statuses:
+            out = [s for s in out if s["status"] in statuses]
+        return out, lambda d: d["serial"]
+
+    if route == "network":
+        net = data.network_by_id.get(groups["net"])
+        if net is None:
+            raise _NotFound()
+        return data.public(net), None
+
+    if route == "clients":
+        if groups["net"] not in data.network_by_id:
+            raise _NotFound()
+        conns = set(_multi(query, "recentDeviceConnections"))
+        clients = [data.public(c) for c in data.clients_of(groups["net"]) if not conns or c["recentDeviceConnection"] in conns]
+        return clients, lambda c: c["id"]
+
+    if route == "device":
+        dev = data.device_by_serial.get(groups["serial"])
+        if dev is None:
+            raise _NotFound()
+        return data.public(dev), None
+
+    if route == "switch/ports/statuses":
+        dev = data.device_by_serial.get(groups["serial"])
+        if dev is None or dev["productType"] != "switch":
+            raise _NotFound()
+        t0, t1 = _one(query, "t0"), _one(query, "t1")
+        try:
+            timespan = float(t1) - float(t0) if t0 and t1 else float(_one(query, "timespan", "86400"))
+        except ValueError:
+            timespan = 86400
+        return data.switch_ports(dev["serial"], timespan), None
+
+    raise _NotFound()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body are separate writes; avoid the ~40 ms delayed-ACK stall
+    server: "MockServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None, route: str = "") -> None:
+        raw = body if isinstance(body, bytes) else b"" if body is None else json.dumps(body, separators=(",", ":")).encode()
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+        self.server.state.count(route or "-", status, len(raw))
+
+    def do_GET(self) -> None:
+        state = self.server.state
+        cfg = state.config
+        # The SDK only trusts absolute Link URLs on *.meraki.com hosts and prefixes base_url
+        # to anything else ("/api/v1http://127.0.0.1:8080/api/v1/..."); unwrap those.
+        target = _EMBEDDED_URL.sub("", self.path)
+        u = urlparse(target)
+        query: Query = parse_qs(u.query, keep_blank_values=True)
+
+        if u.path == "/_mock/stats":
+            with state.lock:
+                body = json.loads(json.dumps(state.stats))
+            self._reply(200, body, route="_mock")
+            return
+
+        if not u.path.startswith(API_PREFIX):
+            self._reply(404, {"errors": ["Not found"]})
+            return
+        path = u.path[len(API_PREFIX):].rstrip("/") or "/"
+
+        auth = self.headers.get("X-Cisco-Meraki-API-Key") or self.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not auth:
+            self._reply(401, {"errors": ["Invalid API key"]})
+            return
+
+        for pattern, route, default_per_page, max_per_page in _ROUTES:
+            m = pattern.match(path)
+            if m:
+                break
+        else:
+            self._reply(404, {"errors": ["Not found"]})
+            return
+
+        wait = state.throttle(state.data.org_of(path))
+        if wait > 0:
+            self._reply(429, {"errors": ["API rate limit exceeded for organization"]},
+                        {"Retry-After": str(max(1, math.ceil(wait)))}, route)
+            return
+
+        delay = cfg.latency_ms + (random.uniform(-cfg.jitter_ms, cfg.jitter_ms) if cfg.jitter_ms else 0.0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        if cfg.error_rate and random.random() < cfg.error_rate:
+            status = random.choice((500, 502, 503))
+            self._reply(status, {"errors": ["Mock server error"]}, route=route)
+            return
+
+        try:
+            body, key = _items_for(state.data, route, m.groupdict(), query)
+        except _NotFound:
+            self._reply(404, {"errors": ["Not found"]}, route=route)
+            return
+
+        headers: Dict[str, str] = {}
+        if key is not None:
+            full = body
+            body, next_after = self._page(full, key, query, default_per_page or 1000, max_per_page or 1000)
+            if next_after is not None:
+                headers["Link"] = self._links(u.path, query, next_after)
+            if route in _WRAPPED_ROUTES:
+                remaining = sum(1 for x in full if key(x) > key(body[-1])) if body else 0
+                body = {"items": body, "meta": {"counts": {"items": {"total": len(full), "remaining": remaining}}}}
+
+        raw = json.dumps(body, separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha1(raw).hexdigest() + '"'
+        headers["ETag"] = etag
+        if self.headers.get("If-None-Match") == etag:
+            self._reply(304, None, headers, route)
+            return
+        self._reply(200, raw, headers, route)
+
+    @staticmethod
+    def _page(items: List[Any], key: Callable[[Any], str], query: Query, default: int, maximum: int) -> Tuple[List[Any], Optional[str]]:
+        try:
+            per_page = int(_one(query, "perPage", str(default)))
+        except ValueError:
+            per_page = default
+        per_page = max(3, min(per_page, maximum))
+
+        start = 0
+        after = _one(query, "startingAfter")
+        if after:
+            start = bisect_right([key(x) for x in items], after)
+        page = items[start:start + per_page]
+        more = start + per_page < len(items)
+        return page, (key(page[-1]) if more and page else None)
+
+    def _links(self, path: str, query: Query, next_after: str) -> str:
+        base = f"http://{self.headers.get('Host', '127.0.0.1')}{path}"
+        first = {k: v for k, v in query.items() if k not in ("startingAfter", "endingBefore")}
+        nxt = dict(first, startingAfter=[next_after])
+        return (
+            f'<{base}?{urlencode(first, doseq=True)}>; rel=first, '
+            f'<{base}?{urlencode(nxt, doseq=True)}>; rel=next'
+        )
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: Tuple[str, int], state: MockState) -> None:
+        super().__init__(address, MockHandler)
+        self.state = state
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+
+def serve_in_thread(config: Optional[MockConfig] = None, *, host: str = "127.0.0.1", port: int = 0) -> MockServer:
+    """Start a mock server on a background thread (port 0 = any free port). Call .shutdown() when done."""
+    server = MockServer((host, port), MockState(config or MockConfig()))
+    threading.Thread(target=server.serve_forever, name="meraki-mock", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    d = MockConfig()
+    parser = argparse.ArgumentParser(prog="meraki-usecase-mock", description="Local mock of the Meraki Dashboard API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--orgs", type=int, default=d.orgs)
+    parser.add_argument("--networks", type=int, default=d.networks, help="Networks per org")
+    parser.add_argument("--switches", type=int, default=d.switches, help="Switches per network")
+    parser.add_argument("--aps", type=int, default=d.aps, help="Access points per network")
+    parser.add_argument("--clients", type=int, default=d.clients, help="Clients per network")
+    parser.add_argument("--ports", type=int, default=d.ports, help="Ports per switch")
+    parser.add_argument("--offline-ratio", type=float, default=d.offline_ratio)
+    parser.add_argument("--status-period", type=float, default=d.status_period_s,
+                        help="Re-draw which devices are offline every N seconds (0 = never)")
+    parser.add_argument("--latency-ms", type=float, default=d.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=d.jitter_ms)
+    parser.add_argument("--rate-limit", type=float, default=d.rate_limit, help="Requests/second per org before 429 (0 = off)")
+    parser.add_argument("--burst", type=int, default=d.burst)
+    parser.add_argument("--error-rate", type=float, default=d.error_rate, help="Share of requests answered with a 5xx")
+    parser.add_argument("--no-bulk-ports", action="store_true", help="Answer the org-level switch ports endpoint with 404")
+    parser.add_argument("--seed", type=int, default=d.seed)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        orgs=args.orgs,
+        networks=args.networks,
+        switches=args.switches,
+        aps=args.aps,
+        clients=args.clients,
+        ports=args.ports,
+        offline_ratio=args.offline_ratio,
+        status_period_s=args.status_period,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        error_rate=args.error_rate,
+        bulk_ports=not args.no_bulk_ports,
+        seed=args.seed,
+    )
+    server = MockServer((args.host, args.port), MockState(config))
+    data = server.state.data
+    n_devices = sum(len(v) for v in data.devices.values())
+    print(f"Mock Meraki API on {server.base_url}  ({len(data.orgs)} orgs, {len(data.network_by_id)} networks, {n_devices} devices)")
+    print(f"  MERAKI_DASHBOARD_BASE_URL={server.base_url}  MERAKI_ORG_ID={data.orgs[0]['id']}  "
+          f"MERAKI_NETWORK_ID={data.networks[data.orgs[0]['id']][0]['id']}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+# Most Meraki list endpoints reject perPage below 3.
+MIN_PER_PAGE = 3
+
+
+def per_page_for(limit: Optional[int], max_per_page: int) -> int:
+    """Smallest page size that still fetches `limit` items in as few requests as possible."""
+    if not limit:
+        return max_per_page
+    return max(MIN_PER_PAGE, min(limit, max_per_page))
+
+
+def total_pages_for(limit: Optional[int], per_page: int) -> Any:
+    """SDK `total_pages` argument: just enough pages for `limit`, or "all"."""
+    if not limit:
+        return "all"
+    return -(-limit // per_page)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Backfill windows sit on a fixed grid, so "which windows are missing" has one answer.
+DEFAULT_WINDOW_S = 3600
+MAX_LOOKBACK_S = 31 * 86400   # the API rejects t0 older than 31 days
+
+Window = Tuple[int, int]   # (t0, t1) epoch seconds
+# (serial, t0, t1) -> port statuses for that window, as returned by the API
+FetchPorts = Callable[[str, str, str], List[Dict[str, Any]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS windows (
+    serial      TEXT    NOT NULL,
+    t0          INTEGER NOT NULL,
+    t1          INTEGER NOT NULL,
+    name        TEXT,
+    fetched_at  REAL    NOT NULL,
+    PRIMARY KEY (serial, t0, t1)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS port_samples (
+    serial        TEXT    NOT NULL,
+    port_id       TEXT    NOT NULL,
+    t0            INTEGER NOT NULL,
+    t1            INTEGER NOT NULL,
+    status        TEXT,
+    is_uplink     INTEGER,
+    speed         TEXT,
+    duplex        TEXT,
+    errors        TEXT,     -- JSON list
+    warnings      TEXT,     -- JSON list
+    error_count   INTEGER NOT NULL DEFAULT 0,
+    warning_count INTEGER NOT NULL DEFAULT 0,
+    poe           INTEGER,
+    client_count  INTEGER,
+    sent_kb       REAL,
+    recv_kb       REAL,
+    PRIMARY KEY (serial, port_id, t0, t1)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS port_samples_t0 ON port_samples (t0);
+"""
+
+HISTORY_FIELDS = [
+    "t0", "t1", "serial", "name", "portId", "status", "isUplink", "speed",
+    "errors", "warnings", "poe", "clientCount", "sentKb", "recvKb",
+]
+SUMMARY_FIELDS = [
+    "serial", "name", "portId", "windows", "errorWindows", "warningWindows", "poeWindows",
+    "firstError", "lastError", "sentKb", "recvKb",
+]
+
+
+def iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_time(v: str) -> int:
+    """ISO 8601 (Z or offset) or epoch seconds -> epoch seconds."""
+    try:
+        return int(float(v))
+    except ValueError:
+        return int(datetime.fromisoformat(v.replace("Z", "+00:00")).timestamp())
+
+
+def grid_windows(start: float, end: float, window_s: int = DEFAULT_WINDOW_S) -> List[Window]:
+    """Complete grid-aligned windows covering [start, end); the still-open window is left out."""
+    t = int(start // window_s) * window_s
+    out = []
+    while t + window_s <= end:
+        out.append((t, t + window_s))
+        t += window_s
+    return out
+
+
+@dataclass
+class BackfillResult:
+    fetched: int = 0          # windows fetched and stored
+    skipped: int = 0          # windows already in the store
+    failed: List[Tuple[str, Window, str]] = field(default_factory=list)   # (serial, window, error)
+
+
+class PortStore:
+    """
+    SQLite store of switch port status samples, one row per (serial, port, window).
+    The windows table records which (serial, window) pairs have been fetched, so a
+    backfill only asks the API for what is missing and history queries never do.
+    """
+
+    def __init__(self, path: str) -> None:
+        path = os.path.expanduser(path)
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "PortStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---- writes
+
+    def missing(self, serial: str, windows: Sequence[Window]) -> List[Window]:
+        if not windows:
+            return []
+        have = set(self.conn.execute(
+            "SELECT t0, t1 FROM windows WHERE serial = ? AND t0 >= ? AND t1 <= ?",
+            (serial, windows[0][0], windows[-1][1]),
+        ))
+        return [w for w in windows if w not in have]
+
+    def store(self, serial: str, window: Window, ports: List[Dict[str, Any]], *, name: str = "") -> None:
+        t0, t1 = window
+        rows = []
+        for p in ports:
+            usage = p.get("usageInKb") or {}
+            poe = p.get("poe") or {}
+            errors = p.get("errors") or []
+            warnings = p.get("warnings") or []
+            rows.append((
+                serial, str(p.get("portId")), t0, t1, p.get("status"), int(bool(p.get("isUplink"))),
+                p.get("speed"), p.get("duplex"), json.dumps(errors), json.dumps(warnings), len(errors), len(warnings),
+                int(bool(poe.get("isAllocated"))) if isinstance(poe, dict) else None,
+                p.get("clientCount"), usage.get("sent"), usage.get("recv"),
+            ))
+        with self.conn:   # one transaction per window: either all its ports are stored or none
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO port_samples VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)", rows,
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO windows VALUES (?,?,?,?,?)", (serial, t0, t1, name, time.time()),
+            )
+
+    # ---- reads (no API calls)
+
+    def history(
+        self,
+        *,
+        serials: Optional[List[str]] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        errors_only: bool = False,
+        poe_only: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        where, args = self._filters(serials, since, until)
+        if errors_only:
+            where.append("(s.error_count > 0 OR s.warning_count > 0)")
+        if poe_only:
+            where.append("s.poe = 1")
+        sql = (
+            "SELECT s.t0, s.t1, s.serial, w.name, s.port_id, s.status, s.is_uplink, s.speed, s.errors, s.warnings,"
+            " s.poe, s.client_count, s.sent_kb, s.recv_kb"
+            " FROM port_samples s JOIN windows w ON w.serial = s.serial AND w.t0 = s.t0 AND w.t1 = s.t1"
+            f" WHERE {' AND '.join(where) or '1'}"
+            " ORDER BY s.t0, s.serial, CAST(s.port_id AS INTEGER), s.port_id"
+        )
+        for r in self.conn.execute(sql, args):
+            yield {
+                "t0": iso(r[0]), "t1": iso(r[1]), "serial": r[2], "name": r[3] or "", "portId": r[4],
+                "status": r[5], "isUplink": bool(r[6]), "speed": r[7],
+                "errors": json.loads(r[8] or "[]"), "warnings": json.loads(r[9] or "[]"),
+                "poe": None if r[10] is None else bool(r[10]), "clientCount": r[11], "sentKb": r[12], "recvKb": r[13],
+            }
+
+    def summary(
+        self,
+        *,
+        serials: Optional[List[str]] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Per port over the stored windows: how often it had errors/warnings/PoE, and its traffic."""
+        where, args = self._filters(serials, since, until)
+        sql = (
+            "SELECT s.serial, MAX(w.name), s.port_id, COUNT(*),"
+            " SUM(s.error_count > 0), SUM(s.warning_count > 0), SUM(s.poe = 1),"
+            " MIN(CASE WHEN s.error_count > 0 THEN s.t0 END), MAX(CASE WHEN s.error_count > 0 THEN s.t1 END),"
+            " SUM(s.sent_kb), SUM(s.recv_kb)"
+            " FROM port_samples s JOIN windows w ON w.serial = s.serial AND w.t0 = s.t0 AND w.t1 = s.t1"
+            f" WHERE {' AND '.join(where) or '1'}"
+            " GROUP BY s.serial, s.port_id"
+            " ORDER BY SUM(s.error_count > 0) DESC, s.serial, CAST(s.port_id AS INTEGER), s.port_id"
+        )
+        for r in self.conn.execute(sql, args):
+            yield {
+                "serial": r[0], "name": r[1] or "", "portId": r[2], "windows": r[3],
+                "errorWindows": r[4], "warningWindows": r[5], "poeWindows": r[6],
+                "firstError": iso(r[7]) if r[7] is not None else "", "lastError": iso(r[8]) if r[8] is not None else "",
+                "sentKb": r[9], "recvKb": r[10],
+            }
+
+    @staticmethod
+    def _filters(serials: Optional[List[str]], since: Optional[int], until: Optional[int]) -> Tuple[List[str], List[Any]]:
+        where: List[str] = []
+        args: List[Any] = []
+        if serials:
+            where.append(f"s.serial IN ({','.join('?' * len(serials))})")
+            args.extend(serials)
+        if since is not None:
+            where.append("s.t1 > ?")
+            args.append(since)
+        if until is not None:
+            where.append("s.t0 < ?")
+            args.append(until)
+        return where, args
+
+
+def backfill(
+    store: PortStore,
+    fetch_ports: FetchPorts,
+    switches: List[Dict[str, Any]],
+    windows: List[Window],
+    *,
+    workers: int = 8,
+    fan_out: Optional[Callable[..., Any]] = None,
+) -> BackfillResult:
+    """
+    Fetch port statuses for every (switch, window) pair not yet in `store`, on a
+    bounded worker pool (or backend.fan_out). Results are written as they arrive (from
+    this thread, since the SQLite connection is not shared), so an interrupted backfill
+    keeps what it got.
+    """
+    from meraki_usecase.fanout import iter_fan_out
+
+    fan_out = fan_out or iter_fan_out
+
+    result = BackfillResult()
+    tasks = []
+    for sw in switches:
+        todo = store.missing(sw["serial"], windows)
+        result.skipped += len(windows) - len(todo)
+        tasks.extend((sw, w) for w in todo)
+
+    def fetch(task: Tuple[Dict[str, Any], Window]) -> Any:
+        sw, (t0, t1) = task
+        return fetch_ports(sw["serial"], iso(t0), iso(t1))
+
+    for r in fan_out(fetch, tasks, workers=workers):
+        sw, w = r.item
+        if not r.ok:
+            result.failed.append((sw["serial"], w, str(r.error)))
+            continue
+        store.store(sw["serial"], w, r.value or [], name=sw.get("name") or "")
+        result.fetched += 1
+    return result
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+# Meraki allows ~10 requests/second per organization.
+DEFAULT_RATE = 10.0
+
+_ORG_IN_PATH = re.compile(r"/organizations/([^/?#]+)")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace requests *before* they are sent.
+
+    Tokens may go negative: each caller reserves one token and sleeps for the
+    deficit, so concurrent callers are spaced out instead of all waking at once.
+    A 429 narrows the rate (multiplicative decrease) and blocks the bucket for
+    Retry-After seconds; quiet periods creep the rate back to the target.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: Optional[float] = None,
+        *,
+        min_rate: float = 1.0,
+        recover_after_s: float = 5.0,
+    ) -> None:
+        self.target_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self.min_rate = min(float(min_rate), self.target_rate)
+        self.recover_after_s = recover_after_s
+
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._last_change = self._last
+        self._lock = threading.Lock()
+
+    def _recover(self, now: float) -> None:
+        if self.rate < self.target_rate and now - self._last_change >= self.recover_after_s:
+            self.rate = min(self.target_rate, self.rate + self.target_rate * 0.1)
+            self._last_change = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller has to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._recover(now)
+
+            # _last may sit in the future while we are blocked by Retry-After.
+            if now > self._last:
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+            self._tokens -= 1.0
+            wait = max(0.0, self._last - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, retry_after_s: float) -> None:
+        """Called on 429: halve the rate and hold everyone until Retry-After has passed."""
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            self._tokens = min(self._tokens, 0.0)
+            self._last = max(self._last, now + max(0.0, retry_after_s))
+            self._last_change = now
+
+
+_LIMITERS: Dict[str, TokenBucket] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(key: str, *, rate: float = DEFAULT_RATE, burst: Optional[float] = None) -> TokenBucket:
+    """
+    Process-wide limiter registry. Every client/thread asking for the same key
+    shares one bucket; rate/burst only apply when the bucket is first created.
+    """
+    with _LIMITERS_LOCK:
+        bucket = _LIMITERS.get(key)
+        if bucket is None:
+            bucket = _LIMITERS[key] = TokenBucket(rate, burst)
+        return bucket
+
+
+def limiter_key(url: str, default_org: Optional[str] = None) -> str:
+    """
+    Meraki budgets are per organization. Paths like /organizations/{id}/... carry
+    the org; for /networks/... and /devices/... we fall back to the configured org.
+    """
+    m = _ORG_IN_PATH.search(url)
+    if m:
+        return m.group(1)
+    return default_org or "global"
+
+
+def retry_after_seconds(headers: Mapping[str, Any], default: float = 1.0) -> float:
+    v = headers.get("Retry-After")
+    if not v:
+        return default
+    try:
+        return max(0.0, float(v))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(v).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
@@ -1,12 +1,52 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 from meraki_usecase.restconf.meraki_rest import MerakiRestClient
+from meraki_usecase.snapshot import DeviceStatusSnapshot
 
-def get_switch_health(client: MerakiRestClient, org_id: str, network_id: str) -> List[Dict[str, Any]]:
+def iter_device_statuses(
+    client: MerakiRestClient,
+    org_id: str,
+    *,
+    network_ids: Optional[List[str]] = None,
+    product_types: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    # GET /organizations/{orgId}/devices/statuses (paginated, perPage up to 1000)
+    params: Dict[str, Any] = {}
+    if network_ids:
+        params["networkIds[]"] = network_ids
+    if product_types:
+        params["productTypes[]"] = product_types
+    return client.iter_items(
+        f"/organizations/{org_id}/devices/statuses",
+        params=params,
+        per_page=1000,
+        limit=limit,
+    )
+
+def get_device_status_snapshot(client: MerakiRestClient, org_id: str) -> DeviceStatusSnapshot:
+    # One paginated pass over the whole org; callers filter from the in-memory indexes.
+    return DeviceStatusSnapshot.from_items(org_id, iter_device_statuses(client, org_id))
+
+def iter_switch_health(
+    client: MerakiRestClient,
+    org_id: str,
+    network_id: str,
+    *,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
     # Filter to switches in one network
-    params = {
-        "networkIds[]": [network_id],
-        "productTypes[]": ["switch"],
-    }
-    return client.get(f"/organizations/{org_id}/devices/statuses", params=params)
+    return iter_device_statuses(client, org_id, network_ids=[network_id], product_types=["switch"], limit=limit)
+
+def get_switch_health(
+    client: MerakiRestClient,
+    org_id: str,
+    network_id: str,
+    *,
+    limit: Optional[int] = None,
+    snapshot: Optional[DeviceStatusSnapshot] = None,
+) -> List[Dict[str, Any]]:
+    if snapshot is not None:
+        return snapshot.select(network_id=network_id, product_type="switch", limit=limit)
+    return list(iter_switch_health(client, org_id, network_id, limit=limit))
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 from meraki_usecase.restconf.meraki_rest import MerakiRestClient
+from meraki_usecase.restconf.health import iter_device_statuses
+from meraki_usecase.snapshot import DeviceStatusSnapshot
 
-def get_ap_health(client: MerakiRestClient, org_id: str, network_id: str) -> List[Dict[str, Any]]:
+def iter_ap_health(
+    client: MerakiRestClient,
+    org_id: str,
+    network_id: str,
+    *,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
     # GET /organizations/{orgId}/devices/statuses?networkIds[]=...&productTypes[]=wireless
-    params = {
-        "networkIds[]": [network_id],
-        "productTypes[]": ["wireless"],
-    }
-    return client.get(f"/organizations/{org_id}/devices/statuses", params=params)
+    return iter_device_statuses(client, org_id, network_ids=[network_id], product_types=["wireless"], limit=limit)
+
+def get_ap_health(
+    client: MerakiRestClient,
+    org_id: str,
+    network_id: str,
+    *,
+    limit: Optional[int] = None,
+    snapshot: Optional[DeviceStatusSnapshot] = None,
+) -> List[Dict[str, Any]]:
+    if snapshot is not None:
+        return snapshot.select(network_id=network_id, product_type="wireless", limit=limit)
+    return list(iter_ap_health(client, org_id, network_id, limit=limit))
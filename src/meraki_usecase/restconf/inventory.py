@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 from meraki_usecase.restconf.meraki_rest import MerakiRestClient
 
-def get_inventory_devices(client: MerakiRestClient, org_id: str) -> List[Dict[str, Any]]:
-    # GET /organizations/{orgId}/inventoryDevices
-    return client.get(f"/organizations/{org_id}/inventoryDevices")
+def iter_inventory_devices(
+    client: MerakiRestClient,
+    org_id: str,
+    *,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    # GET /organizations/{orgId}/inventoryDevices (paginated, perPage up to 1000)
+    return client.iter_items(f"/organizations/{org_id}/inventoryDevices", per_page=1000, limit=limit)
+
+def get_inventory_devices(client: MerakiRestClient, org_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return list(iter_inventory_devices(client, org_id, limit=limit))
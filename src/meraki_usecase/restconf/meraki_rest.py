@@ -1,12 +1,41 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
+from meraki_usecase.cache import CacheEntry, ResponseCache, build_cache, canonical_request
+from meraki_usecase.decode import STREAM_CHUNK, check_decoder, iter_array, loads
+from meraki_usecase.metrics import REGISTRY, RequestEvent, endpoint_template
+from meraki_usecase.paging import per_page_for
+from meraki_usecase.rate_limit import DEFAULT_RATE, get_limiter, limiter_key, retry_after_seconds
+from meraki_usecase.singleflight import FLIGHTS
+
+if TYPE_CHECKING:
+    from meraki_usecase.config import Settings
+
+
+def _response_from_cache(entry: CacheEntry, url: str) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.reason = "OK"
+    resp.url = url
+    resp.headers = CaseInsensitiveDict(entry.headers)
+    resp.encoding = "utf-8"
+    resp._content = entry.body
+    return resp
+
+
+class _Retry(Retry):
+    # urllib3 would otherwise also retry (and sleep on) 429s that carry Retry-After,
+    # out of sight of the shared limiter; leave 429 to MerakiRestClient._send().
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
 
 @dataclass
 class MerakiRestClient:
@@ -14,6 +43,11 @@ class MerakiRestClient:
     api_key: str
     timeout_s: int = 30
     max_retries: int = 5
+    org_id: Optional[str] = None          # limiter key for paths without /organizations/{id}
+    rate_limit: float = DEFAULT_RATE      # requests/second per org, shared process-wide
+    cache: Optional[ResponseCache] = None
+    decoder: str = "auto"                 # decode.DECODERS; "stream" parses list pages while they download
+    coalesce: bool = True                 # identical GETs in flight at once share one request (singleflight.py)
 
     def __post_init__(self) -> None:
         self.session = requests.Session()
@@ -23,13 +57,14 @@ class MerakiRestClient:
             "Content-Type": "application/json",
         })
 
-        retry = Retry(
+        # 429 is handled in _send() so the shared limiter can see Retry-After.
+        retry = _Retry(
             total=self.max_retries,
             connect=self.max_retries,
             read=self.max_retries,
             status=self.max_retries,
             backoff_factor=0.5,
-            status_forcelist=(429, 500, 502, 503, 504),
+            status_forcelist=(500, 502, 503, 504),
             allowed_methods=("GET", "POST", "PUT", "DELETE", "PATCH"),
             respect_retry_after_header=True,
         )
@@ -38,16 +73,185 @@ class MerakiRestClient:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
+    def _url(self, path: str) -> str:
+        return f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
+
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        *,
+        stream: bool = False,
+    ) -> requests.Response:
+        limiter = get_limiter(limiter_key(url, self.org_id), rate=self.rate_limit)
+        endpoint = endpoint_template(url)
+
+        for attempt in range(max(self.max_retries, 0) + 1):
+            limiter.acquire()
+            t = time.perf_counter()
+            try:
+                resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout_s, stream=stream)
+            except requests.RequestException:
+                REGISTRY.record(RequestEvent(endpoint, "GET", 0, time.perf_counter() - t, retry=attempt > 0))
+                raise
+            # 5xx attempts urllib3 already retried inside the adapter (untimed)
+            history = getattr(getattr(resp.raw, "retries", None), "history", None) or ()
+            for i, h in enumerate(history):
+                REGISTRY.record(RequestEvent(endpoint, "GET", h.status or 0, None, retry=attempt > 0 or i > 0))
+            wait = retry_after_seconds(resp.headers, default=0.5 * 2 ** attempt) if resp.status_code == 429 else 0.0
+            # A streamed body has not been read yet; count what the server says it is sending.
+            nbytes = int(resp.headers.get("Content-Length") or 0) if stream else len(resp.content)
+            REGISTRY.record(RequestEvent(
+                endpoint, "GET", resp.status_code, time.perf_counter() - t, nbytes,
+                retry=attempt > 0 or bool(history), retry_after_s=wait,
+            ))
+            if resp.status_code != 429 or attempt == self.max_retries:
+                return resp
+            resp.close()
+            limiter.penalize(wait)
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        if self.cache is None:
+            return self._send(url, params=params)
+        return self.cache.fetch(
+            "GET",
+            url,
+            params,
+            lambda headers: self._send(url, params=params, headers=headers or None),
+            lambda entry: _response_from_cache(entry, url),
+        )
+
+    def _coalesced(self, url: str, params: Optional[Dict[str, Any]], fn: Callable[[], Any]) -> Any:
+        if not self.coalesce:
+            return fn()
+        # The API key is part of the key: two clients with different keys may see different data.
+        # "rest": sdk hooks share raw responses under the same request, not decoded pages.
+        return FLIGHTS.do(("rest", self.api_key, canonical_request("GET", url, params)), fn)
+
+    def _page(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Optional[str]]:
+        """GET one page: (decoded body, next page URL). Shared with concurrent identical GETs."""
+        def fetch() -> Tuple[Any, Optional[str]]:
+            resp = self._fetch(url, params=params)
+            resp.raise_for_status()
+            return loads(resp.content, self.decoder), resp.links.get("next", {}).get("url")
+
+        return self._coalesced(url, params, fetch)
+
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
-        resp = self.session.get(url, params=params, timeout=self.timeout_s)
-        resp.raise_for_status()
-        return resp.json()
+        return self._page(self._url(path), params)[0]
+
+    def get_page(self, path_or_url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Optional[str]]:
+        """One page: (decoded body, next page URL). Takes a path, or a next-page URL from an earlier call."""
+        url = path_or_url if path_or_url.startswith(("http://", "https://")) else self._url(path_or_url)
+        return self._page(url, params)
     
     def get_response(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
-        resp = self.session.get(url, params=params, timeout=self.timeout_s)
+        resp = self._fetch(self._url(path), params=params)
         resp.raise_for_status()
         return resp
 
+    def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield the decoded body of each page, following RFC5988 `Link: <...>; rel="next"`.
+        Pages are fetched lazily: the next request only goes out when the caller asks for it.
+        """
+        url: Optional[str] = self._url(path)
+        page_params = params
+        pages = 0
+
+        while url:
+            # The next link already carries the full query (filters, perPage, startingAfter).
+            page, url = self._page(url, page_params)
+            yield page
+
+            pages += 1
+            if max_pages is not None and pages >= max_pages:
+                return
+            page_params = None
+
+    def _iter_streamed_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Iterator[Any]]:
+        """
+        Like iter_pages(), but each page is an iterator over its items, parsed from the
+        response stream as it downloads. The whole body is never held in memory, so
+        streamed pages are never coalesced.
+        """
+        url: Optional[str] = self._url(path)
+        page_params = params
+        pages = 0
+
+        while url:
+            resp = self._send(url, params=page_params, stream=True)
+            try:
+                resp.raise_for_status()
+                yield iter_array(resp.iter_content(STREAM_CHUNK))
+            finally:
+                resp.close()   # also when the caller stops mid-page
+
+            pages += 1
+            if max_pages is not None and pages >= max_pages:
+                return
+
+            url = resp.links.get("next", {}).get("url")
+            page_params = None
+
+    def iter_items(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        per_page: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield list items one at a time across all pages; only one page is held in memory.
+        With `limit`, perPage is shrunk to fit and no page is requested once enough items are in hand.
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        params = dict(params or {})
+        if per_page:
+            params["perPage"] = per_page_for(limit, per_page)
+
+        # Cached endpoints need the whole body to store it, so they are never streamed.
+        streamed = self.decoder == "stream" and (self.cache is None or not self.cache.ttl_for(self._url(path)))
+        pages = (self._iter_streamed_pages if streamed else self.iter_pages)(path, params, max_pages=max_pages)
+
+        n = 0
+        for page in pages:
+            if not streamed and not isinstance(page, list):
+                # Very defensive: if API returns unexpected structure
+                break
+            for item in page:
+                yield item
+                n += 1
+                if limit is not None and n >= limit:
+                    return
+
 
+def build_client(settings: "Settings") -> MerakiRestClient:
+    return MerakiRestClient(
+        base_url=settings.base_url,
+        api_key=settings.api_key,
+        timeout_s=settings.timeout_s,
+        max_retries=settings.max_retries,
+        org_id=settings.org_id,
+        rate_limit=settings.rate_limit,
+        cache=build_cache(settings),
+        decoder=check_decoder(settings.json_decoder),
+        coalesce=settings.coalesce,
+    )
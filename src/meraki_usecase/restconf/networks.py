@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional
+from meraki_usecase.restconf.meraki_rest import MerakiRestClient
+
+def iter_networks(client: MerakiRestClient, org_id: str, *, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    # GET /organizations/{orgId}/networks (paginated, perPage up to 100000)
+    return client.iter_items(f"/organizations/{org_id}/networks", per_page=100000, limit=limit)
+
+def get_networks(client: MerakiRestClient, org_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return list(iter_networks(client, org_id, limit=limit))
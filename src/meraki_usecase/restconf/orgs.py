@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional
 from meraki_usecase.restconf.meraki_rest import MerakiRestClient
 
-def get_organizations(client: MerakiRestClient) -> List[Dict[str, Any]]:
-    return client.get("/organizations")
+def iter_organizations(client: MerakiRestClient, *, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    # GET /organizations (paginated, perPage up to 9000)
+    return client.iter_items("/organizations", per_page=9000, limit=limit)
 
-def org_name_to_id_map(client: MerakiRestClient) -> Dict[str, str]:
-    orgs = get_organizations(client)
-    return {o["name"]: o["id"] for o in orgs}
+def get_organizations(client: MerakiRestClient, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return list(iter_organizations(client, limit=limit))
 
-def org_id_to_name_map(client: MerakiRestClient) -> Dict[str, str]:
-    orgs = get_organizations(client)
-    return {o["id"]: o["name"] for o in orgs}
+def org_name_to_id_map(client: MerakiRestClient, *, limit: Optional[int] = None) -> Dict[str, str]:
+    return {o["name"]: o["id"] for o in iter_organizations(client, limit=limit)}
+
+def org_id_to_name_map(client: MerakiRestClient, *, limit: Optional[int] = None) -> Dict[str, str]:
+    return {o["id"]: o["name"] for o in iter_organizations(client, limit=limit)}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from meraki_usecase.restconf.meraki_rest import MerakiRestClient
 
 def get_device(client: MerakiRestClient, serial: str) -> Dict[str, Any]:
@@ -19,3 +19,21 @@ def get_switch_ports_statuses(
     if t1:
         params["t1"] = t1
     return client.get(f"/devices/{serial}/switch/ports/statuses", params=params)
+
+def iter_org_switch_ports_by_switch(
+    client: MerakiRestClient,
+    org_id: str,
+    *,
+    network_ids: Optional[List[str]] = None,
+    serials: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    # GET /organizations/{orgId}/switch/ports/statuses/bySwitch (paginated, perPage 3-20)
+    # One item per switch: name, serial, network, model and its "ports" (same fields as the per-device call).
+    params: Dict[str, Any] = {"perPage": 20}
+    if network_ids:
+        params["networkIds[]"] = network_ids
+    if serials:
+        params["serials[]"] = serials
+    for page in client.iter_pages(f"/organizations/{org_id}/switch/ports/statuses/bySwitch", params=params):
+        # Body is {"items": [...], "meta": {...}}
+        yield from (page.get("items") or []) if isinstance(page, dict) else page
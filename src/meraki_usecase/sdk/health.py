@@ -1,11 +1,44 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import meraki
+from meraki_usecase.sdk.meraki_sdk import call_paginated
+from meraki_usecase.snapshot import DeviceStatusSnapshot
 
-def get_switch_health(dashboard: meraki.DashboardAPI, org_id: str, network_id: str) -> List[Dict[str, Any]]:
-    return dashboard.organizations.getOrganizationDevicesStatuses(
+def get_device_statuses(
+    dashboard: meraki.DashboardAPI,
+    org_id: str,
+    *,
+    network_ids: Optional[List[str]] = None,
+    product_types: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    kwargs: Dict[str, Any] = {}
+    if network_ids:
+        kwargs["networkIds"] = network_ids
+    if product_types:
+        kwargs["productTypes"] = product_types
+    return call_paginated(dashboard.organizations.getOrganizationDevicesStatuses, org_id, limit=limit, **kwargs)
+
+def get_device_status_snapshot(dashboard: meraki.DashboardAPI, org_id: str) -> DeviceStatusSnapshot:
+    # One paginated pass over the whole org; callers filter from the in-memory indexes.
+    devices = get_device_statuses(dashboard, org_id)
+    return DeviceStatusSnapshot.from_items(org_id, devices)
+
+def get_switch_health(
+    dashboard: meraki.DashboardAPI,
+    org_id: str,
+    network_id: str,
+    *,
+    limit: Optional[int] = None,
+    snapshot: Optional[DeviceStatusSnapshot] = None,
+) -> List[Dict[str, Any]]:
+    if snapshot is not None:
+        return snapshot.select(network_id=network_id, product_type="switch", limit=limit)
+    return call_paginated(
+        dashboard.organizations.getOrganizationDevicesStatuses,
         org_id,
         networkIds=[network_id],
         productTypes=["switch"],
+        limit=limit,
     )
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import meraki
+from meraki_usecase.sdk.meraki_sdk import call_paginated
+from meraki_usecase.snapshot import DeviceStatusSnapshot
 
-def get_ap_health(dashboard: meraki.DashboardAPI, org_id: str, network_id: str) -> List[Dict[str, Any]]:
-    return dashboard.organizations.getOrganizationDevicesStatuses(
+def get_ap_health(
+    dashboard: meraki.DashboardAPI,
+    org_id: str,
+    network_id: str,
+    *,
+    limit: Optional[int] = None,
+    snapshot: Optional[DeviceStatusSnapshot] = None,
+) -> List[Dict[str, Any]]:
+    if snapshot is not None:
+        return snapshot.select(network_id=network_id, product_type="wireless", limit=limit)
+    return call_paginated(
+        dashboard.organizations.getOrganizationDevicesStatuses,
         org_id,
         networkIds=[network_id],
         productTypes=["wireless"],
+        limit=limit,
     )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import meraki
+from meraki_usecase.sdk.meraki_sdk import call_paginated
 
-def get_inventory_devices(dashboard: meraki.DashboardAPI, org_id: str) -> List[Dict[str, Any]]:
-    return dashboard.organizations.getOrganizationInventoryDevices(org_id)
+def get_inventory_devices(dashboard: meraki.DashboardAPI, org_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return call_paginated(dashboard.organizations.getOrganizationInventoryDevices, org_id, limit=limit)
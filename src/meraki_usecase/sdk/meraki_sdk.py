@@ -1,8 +1,149 @@
 from __future__ import annotations
 
 import inspect
+import time
+from typing import Any, Callable, Dict, Optional
+
 import meraki
+from meraki_usecase.cache import CacheEntry, ResponseCache, build_cache, canonical_request
 from meraki_usecase.config import Settings
+from meraki_usecase.metrics import REGISTRY, RequestEvent, RetryTracker, endpoint_template
+from meraki_usecase.paging import per_page_for, total_pages_for
+from meraki_usecase.rate_limit import get_limiter, limiter_key, retry_after_seconds
+from meraki_usecase.singleflight import FLIGHTS
+
+# hook(send, method, url, **kwargs) -> response
+SendHook = Callable[..., Any]
+
+
+def install_send_hook(dashboard: meraki.DashboardAPI, hook: SendHook) -> bool:
+    """
+    Wrap the SDK's per-attempt HTTP send so `hook` sees every request, including
+    the SDK's own retries and pagination.
+    Newer SDKs (httpx) send through RestSession._send_request,
+    older ones (requests) through RestSession._req_session.request.
+    """
+    session = getattr(dashboard, "_session", None)
+    if session is None:
+        return False
+
+    if callable(getattr(session, "_send_request", None)):
+        owner, attr = session, "_send_request"
+    elif callable(getattr(getattr(session, "_req_session", None), "request", None)):
+        owner, attr = session._req_session, "request"
+    else:
+        return False
+
+    send = getattr(owner, attr)
+
+    def hooked(method: str, url: str, **kwargs: Any) -> Any:
+        return hook(send, method, url, **kwargs)
+
+    setattr(owner, attr, hooked)
+    return True
+
+
+def call_paginated(
+    method: Callable[..., Any],
+    *args: Any,
+    per_page: int = 1000,
+    limit: Optional[int] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call a paginated SDK method with perPage/total_pages sized from `limit`, so the
+    SDK stops paging once enough items are in hand. No limit = all pages.
+    """
+    page_size = per_page_for(limit, per_page)
+    try:
+        data = method(*args, perPage=page_size, total_pages=total_pages_for(limit, page_size), **kwargs)
+    except TypeError:
+        # Some versions may not accept perPage/total_pages for this call
+        data = method(*args, **kwargs)
+
+    if limit and isinstance(data, list):
+        return data[:limit]
+    return data
+
+
+def _rate_limit_hook(settings: Settings) -> SendHook:
+    def hook(send, method: str, url: str, **kwargs: Any) -> Any:
+        limiter = get_limiter(limiter_key(url, settings.org_id), rate=settings.rate_limit)
+        limiter.acquire()
+        resp = send(method, url, **kwargs)
+        if resp.status_code == 429:
+            limiter.penalize(retry_after_seconds(resp.headers))
+        return resp
+    return hook
+
+
+def _metrics_hook() -> SendHook:
+    # Innermost hook: one event per real HTTP attempt, SDK retries included.
+    retries = RetryTracker()
+
+    def hook(send, method: str, url: str, **kwargs: Any) -> Any:
+        t = time.perf_counter()
+        try:
+            resp = send(method, url, **kwargs)
+        except Exception:
+            REGISTRY.record(RequestEvent(endpoint_template(url), method.upper(), 0, time.perf_counter() - t,
+                                         retry=retries.seen(method, url, 0)))
+            raise
+        status = resp.status_code
+        REGISTRY.record(RequestEvent(
+            endpoint_template(url), method.upper(), status, time.perf_counter() - t, len(resp.content),
+            retry=retries.seen(method, url, status),
+            retry_after_s=retry_after_seconds(resp.headers) if status == 429 else 0.0,
+        ))
+        return resp
+    return hook
+
+
+def _response_from_cache(entry: CacheEntry, method: str, url: str, use_httpx: bool) -> Any:
+    # Rebuild a response of the same flavour the SDK session returns.
+    if use_httpx:
+        import httpx
+        return httpx.Response(200, headers=entry.headers, content=entry.body, request=httpx.Request(method, url))
+
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.reason = "OK"
+    resp.url = url
+    resp.headers = CaseInsensitiveDict(entry.headers)
+    resp.encoding = "utf-8"
+    resp._content = entry.body
+    return resp
+
+
+def _cache_hook(cache: ResponseCache, use_httpx: bool) -> SendHook:
+    def hook(send, method: str, url: str, **kwargs: Any) -> Any:
+        def do_send(extra_headers: Dict[str, str]) -> Any:
+            kw = dict(kwargs)
+            if extra_headers:
+                kw["headers"] = {**(kw.get("headers") or {}), **extra_headers}
+            return send(method, url, **kw)
+
+        return cache.fetch(
+            method,
+            url,
+            kwargs.get("params"),
+            do_send,
+            lambda entry: _response_from_cache(entry, method, url, use_httpx),
+        )
+    return hook
+
+
+def _coalesce_hook(settings: Settings) -> SendHook:
+    # Identical GETs in flight at once share one response; the SDK decodes it per caller.
+    def hook(send, method: str, url: str, **kwargs: Any) -> Any:
+        if method.upper() != "GET":
+            return send(method, url, **kwargs)
+        key = ("sdk", settings.api_key, canonical_request(method, url, kwargs.get("params")))
+        return FLIGHTS.do(key, lambda: send(method, url, **kwargs))
+    return hook
+
 
 def build_dashboard(settings: Settings) -> meraki.DashboardAPI:
     base_kwargs = {
@@ -23,4 +164,21 @@ def build_dashboard(settings: Settings) -> meraki.DashboardAPI:
     elif "single_request_timeout" in params:
         base_kwargs["single_request_timeout"] = settings.timeout_s
 
-    return meraki.DashboardAPI(**base_kwargs)
+    dashboard = meraki.DashboardAPI(**base_kwargs)
+
+    # Hooks nest: the first one installed sits closest to the wire.
+    install_send_hook(dashboard, _metrics_hook())
+
+    # Same per-org buckets as MerakiRestClient, so mixed rest/sdk runs share one budget.
+    install_send_hook(dashboard, _rate_limit_hook(settings))
+
+    # Installed last so cache hits skip the limiter entirely.
+    cache = build_cache(settings)
+    if cache is not None:
+        use_httpx = callable(getattr(getattr(dashboard, "_session", None), "_send_request", None))
+        install_send_hook(dashboard, _cache_hook(cache, use_httpx))
+
+    # Outermost: a request that joins one in flight skips the cache and limiter too.
+    if settings.coalesce:
+        install_send_hook(dashboard, _coalesce_hook(settings))
+    return dashboard
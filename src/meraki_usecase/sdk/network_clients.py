@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 import inspect
 import meraki
+from meraki_usecase.paging import per_page_for
+from meraki_usecase.sdk.meraki_sdk import call_paginated
 
 
 def _call_session_get(dashboard: meraki.DashboardAPI, path: str, params: Dict[str, Any]) -> Any:
@@ -30,31 +32,31 @@ def get_network_clients(
     timespan: int = 86400,
     per_page: int = 1000,
     connection_types: Optional[List[str]] = None,  # ["Wired","Wireless"]
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     SDK first, fallback to raw GET via RestSession.
+    With `limit`, perPage/total_pages are sized so paging stops once enough clients are in hand.
     """
     # Preferred: SDK method
     method = getattr(dashboard.networks, "getNetworkClients", None)
     if callable(method):
-        kwargs: Dict[str, Any] = {"timespan": timespan, "perPage": per_page}
+        kwargs: Dict[str, Any] = {"timespan": timespan}
 
         if connection_types:
             kwargs["recentDeviceConnections"] = connection_types
 
         # SDK supports pagination helper pattern
-        try:
-            return method(network_id, total_pages="all", **kwargs)
-        except TypeError:
-            # Some versions may not accept total_pages
-            return method(network_id, **kwargs)
+        return call_paginated(method, network_id, per_page=per_page, limit=limit, **kwargs)
 
     # Fallback: raw GET
-    params: Dict[str, Any] = {"timespan": timespan, "perPage": per_page}
+    params: Dict[str, Any] = {"timespan": timespan, "perPage": per_page_for(limit, per_page)}
     if connection_types:
         params["recentDeviceConnections[]"] = connection_types
 
     path = f"/networks/{network_id}/clients"
     data = _call_session_get(dashboard, path, params)
 
-    return data if isinstance(data, list) else []
+    if not isinstance(data, list):
+        return []
+    return data[:limit] if limit else data
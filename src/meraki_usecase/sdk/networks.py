@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+import meraki
+from meraki_usecase.sdk.meraki_sdk import call_paginated
+
+def get_networks(dashboard: meraki.DashboardAPI, org_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return call_paginated(dashboard.organizations.getOrganizationNetworks, org_id, per_page=100000, limit=limit)
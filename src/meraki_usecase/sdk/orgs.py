@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict, List, Optional
 import meraki
+from meraki_usecase.sdk.meraki_sdk import call_paginated
 
-def org_name_to_id_map(dashboard: meraki.DashboardAPI) -> Dict[str, str]:
-    orgs = dashboard.organizations.getOrganizations()
+def get_organizations(dashboard: meraki.DashboardAPI, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return call_paginated(dashboard.organizations.getOrganizations, per_page=9000, limit=limit)
+
+def org_name_to_id_map(dashboard: meraki.DashboardAPI, *, limit: Optional[int] = None) -> Dict[str, str]:
+    orgs = get_organizations(dashboard, limit=limit)
     return {o["name"]: o["id"] for o in orgs}
 
-def org_id_to_name_map(dashboard: meraki.DashboardAPI) -> Dict[str, str]:
-    orgs = dashboard.organizations.getOrganizations()
+def org_id_to_name_map(dashboard: meraki.DashboardAPI, *, limit: Optional[int] = None) -> Dict[str, str]:
+    orgs = get_organizations(dashboard, limit=limit)
     return {o["id"]: o["name"] for o in orgs}
@@ -19,3 +19,21 @@ def get_switch_ports_statuses(
     if t1:
         kwargs["t1"] = t1
     return dashboard.switch.getDeviceSwitchPortsStatuses(serial, **kwargs)
+
+def get_org_switch_ports_by_switch(
+    dashboard: meraki.DashboardAPI,
+    org_id: str,
+    *,
+    network_ids: Optional[List[str]] = None,
+    serials: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    # Older SDKs lack the method; the AttributeError sends callers to the per-device fallback.
+    method = dashboard.switch.getOrganizationSwitchPortsStatusesBySwitch
+    kwargs: Dict[str, Any] = {}
+    if network_ids:
+        kwargs["networkIds"] = network_ids
+    if serials:
+        kwargs["serials"] = serials
+    data = method(org_id, total_pages="all", perPage=20, **kwargs)
+    # The SDK merges the pages' "items"; keep just the list
+    return data.get("items", []) if isinstance(data, dict) else data
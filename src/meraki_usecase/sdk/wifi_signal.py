@@ -3,11 +3,15 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 import inspect
 import meraki
+from meraki_usecase.paging import per_page_for, total_pages_for
+from meraki_usecase.sdk.meraki_sdk import call_paginated
 
 
-def _call_session_get(dashboard: meraki.DashboardAPI, path: str, params: Dict[str, Any]) -> Any:
+def _call_session_get_pages(dashboard: meraki.DashboardAPI, path: str, params: Dict[str, Any], total_pages: Any) -> Any:
     """
-    Call the Meraki SDK's internal RestSession.get() in a version-tolerant way.
+    Page through `path` with the Meraki SDK's internal RestSession, in a version-tolerant way.
+    Uses get_pages(metadata, url, params, total_pages) when the SDK has it (follows the
+    Link headers); otherwise a single get(), which only returns the first page.
     Some SDK versions use: get(url, params)
     Others use: get(metadata, url, params)
     """
@@ -15,15 +19,20 @@ def _call_session_get(dashboard: meraki.DashboardAPI, path: str, params: Dict[st
     if session is None:
         raise RuntimeError("DashboardAPI has no _session; cannot perform raw GET fallback.")
 
-    get_fn = getattr(session, "get", None)
-    if get_fn is None:
-        raise RuntimeError("DashboardAPI._session has no get() method; cannot perform raw GET fallback.")
-
     metadata = {
         "tags": ["wireless", "devices", "monitor"],
         "operation": "getOrganizationWirelessDevicesSignalQualityByClient",
     }
 
+    get_pages = getattr(session, "get_pages", None)
+    if callable(get_pages):
+        data = get_pages(metadata, path, params, total_pages)
+        return data if isinstance(data, list) else list(data or [])   # iterator mode yields items
+
+    get_fn = getattr(session, "get", None)
+    if get_fn is None:
+        raise RuntimeError("DashboardAPI._session has no get() method; cannot perform raw GET fallback.")
+
     sig = inspect.signature(get_fn)
     n_params = len(sig.parameters)
 
@@ -41,6 +50,7 @@ def get_wifi_signal_quality_by_client(
     network_id: Optional[str] = None,
     serials: Optional[List[str]] = None,
     per_page: int = 1000,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Endpoint (beta): GET /organizations/{organizationId}/wireless/devices/signalQuality/byClient
@@ -50,27 +60,33 @@ def get_wifi_signal_quality_by_client(
       - client: {id, mac}
       - network: {id, name}
     """
-    # Prefer generated SDK method when available
-    orgs = dashboard.organizations
-    method = getattr(orgs, "getOrganizationWirelessDevicesSignalQualityByClient", None)
+    # Prefer generated SDK method when available (wireless in current SDKs, organizations in some older ones)
+    method = None
+    for scope in ("wireless", "organizations"):
+        method = getattr(getattr(dashboard, scope, None), "getOrganizationWirelessDevicesSignalQualityByClient", None)
+        if callable(method):
+            break
     if callable(method):
-        kwargs: Dict[str, Any] = {"timespan": timespan, "perPage": per_page}
+        kwargs: Dict[str, Any] = {"timespan": timespan}
         if network_id:
             kwargs["networkIds"] = [network_id]   # generated method usually handles this correctly
         if serials:
             kwargs["serials"] = serials
-        return method(org_id, **kwargs)
+        return call_paginated(method, org_id, per_page=per_page, limit=limit, **kwargs)
 
     # Fallback: raw GET via SDK session.
     # IMPORTANT: pass array params using the "[]"-style keys so the API sees arrays.
     # This avoids the 400 "'networkIds' must be an array".
-    params: Dict[str, Any] = {"timespan": timespan, "perPage": per_page}
+    page_size = per_page_for(limit, per_page)
+    params: Dict[str, Any] = {"timespan": timespan, "perPage": page_size}
     if network_id:
         params["networkIds[]"] = [network_id]
     if serials:
         params["serials[]"] = serials
 
     path = f"/organizations/{org_id}/wireless/devices/signalQuality/byClient"
-    data = _call_session_get(dashboard, path, params)
+    data = _call_session_get_pages(dashboard, path, params, total_pages_for(limit, page_size))
 
-    return data if isinstance(data, list) else []
+    if not isinstance(data, list):
+        return []
+    return data[:limit] if limit else data
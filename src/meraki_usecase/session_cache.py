@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class _Slot:
+    loader: Callable[[], Any]
+    ttl_s: float
+    future: Optional["Future[Any]"] = None
+    loaded_at: Optional[float] = None   # monotonic time of the last successful load
+
+
+class SessionCache:
+    """
+    Named datasets for one interactive session. Each is loaded once and reused until
+    its TTL runs out or refresh() drops it. prefetch() starts loads on background
+    threads; get() waits for a load already in progress instead of starting another.
+    A failed load is raised to whoever asked, and retried on the next get().
+    """
+
+    def __init__(self, *, workers: int = 2) -> None:
+        self._lock = threading.Lock()
+        self._slots: Dict[str, _Slot] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="prefetch")
+
+    def register(self, name: str, loader: Callable[[], Any], ttl_s: float) -> None:
+        """Add a dataset; a name that is already registered keeps its loader and data."""
+        with self._lock:
+            self._slots.setdefault(name, _Slot(loader, ttl_s))
+
+    def _current(self, slot: _Slot) -> Optional["Future[Any]"]:
+        # Caller holds the lock. The load in progress, or a fresh result; None = (re)load.
+        f = slot.future
+        if f is None:
+            return None
+        if not f.done():
+            return f
+        if f.exception() is None and slot.loaded_at is not None and time.monotonic() - slot.loaded_at < slot.ttl_s:
+            return f
+        return None
+
+    def _run(self, slot: _Slot, f: "Future[Any]") -> None:
+        try:
+            value = slot.loader()
+        except BaseException as e:
+            f.set_exception(e)
+            return
+        with self._lock:
+            if slot.future is f:   # not dropped by refresh() meanwhile
+                slot.loaded_at = time.monotonic()
+        f.set_result(value)
+
+    def get(self, name: str) -> Any:
+        """The dataset; loaded here, on the calling thread, unless it is fresh or already loading."""
+        with self._lock:
+            slot = self._slots[name]
+            f = self._current(slot)
+            owner = f is None
+            if owner:
+                f = slot.future = Future()
+        if owner:
+            self._run(slot, f)
+        return f.result()
+
+    def prefetch(self, *names: str) -> None:
+        """Load `names` in the background if they are missing or stale."""
+        with self._lock:
+            for name in names:
+                slot = self._slots[name]
+                if self._current(slot) is None:
+                    f = slot.future = Future()
+                    self._pool.submit(self._run, slot, f)
+
+    def refresh(self, *names: str) -> None:
+        """Drop `names` (all datasets when none are given); the next get() or prefetch() reloads them."""
+        with self._lock:
+            for name in names or list(self._slots):
+                slot = self._slots.get(name)
+                if slot is not None:
+                    slot.future = None
+                    slot.loaded_at = None
+
+    def age(self, name: str) -> Optional[float]:
+        """Seconds since `name` was last loaded; None when it has not been."""
+        slot = self._slots.get(name)
+        if slot is None or slot.loaded_at is None:
+            return None
+        return time.monotonic() - slot.loaded_at
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from itertools import islice
+from math import ceil
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Quality bands as (name, lower bound); anything below the last bound is "poor".
+# Same thresholds as the wifi-signal legend.
+Bands = List[Tuple[str, int]]
+SNR_BANDS: Bands = [("excellent", 40), ("good", 25), ("fair", 20)]
+RSSI_BANDS: Bands = [("excellent", -65), ("good", -71), ("fair", -77)]
+BAND_NAMES = ["excellent", "good", "fair", "poor"]
+
+QUANTILES = (0.10, 0.50, 0.90)
+
+STATS_FIELDS = [
+    "network_id", "network_name", "ap_serial", "clients",
+    "snr_p10", "snr_p50", "snr_p90", "rssi_p10", "rssi_p50", "rssi_p90",
+    *(f"snr_{b}_pct" for b in BAND_NAMES), *(f"rssi_{b}_pct" for b in BAND_NAMES),
+]
+
+# Rows are grouped a chunk at a time, then counted with one Counter.update() per group.
+_CHUNK = 2000
+
+
+def band_of(bands: Bands, v: float) -> str:
+    for name, lower in bands:
+        if v >= lower:
+            return name
+    return "poor"
+
+
+def _db(v: Any) -> Optional[int]:
+    if v is None:
+        return None
+    try:
+        return int(round(float(v)))
+    except (TypeError, ValueError):
+        return None
+
+
+class DbHistogram:
+    """
+    Exact count of samples per whole dB. SNR/RSSI come back as integers in a range of
+    about a hundred values, so this is a complete sketch in constant memory: histograms
+    from different pages, APs or orgs merge by adding counts, and quantiles are exact.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: Optional[Dict[int, int]] = None) -> None:
+        self.counts: Counter = Counter(counts or {})
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def update(self, values: Iterable[int]) -> None:
+        self.counts.update(values)
+
+    def merge(self, other: "DbHistogram") -> "DbHistogram":
+        self.counts.update(other.counts)
+        return self
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Nearest-rank quantile (q in 0..1); None when empty."""
+        n = self.count
+        if not n:
+            return None
+        rank = max(1, ceil(q * n))
+        seen = 0
+        for v in sorted(self.counts):
+            seen += self.counts[v]
+            if seen >= rank:
+                return v
+        return max(self.counts)
+
+    def band_shares(self, bands: Bands) -> Dict[str, float]:
+        """Percentage of samples in each band (BAND_NAMES order)."""
+        n = self.count
+        out = dict.fromkeys(BAND_NAMES, 0)
+        for v, c in self.counts.items():
+            out[band_of(bands, v)] += c
+        return {k: (100.0 * c / n if n else 0.0) for k, c in out.items()}
+
+    def to_dict(self) -> Dict[str, int]:
+        return {str(v): c for v, c in sorted(self.counts.items())}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, int]) -> "DbHistogram":
+        return cls({int(v): c for v, c in d.items()})
+
+
+class _Group:
+    __slots__ = ("network_name", "clients", "snr", "rssi")
+
+    def __init__(self, network_name: str = "") -> None:
+        self.network_name = network_name
+        self.clients = 0
+        self.snr = DbHistogram()
+        self.rssi = DbHistogram()
+
+
+class SignalDistribution:
+    """
+    SNR/RSSI distributions per (network id, AP serial), built from signalQuality/byClient
+    rows without keeping them. Feed pages with add_rows(); combine runs with merge() or
+    save()/load(). Group by network only by leaving ap_serial empty.
+    """
+
+    def __init__(self) -> None:
+        self.groups: Dict[Tuple[str, str], _Group] = {}
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]], *, ap_serial: str = "") -> int:
+        """Count `rows` (streamed, a chunk at a time); returns how many were seen."""
+        it = iter(rows)
+        seen = 0
+        while True:
+            chunk = list(islice(it, _CHUNK))
+            if not chunk:
+                return seen
+            seen += len(chunk)
+            batch: Dict[Tuple[str, str], Tuple[List[int], List[int]]] = {}
+            for r in chunk:
+                net = r.get("network") or {}
+                key = (net.get("id") or "", ap_serial)
+                g = self.groups.get(key)
+                if g is None:
+                    g = self.groups[key] = _Group(net.get("name") or "")
+                g.clients += 1
+                snr, rssi = _db(r.get("snr")), _db(r.get("rssi"))
+                b = batch.get(key)
+                if b is None:
+                    b = batch[key] = ([], [])
+                if snr is not None:
+                    b[0].append(snr)
+                if rssi is not None:
+                    b[1].append(rssi)
+            for key, (snrs, rssis) in batch.items():
+                g = self.groups[key]
+                g.snr.update(snrs)
+                g.rssi.update(rssis)
+
+    def merge(self, other: "SignalDistribution") -> "SignalDistribution":
+        for key, og in other.groups.items():
+            g = self.groups.get(key)
+            if g is None:
+                g = self.groups[key] = _Group(og.network_name)
+            g.network_name = g.network_name or og.network_name
+            g.clients += og.clients
+            g.snr.merge(og.snr)
+            g.rssi.merge(og.rssi)
+        return self
+
+    def total(self) -> _Group:
+        t = _Group("(all)")
+        for g in self.groups.values():
+            t.clients += g.clients
+            t.snr.merge(g.snr)
+            t.rssi.merge(g.rssi)
+        return t
+
+    def records(self, *, with_total: bool = False) -> Iterator[Dict[str, Any]]:
+        """One STATS_FIELDS record per group (by network, then AP); optionally a final "(all)" row."""
+        for (network_id, ap_serial), g in sorted(self.groups.items(), key=lambda kv: (kv[1].network_name, kv[0])):
+            yield _record(network_id, ap_serial, g)
+        if with_total and len(self.groups) > 1:
+            yield _record("", "", self.total())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "groups": [
+                {
+                    "network_id": network_id, "ap_serial": ap_serial, "network_name": g.network_name,
+                    "clients": g.clients, "snr": g.snr.to_dict(), "rssi": g.rssi.to_dict(),
+                }
+                for (network_id, ap_serial), g in sorted(self.groups.items())
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "SignalDistribution":
+        out = cls()
+        for e in d.get("groups", []):
+            g = out.groups[(e["network_id"], e["ap_serial"])] = _Group(e.get("network_name") or "")
+            g.clients = e.get("clients", 0)
+            g.snr = DbHistogram.from_dict(e.get("snr", {}))
+            g.rssi = DbHistogram.from_dict(e.get("rssi", {}))
+        return out
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "SignalDistribution":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _record(network_id: str, ap_serial: str, g: _Group) -> Dict[str, Any]:
+    rec: Dict[str, Any] = {"network_id": network_id, "network_name": g.network_name, "ap_serial": ap_serial, "clients": g.clients}
+    for name, h, bands in (("snr", g.snr, SNR_BANDS), ("rssi", g.rssi, RSSI_BANDS)):
+        for q in QUANTILES:
+            rec[f"{name}_p{int(q * 100)}"] = h.quantile(q)
+        for band, pct in h.band_shares(bands).items():
+            rec[f"{name}_{band}_pct"] = round(pct, 1)
+    return rec
+
+
+def text_histogram(h: DbHistogram, *, step: int = 5, width: int = 40) -> List[str]:
+    """`step`-dB bins as text bars, e.g. " 25..29 | ######## 123"."""
+    if not h.count:
+        return []
+    bins: Counter = Counter()
+    for v, c in h.counts.items():
+        bins[v // step * step] += c
+    top = max(bins.values())
+    lo, hi = min(bins), max(bins)
+    return [
+        f"{b:>5}..{b + step - 1:<5}| {'#' * round(width * bins[b] / top):<{width}} {bins[b]}"
+        for b in range(lo, hi + step, step)
+    ]
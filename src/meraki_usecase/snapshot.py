@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass
+class DeviceStatusSnapshot:
+    """
+    Every device status of one org (all networks, all product types), fetched
+    once and indexed in memory so health/AP/port views don't each call
+    /organizations/{orgId}/devices/statuses with their own filters.
+    Expiry is up to the holder (the menu's SessionCache TTL).
+    """
+    org_id: str
+    devices: List[Dict[str, Any]] = field(default_factory=list)
+    by_serial: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    by_network: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    by_product_type: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_items(cls, org_id: str, items: Iterable[Dict[str, Any]]) -> "DeviceStatusSnapshot":
+        devices: List[Dict[str, Any]] = []
+        by_serial: Dict[str, Dict[str, Any]] = {}
+        by_network: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        by_product_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        for d in items:
+            devices.append(d)
+            if d.get("serial"):
+                by_serial[d["serial"]] = d
+            by_network[d.get("networkId") or ""].append(d)
+            by_product_type[d.get("productType") or ""].append(d)
+
+        return cls(
+            org_id=org_id,
+            devices=devices,
+            by_serial=by_serial,
+            by_network=dict(by_network),
+            by_product_type=dict(by_product_type),
+        )
+
+    def get(self, serial: str) -> Optional[Dict[str, Any]]:
+        return self.by_serial.get(serial)
+
+    def select(
+        self,
+        *,
+        network_id: Optional[str] = None,
+        product_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Devices matching both filters, in API order."""
+        if network_id is not None:
+            out = self.by_network.get(network_id, [])
+            if product_type is not None:
+                out = [d for d in out if d.get("productType") == product_type]
+        elif product_type is not None:
+            out = self.by_product_type.get(product_type, [])
+        else:
+            out = self.devices
+        return list(out) if limit is None else out[:max(0, limit)]
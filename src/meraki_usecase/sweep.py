@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from meraki_usecase.fanout import iter_fan_out, materialize
+
+SWEEP_PRODUCT_TYPES = ["switch", "wireless"]
+
+# Backend callables, so the same sweep runs on rest, sdk or anything else.
+ListOrgs = Callable[[], Iterable[Dict[str, Any]]]
+ListNetworks = Callable[[str], Iterable[Dict[str, Any]]]
+NetworkStatuses = Callable[[str, str], Iterable[Dict[str, Any]]]  # (org_id, network_id) -> device statuses
+
+
+@dataclass
+class NetworkHealth:
+    org_id: str
+    org_name: str
+    network_id: str
+    network_name: str
+    switches_total: int = 0
+    switches_online: int = 0
+    aps_total: int = 0
+    aps_online: int = 0
+    offline: List[str] = field(default_factory=list)   # name (or serial) of every device not online
+    error: Optional[str] = None
+
+
+@dataclass
+class SweepResult:
+    networks: List[NetworkHealth] = field(default_factory=list)
+    org_errors: Dict[str, str] = field(default_factory=dict)   # org id -> why it was skipped
+
+    @property
+    def totals(self) -> Dict[str, int]:
+        return {
+            "orgs": len({n.org_id for n in self.networks}),
+            "networks": len(self.networks),
+            "switches_total": sum(n.switches_total for n in self.networks),
+            "switches_online": sum(n.switches_online for n in self.networks),
+            "aps_total": sum(n.aps_total for n in self.networks),
+            "aps_online": sum(n.aps_online for n in self.networks),
+            "failed_networks": sum(1 for n in self.networks if n.error),
+        }
+
+
+def _summarize(nh: NetworkHealth, statuses: Iterable[Dict[str, Any]]) -> NetworkHealth:
+    for d in statuses:
+        online = d.get("status") == "online"
+        if d.get("productType") == "switch":
+            nh.switches_total += 1
+            nh.switches_online += online
+        elif d.get("productType") == "wireless":
+            nh.aps_total += 1
+            nh.aps_online += online
+        else:
+            continue
+        if not online:
+            nh.offline.append(d.get("name") or d.get("serial") or "")
+    return nh
+
+
+def _round_robin(groups: List[List[Any]]) -> List[Any]:
+    # Interleave orgs so pool workers never all queue on one org's cap while others sit idle.
+    return [x for batch in zip_longest(*groups) for x in batch if x is not None]
+
+
+def run_sweep(
+    list_orgs: ListOrgs,
+    list_networks: ListNetworks,
+    network_statuses: NetworkStatuses,
+    *,
+    workers: int = 8,
+    per_org: int = 2,
+    org_ids: Optional[List[str]] = None,
+    fan_out: Callable[..., Any] = iter_fan_out,
+    on_network: Optional[Callable[[int, int], None]] = None,
+) -> SweepResult:
+    """
+    Switch + AP health for every network of every org (or just `org_ids`).
+
+    1. list orgs, then each org's networks in parallel
+    2. one device-status request per network on a pool of `workers` threads,
+       with at most `per_org` of them in flight for any single org
+    Orgs/networks that fail are recorded and the rest of the sweep carries on.
+
+    `fan_out` is backend.fan_out, with the callables taken from backend.fan_out_api.
+    In async mode calls are coroutines and `per_org` is an asyncio.Semaphore per org,
+    held until the call completes. `on_network(done, total)` reports progress.
+    """
+    result = SweepResult()
+
+    orgs = [o for o in list_orgs() if not org_ids or o.get("id") in org_ids]
+    org_names = {o["id"]: o.get("name", "") for o in orgs}
+
+    nets_by_org: List[List[Tuple[str, Dict[str, Any]]]] = []
+    for r in fan_out(lambda o: materialize(list_networks(o["id"])), orgs, workers=workers):
+        org_id = r.item["id"]
+        if not r.ok:
+            result.org_errors[org_id] = str(r.error)
+            continue
+        nets = [
+            (org_id, n) for n in r.value
+            # Skip networks that can't contain switches or APs (no request needed)
+            if not n.get("productTypes") or set(n["productTypes"]) & set(SWEEP_PRODUCT_TYPES)
+        ]
+        nets_by_org.append(nets)
+
+    caps = {org_id: threading.BoundedSemaphore(max(1, per_org)) for org_id in org_names}
+    async_caps: Dict[str, asyncio.Semaphore] = {}
+
+    async def capped(org_id: str, call: Any) -> Any:
+        # Created here, on fan_out's loop: an asyncio.Semaphore belongs to one loop.
+        if org_id not in async_caps:
+            async_caps[org_id] = asyncio.Semaphore(max(1, per_org))
+        async with async_caps[org_id]:
+            return await call
+
+    def check(task: Tuple[str, Dict[str, Any]]) -> Any:
+        org_id, net = task
+        with caps[org_id]:
+            value = materialize(network_statuses(org_id, net.get("id", "")))
+        # A coroutine has not run yet: cap it while it is awaited, not while it is created.
+        return capped(org_id, value) if inspect.isawaitable(value) else value
+
+    total = sum(len(nets) for nets in nets_by_org)
+    for r in fan_out(check, _round_robin(nets_by_org), workers=workers):
+        org_id, net = r.item
+        nh = NetworkHealth(org_id, org_names.get(org_id, ""), net.get("id", ""), net.get("name", ""))
+        if r.ok:
+            result.networks.append(_summarize(nh, r.value))
+        else:
+            nh.error = str(r.error)
+            result.networks.append(nh)
+        if on_network is not None:
+            on_network(len(result.networks), total)
+
+    result.networks.sort(key=lambda n: (n.org_name.lower(), n.org_id, n.network_name.lower()))
+    return result
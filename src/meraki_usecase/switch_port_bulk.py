@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from meraki_usecase.fanout import iter_fan_out
+
+# backend.switch_ports_by_switch: (org_id, *, network_ids) -> switches, each with "ports"
+FetchBulk = Callable[..., Iterable[Dict[str, Any]]]
+# (serial) -> that switch's port statuses (one request)
+FetchPorts = Callable[[str], Any]
+
+# Answers that mean "this org / key / SDK has no bulk endpoint" rather than a passing error.
+_UNAVAILABLE_STATUSES = (400, 403, 404)
+
+
+def _status_of(e: BaseException) -> Optional[int]:
+    # requests / httpx errors carry the response; meraki.APIError has .status
+    resp = getattr(e, "response", None)
+    status = getattr(resp, "status_code", None) or getattr(e, "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def bulk_unavailable(e: BaseException) -> bool:
+    return isinstance(e, (AttributeError, NotImplementedError)) or _status_of(e) in _UNAVAILABLE_STATUSES
+
+
+def iter_ports_by_switch(
+    fetch_bulk: Optional[FetchBulk],
+    fetch_ports: FetchPorts,
+    org_id: str,
+    switches: List[Dict[str, Any]],
+    *,
+    network_ids: Optional[List[str]] = None,
+    workers: int = 8,
+    fan_out: Callable[..., Any] = iter_fan_out,
+    failures: Optional[list] = None,
+    notes: Optional[list] = None,
+) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Yield (switch, ports) for every switch in `switches` (dicts with serial + name).
+
+    The org-level ports/statuses/bySwitch endpoint returns up to 20 switches per page,
+    so a network (`network_ids`) or a whole org (no filter) takes a few requests
+    instead of one per switch. Switches it does not return, and all of them when the endpoint is
+    unavailable or fails, are fetched one by one with `fetch_ports` (through
+    `fan_out`, on `workers`). Pass fetch_bulk=None to skip the bulk call.
+
+    Switches whose per-device call fails go to `failures` as (serial, error). Why the
+    bulk call was not (fully) used goes to `notes`.
+    """
+    pending: Dict[str, Dict[str, Any]] = {sw["serial"]: sw for sw in switches if sw.get("serial")}
+
+    if fetch_bulk is not None and pending:
+        try:
+            for item in fetch_bulk(org_id, network_ids=network_ids):
+                sw = pending.pop(item.get("serial"), None)
+                if sw is not None:
+                    yield sw, item.get("ports") or []
+        except Exception as e:
+            if notes is not None:
+                status = _status_of(e)
+                reason = "not available" if bulk_unavailable(e) else "failed"
+                detail = f"HTTP {status}" if status else f"{type(e).__name__}: {e}"
+                notes.append(f"bulk switch ports {reason} ({detail}); {len(pending)} switch(es) fetched one by one")
+        else:
+            if pending and notes is not None:
+                notes.append(f"{len(pending)} switch(es) missing from the bulk response; fetched one by one")
+
+    for r in fan_out(lambda sw: fetch_ports(sw["serial"]), list(pending.values()), workers=workers):
+        if not r.ok:
+            if failures is not None:
+                failures.append((r.item["serial"], r.error))
+            continue
+        yield r.item, r.value or []
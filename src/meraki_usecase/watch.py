@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Polls all device statuses of the org (optionally filtered) in one paginated call.
+FetchStatuses = Callable[[], Iterable[Dict[str, Any]]]
+
+CHANGE_FIELDS = ["at", "serial", "name", "network_id", "product_type", "change", "old", "new"]
+
+
+@dataclass
+class StatusChange:
+    at: str                 # when the poll that saw it finished (UTC, ISO 8601)
+    serial: str
+    name: str
+    network_id: str
+    product_type: str
+    change: str             # "status" | "reported" (lastReportedAt jumped) | "added" | "removed"
+    old: Optional[str]
+    new: Optional[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _parse_ts(v: Optional[str]) -> Optional[float]:
+    if not v:
+        return None
+    try:
+        return datetime.fromisoformat(v.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def diff_statuses(
+    prev: Dict[str, Dict[str, Any]],
+    cur: Dict[str, Dict[str, Any]],
+    *,
+    at: str,
+    report_gap_s: float = 900.0,
+) -> List[StatusChange]:
+    """
+    Transitions between two polls, both keyed by serial. A lastReportedAt that moved
+    forward by more than `report_gap_s` means the device went quiet and came back,
+    even if the status reads the same in both polls.
+    """
+    changes: List[StatusChange] = []
+
+    def change(d: Dict[str, Any], kind: str, old: Optional[str], new: Optional[str]) -> None:
+        changes.append(StatusChange(
+            at, d.get("serial", ""), d.get("name") or "", d.get("networkId") or "", d.get("productType") or "", kind, old, new,
+        ))
+
+    for serial, d in cur.items():
+        p = prev.get(serial)
+        if p is None:
+            change(d, "added", None, d.get("status"))
+            continue
+        if p.get("status") != d.get("status"):
+            change(d, "status", p.get("status"), d.get("status"))
+            continue
+        t_old, t_new = _parse_ts(p.get("lastReportedAt")), _parse_ts(d.get("lastReportedAt"))
+        if t_old is not None and t_new is not None and t_new - t_old > report_gap_s:
+            change(d, "reported", p.get("lastReportedAt"), d.get("lastReportedAt"))
+
+    for serial, p in prev.items():
+        if serial not in cur:
+            change(p, "removed", p.get("status"), None)
+    return changes
+
+
+class AdaptiveInterval:
+    """
+    Poll interval that halves after a poll with changes, grows by `relax` after a
+    quiet one and doubles after a failed one (backoff), within [min_s, max_s].
+    """
+
+    def __init__(self, start_s: float = 60.0, *, min_s: float = 15.0, max_s: float = 300.0, relax: float = 1.5) -> None:
+        self.min_s = min_s
+        self.max_s = max_s
+        self.relax = relax
+        self.current = min(max(start_s, min_s), max_s)
+
+    def update(self, *, unstable: bool) -> float:
+        self.current = max(self.min_s, self.current / 2) if unstable else min(self.max_s, self.current * self.relax)
+        return self.current
+
+    def backoff(self) -> float:
+        # After a failed poll: slow down instead of hammering an API that is already unhappy.
+        self.current = min(self.max_s, self.current * 2)
+        return self.current
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _log(msg: str) -> None:
+    # Progress goes to stderr so stdout carries only the changes (pipe-friendly).
+    print(msg, file=sys.stderr, flush=True)
+
+
+def watch_statuses(
+    fetch: FetchStatuses,
+    interval: AdaptiveInterval,
+    *,
+    polls: int = 0,
+    report_gap_s: float = 900.0,
+    sleep: Callable[[float], None] = time.sleep,
+    log: Callable[[str], None] = _log,
+) -> Iterator[StatusChange]:
+    """
+    Poll `fetch` until `polls` polls are done (0 = forever) and yield only the
+    changes between consecutive polls. The first poll is the baseline and yields nothing.
+    """
+    prev: Optional[Dict[str, Dict[str, Any]]] = None
+    n = 0
+    while True:
+        try:
+            cur = {d["serial"]: d for d in fetch() if d.get("serial")}
+        except Exception as e:
+            wait = interval.backoff()
+            log(f"[{_now_iso()}] poll failed ({type(e).__name__}: {e}); next poll in {wait:.0f}s")
+        else:
+            at = _now_iso()
+            if prev is None:
+                wait = interval.current
+                log(f"[{at}] baseline: {len(cur)} device(s); next poll in {wait:.0f}s")
+            else:
+                changes = diff_statuses(prev, cur, at=at, report_gap_s=report_gap_s)
+                yield from changes
+                wait = interval.update(unstable=bool(changes))
+                log(f"[{at}] {len(changes)} change(s) across {len(cur)} device(s); next poll in {wait:.0f}s")
+            prev = cur
+
+        n += 1
+        if polls and n >= polls:
+            return
+        sleep(wait)
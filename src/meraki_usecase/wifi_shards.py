@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from meraki_usecase.fanout import iter_fan_out, materialize
+
+SHARD_KINDS = ["ap", "network"]
+DEFAULT_SHARD_SIZE = 20   # AP serials per request; keeps the serials[] query string short
+
+# backend.wifi_signal: (org_id, *, timespan, network_id, serials, limit) -> rows
+FetchSignal = Callable[..., Iterable[Dict[str, Any]]]
+
+
+def make_shards(kind: str, keys: List[str], size: int = DEFAULT_SHARD_SIZE) -> List[List[str]]:
+    """AP serials in chunks of `size`; networks one per shard (the filter takes a single network)."""
+    if kind == "network":
+        return [[k] for k in keys]
+    size = max(1, size)
+    return [keys[i:i + size] for i in range(0, len(keys), size)]
+
+
+def client_key(row: Dict[str, Any]) -> Tuple[str, str]:
+    # Client ids are per network; fall back to the MAC when a row has no id.
+    client = row.get("client") or {}
+    network = row.get("network") or {}
+    return (network.get("id") or "", client.get("id") or client.get("mac") or "")
+
+
+def iter_sharded_wifi_signal(
+    fetch: FetchSignal,
+    org_id: str,
+    kind: str,
+    shards: List[List[str]],
+    *,
+    timespan: int = 86400,
+    network_id: Optional[str] = None,
+    workers: int = 8,
+    limit: Optional[int] = None,
+    failures: Optional[list] = None,
+    fan_out: Callable[..., Any] = iter_fan_out,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch signalQuality/byClient once per shard (serials[] or networkIds[] filter), each
+    shard fully paginated, on a bounded worker pool. All shards share the per-org rate
+    limiter, so adding workers never exceeds MERAKI_RATE_LIMIT.
+
+    Rows are yielded in shard order. A client seen by more than one shard (it roamed
+    between APs in different shards) is yielded once, from the first shard.
+    `network_id` also scopes AP shards, as in the unsharded query.
+    Shards that fail go to `failures` as (shard label, error); the rest are still yielded.
+    `fan_out` is backend.fan_out (pass the matching backend.fan_out_api.wifi_signal as `fetch`).
+    """
+    if kind not in SHARD_KINDS:
+        raise ValueError(f"Unknown shard kind: {kind!r} (expected one of {', '.join(SHARD_KINDS)})")
+    if limit is not None and limit <= 0:
+        return
+
+    def fetch_shard(shard: List[str]) -> Any:
+        if kind == "network":
+            return materialize(fetch(org_id, timespan=timespan, network_id=shard[0], limit=None))
+        return materialize(fetch(org_id, timespan=timespan, network_id=network_id, serials=shard, limit=None))
+
+    seen = set()
+    n = 0
+    for r in fan_out(fetch_shard, shards, workers=workers):
+        if not r.ok:
+            if failures is not None:
+                failures.append((",".join(r.item), r.error))
+            continue
+        for row in r.value:
+            key = client_key(row)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield row
+            n += 1
+            if limit is not None and n >= limit:
+                return